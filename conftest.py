@@ -0,0 +1,6 @@
+import sys
+
+collect_ignore = []
+if sys.version_info < (3, 8):
+    # ProcessPort needs multiprocessing.shared_memory.
+    collect_ignore.append("pymt/component/process.py")
@@ -55,17 +55,21 @@ ValueError: AirPort
 100.0
 >>> comp.finalize()
 """
+import threading
 import warnings
 
 import six
 import yaml
 
 from ..events.chain import ChainEvent
-from ..events.manager import EventManager
+from ..events.lagged import LaggedEvent, lagged_events
+from ..events.manager import EventManager, event_access
 from ..events.port import PortEvent, PortMapEvent
 from ..events.printer import PrintEvent
 from ..framework import services
+from ..framework.bmi_bridge import BmiCap, bmi_instance
 from .grid import GridMixIn
+from .process import ProcessPort
 
 
 def clip_stop_time(stop, stop_min, stop_max):
@@ -108,6 +112,20 @@ def clip_stop_time(stop, stop_min, stop_max):
         return clip(stop, stop_min, stop_max)
 
 
+def _process_port(cls, **kwds):
+    """Create a port of class *cls* that runs in its own process.
+
+    Classes made by :func:`~pymt.framework.bmi_bridge.bmi_factory` can
+    not be pickled, as worker processes that are not forked need, so
+    the worker wraps the BMI class itself. Keywords are passed on to
+    :class:`~pymt.component.process.ProcessPort`.
+    """
+    if issubclass(cls, BmiCap) and cls.__qualname__.startswith("bmi_factory."):
+        return ProcessPort(bmi_instance, cls._cls, **kwds)
+    else:
+        return ProcessPort(cls, **kwds)
+
+
 class Component(GridMixIn):
     """Wrap a BMI object as a component.
 
@@ -128,6 +146,10 @@ class Component(GridMixIn):
         Time interval over which component will run uses ports.
     run_dir : str, optional
         Directory where the component will run.
+    max_workers : int, optional
+        If given, run the component's same-time events that do not
+        conflict with one another in a pool of this many threads (see
+        :class:`~pymt.events.manager.EventManager`).
     """
 
     def __init__(
@@ -140,6 +162,7 @@ class Component(GridMixIn):
         time_step=1.0,
         run_dir=".",
         name=None,
+        max_workers=None,
     ):
         if uses is None:
             uses = set()
@@ -155,10 +178,12 @@ class Component(GridMixIn):
         self._uses = uses
         self._provides = provides
         self._time_step = time_step
+        self._declaring = threading.local()
 
         self._events = EventManager(
             [(PortEvent(port=self._port, init_args=argv, run_dir=run_dir), time_step)]
-            + list(events)
+            + list(events),
+            max_workers=max_workers,
         )
         # self._events = EventManager([(self._port, 1.)] + events)
         # self._events = EventManager(
@@ -201,6 +226,58 @@ class Component(GridMixIn):
         except AttributeError:
             return self._port.get_end_time()
 
+    @property
+    def events(self):
+        """Events managed by the component.
+        """
+        return self._events.events
+
+    @property
+    def data_port(self):
+        """Port that holds the component's data.
+        """
+        return self._port
+
+    @property
+    def reads(self):
+        """Data read by the component's events.
+        """
+        return self._access(0)
+
+    @property
+    def writes(self):
+        """Data written by the component and its events.
+        """
+        return self._access(1)
+
+    def _access(self, index):
+        items = set([(self, None)]) if index == 1 else set()
+        if getattr(self._declaring, "value", False):
+            # Components connected to one another in both directions come
+            # back around to this one, whose own data is already included.
+            return frozenset(items)
+
+        self._declaring.value = True
+        try:
+            for event in self.events:
+                access = event_access(event)
+                if access is None:
+                    return None
+                items |= access[index]
+        finally:
+            self._declaring.value = False
+        return frozenset(items)
+
+    @property
+    def max_workers(self):
+        """Number of threads used to run same-time events, or `None`.
+        """
+        return self._events.max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers):
+        self._events.max_workers = max_workers
+
     @property
     def uses(self):
         """Names of connected *uses* ports.
@@ -213,7 +290,7 @@ class Component(GridMixIn):
         """
         return self._provides
 
-    def connect(self, uses, port, vars_to_map=()):
+    def connect(self, uses, port, vars_to_map=(), lagged=False, dtype=None):
         """Connect a *uses* port to a *provides* port.
 
         Parameters
@@ -224,15 +301,35 @@ class Component(GridMixIn):
             Port-like object to connect to.
         var_to_map : iterable, optional
             Names of variables to map.
+        lagged : bool, optional
+            If `True`, run *port* in the background, at the same time as
+            this component, and map values from the previous coupling step
+            (see :class:`~pymt.events.lagged.LaggedEvent`).
+        dtype : data-type, optional
+            Type used to pass values between the ports (`float32`, for
+            instance). By default, values keep the type of *port*.
         """
         if uses not in self.uses:
             warnings.warn("component does not use %s" % uses)
 
-        if len(vars_to_map) > 0:
+        if lagged:
+            event = LaggedEvent(
+                port,
+                self,
+                vars_to_map=vars_to_map,
+                interval=port.time_step,
+                dtype=dtype,
+            )
+        elif len(vars_to_map) > 0:
             event = ChainEvent(
                 [
                     port,
-                    PortMapEvent(src_port=port, dst_port=self, vars_to_map=vars_to_map),
+                    PortMapEvent(
+                        src_port=port,
+                        dst_port=self,
+                        vars_to_map=vars_to_map,
+                        dtype=dtype,
+                    ),
                 ]
             )
             # PortMapEvent(src_port=port, dst_port=self._port,
@@ -242,7 +339,7 @@ class Component(GridMixIn):
         # self._events.add_recurring_event(event, port._port.time_step)
         # self._events.add_recurring_event(port, port._port.time_step)
 
-    def go(self, stop=None):
+    def go(self, stop=None, max_workers=None):
         """Run a component from start to end.
 
         Run a component starting from its start time and ending at its stop
@@ -254,7 +351,13 @@ class Component(GridMixIn):
         ----------
         stop : float, optional
             Stop time, or None to run until `end_time`.
+        max_workers : int, optional
+            If given, run same-time events in a pool of this many threads
+            (see :attr:`max_workers`).
         """
+        if max_workers is not None:
+            self.max_workers = max_workers
+
         self.initialize()
 
         stop_time = clip_stop_time(stop, self.time_step, self.end_time)
@@ -280,6 +383,8 @@ class Component(GridMixIn):
         """
         if stop_time > self.end_time:
             raise ValueError("stop time is greater than end time.")
+        for event in lagged_events(self):
+            event.stop_time = stop_time
         self._events.run(stop_time)
 
     def finalize(self):
@@ -373,6 +478,11 @@ class Component(GridMixIn):
         * `time_step`
         * `run_dir`
 
+        If the optional `isolate` key is true, the component's port runs in
+        its own process (see :class:`~pymt.component.process.ProcessPort`).
+        The optional `max_workers` key sets the number of threads used to
+        run same-time events.
+
         Parameters
         ----------
         d : dict-like
@@ -384,7 +494,11 @@ class Component(GridMixIn):
             A newly-created Component instance.
         """
         # port = services.get_port(d['name'])
-        port = services.instantiate_component(d["class"], d["name"])
+        if d.get("isolate", False):
+            port = _process_port(services.get_component_class(d["class"]))
+            services.register_component_instance(d["name"], port)
+        else:
+            port = services.instantiate_component(d["class"], d["name"])
         # argv = d.get('argv', [])
         try:
             argv = d["initialize_args"]
@@ -410,6 +524,7 @@ class Component(GridMixIn):
             argv=argv,
             time_step=time_step,
             run_dir=run_dir,
+            max_workers=d.get("max_workers", None),
         )
 
     @classmethod
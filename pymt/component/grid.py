@@ -393,6 +393,14 @@ class GridMixIn(object):
     def get_value(self, *args, **kwds):
         return self._port.get_value(*args, **kwds)
 
+    def get_value_view(self, *args, **kwds):
+        try:
+            get_value_view = self._port.get_value_view
+        except AttributeError:
+            return self._port.get_value(*args, **kwds)
+        else:
+            return get_value_view(*args, **kwds)
+
     def set_value(self, name, values):
         return self._port.set_value(name, values)
 
@@ -44,10 +44,11 @@ def get_exchange_item_mapping(items):
 
 
 class Model(object):
-    def __init__(self, components, driver=None, duration=0.0):
+    def __init__(self, components, driver=None, duration=0.0, max_workers=None):
         self._components = dict(components)
         self._driver = driver
         self._duration = duration
+        self._max_workers = max_workers
 
     def __getitem__(self, name):
         return self._components[name]
@@ -85,6 +86,18 @@ class Model(object):
         """
         self._duration = duration
 
+    @property
+    def max_workers(self):
+        """Number of threads the driver uses to run same-time events.
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers):
+        """Set number of threads the driver uses to run same-time events.
+        """
+        self._max_workers = max_workers
+
     def go(self, filename=None):
         """Start the model.
         """
@@ -92,13 +105,21 @@ class Model(object):
             with open(filename, "r") as f:
                 model = yaml.safe_load(f.read())
             self._driver, self._duration = (model["driver"], model["duration"])
+            self._max_workers = model.get("max_workers", self._max_workers)
 
-        self._components[self.driver].go(self.duration)
+        self._components[self.driver].go(self.duration, max_workers=self.max_workers)
 
     @classmethod
     def load(cls, source):
         """Construct a model from a YAML-formatted string.
 
+        A connection is lagged (see :meth:`Component.connect`) if its
+        entry in a component's *connectivity* has `lagged: true`, and its
+        values are passed as a given type if the entry has a *dtype*
+        (`dtype: float32`, for instance).
+        A component runs its same-time events in a pool of threads if it
+        has a *max_workers* entry (see :meth:`Component.from_dict`).
+
         Parameters
         ----------
         source : str or file_like
@@ -145,7 +166,11 @@ class Model(object):
             for port in connectivities[name]:
                 mapping = get_exchange_item_mapping(port["exchange_items"])
                 component.connect(
-                    port["name"], components[port["connect"]], vars_to_map=mapping
+                    port["name"],
+                    components[port["connect"]],
+                    vars_to_map=mapping,
+                    lagged=port.get("lagged", False),
+                    dtype=port.get("dtype", None),
                 )
 
         return cls(components)
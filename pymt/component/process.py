@@ -0,0 +1,482 @@
+"""Run a port in its own process.
+
+A :class:`ProcessPort` creates a port (a BMI component, for instance) in a
+worker process and forwards method calls to it. Arrays that are passed in
+and out of the port through `get_value` and `set_value` are exchanged
+through shared-memory segments rather than being pickled through the pipe
+that connects the two processes.
+
+Examples
+--------
+>>> from pymt.component.process import ProcessPort
+>>> from pymt.testing.services import AirPort
+
+>>> with ProcessPort(AirPort) as port:
+...     port.initialize()
+...     port.run(10.0)
+...     port.current_time
+...     port.get_value('air__temperature')[0]
+10.0
+array([ 10.,  10.,  10.,  10.,  10.])
+"""
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import traceback
+import weakref
+
+import numpy as np
+import six
+
+from ..errors import ComponentProcessError
+from ..utils.cwd import getcwd
+
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    SharedMemory = None
+
+
+def attach_shared_memory(name):
+    """Attach to a shared-memory segment created by another process.
+
+    The segment is left for the process that created it to unlink. Before
+    Python 3.13, attaching to a segment always registers it with the
+    resource tracker. That is harmless as long as the two processes share
+    a tracker (see :func:`share_resource_tracker`); with a tracker of its
+    own, the attaching process would warn that the segment was leaked,
+    and try to unlink it again, at shutdown.
+
+    Parameters
+    ----------
+    name : str
+        Name of the segment.
+
+    Returns
+    -------
+    SharedMemory
+        The segment.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    else:
+        return SharedMemory(name=name)
+
+
+def share_resource_tracker():
+    """Start the resource tracker so that new processes share it.
+
+    A process started with *fork* only uses the tracker of its parent if
+    the tracker is already running, otherwise it starts its own.
+    """
+    if SharedMemory is not None and os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+class SharedArrays(object):
+
+    """Arrays that live in named shared-memory segments.
+
+    Segments are created, and grown, by the process that puts arrays into
+    them. Other processes attach to a segment by its name, through the
+    description returned by :meth:`put`, to get an array that uses the
+    segment as its buffer.
+    """
+
+    def __init__(self):
+        if SharedMemory is None:
+            raise RuntimeError("shared memory requires Python 3.8 or later")
+        self._owned = {}
+        self._attached = {}
+
+    def put(self, key, values):
+        """Copy an array into the segment for *key*.
+
+        Parameters
+        ----------
+        key : hashable
+            Name of the segment (a variable name, for instance).
+        values : array_like
+            Values to copy.
+
+        Returns
+        -------
+        tuple
+            Name of the segment, shape, and dtype of the array.
+        """
+        values = np.asarray(values)
+        try:
+            segment = self._owned[key]
+        except KeyError:
+            segment = None
+
+        if segment is None or segment.size < values.nbytes:
+            if segment is not None:
+                self._release(segment, unlink=True)
+            segment = SharedMemory(create=True, size=max(values.nbytes, 1))
+            self._owned[key] = segment
+
+        array = np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf)
+        array[...] = values
+
+        return segment.name, values.shape, values.dtype.str
+
+    def get(self, key, desc):
+        """Get the array described by *desc*.
+
+        Parameters
+        ----------
+        key : hashable
+            Name of the array.
+        desc : tuple
+            Name of the segment, shape, and dtype of the array, as returned
+            by :meth:`put`.
+
+        Returns
+        -------
+        ndarray
+            An array that shares memory with the segment.
+        """
+        name, shape, dtype = desc
+        try:
+            segment = self._attached[key]
+        except KeyError:
+            segment = None
+
+        if segment is None or segment.name != name:
+            if segment is not None:
+                self._release(segment)
+            segment = attach_shared_memory(name)
+            self._attached[key] = segment
+
+        return np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+
+    def close(self):
+        """Detach from all segments and unlink those that were created."""
+        for segment in self._attached.values():
+            self._release(segment)
+        for segment in self._owned.values():
+            self._release(segment, unlink=True)
+        self._attached.clear()
+        self._owned.clear()
+
+    @staticmethod
+    def _release(segment, unlink=False):
+        try:
+            segment.close()
+        except BufferError:
+            # Arrays still use the segment; its memory is freed when they
+            # are garbage collected.
+            pass
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _reply_error(conn, error):
+    tb = traceback.format_exc()
+    try:
+        payload = pickle.dumps(error)
+        pickle.loads(payload)
+    except Exception:
+        error = None
+    conn.send(("error", error, tb))
+
+
+def serve_port(conn, factory, args, kwds):
+    """Create a port and serve requests for it.
+
+    This is the main function of the worker process of a
+    :class:`ProcessPort`. Requests are read from *conn* until it is closed
+    or a request of `None` is received.
+
+    Parameters
+    ----------
+    conn : Connection
+        Connection to the parent process.
+    factory : callable
+        Function (usually a class) that creates the port.
+    args : tuple
+        Arguments passed to *factory*.
+    kwds : dict
+        Keyword arguments passed to *factory*.
+    """
+    try:
+        port = factory(*args, **kwds)
+    except Exception as error:
+        _reply_error(conn, error)
+        return
+    else:
+        conn.send(("ok", None))
+
+    arrays = SharedArrays()
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+
+            cwd, method, args, kwds = request
+            if cwd != os.getcwd():
+                os.chdir(cwd)
+
+            try:
+                if method == "__getattr__":
+                    value = getattr(port, args[0])
+                    reply = ("method",) if callable(value) else ("value", value)
+                elif method == "get_value":
+                    values = port.get_value(*args, **kwds)
+                    reply = ("array", arrays.put(args[0], values))
+                elif method == "set_value":
+                    name, desc = args
+                    reply = (
+                        "value",
+                        port.set_value(name, arrays.get(name, desc), **kwds),
+                    )
+                else:
+                    reply = ("value", getattr(port, method)(*args, **kwds))
+            except Exception as error:
+                _reply_error(conn, error)
+            else:
+                conn.send(reply)
+    finally:
+        arrays.close()
+        conn.close()
+
+
+def _shutdown_worker(process, conn, arrays, timeout):
+    if conn is not None:
+        try:
+            conn.send(None)
+        except (OSError, ValueError):
+            pass
+        conn.close()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+    arrays.close()
+
+
+class ProcessPort(object):
+
+    """A port that runs in its own process.
+
+    Method calls and attribute lookups are forwarded to a port that lives
+    in a worker process. Exceptions raised by the port are re-raised with
+    the same type (or as a :class:`~pymt.errors.ComponentProcessError`
+    if they can not be sent between processes); if the worker exits
+    unexpectedly, calls raise a :class:`~pymt.errors.ComponentProcessError`.
+
+    Values returned by `get_value` are read-only arrays that share memory
+    with the worker. They are overwritten the next time the same variable
+    is requested, so make a copy if they are to be kept. Values passed to
+    `set_value` are copied into shared memory, from which the worker reads
+    them.
+
+    The worker runs each request from the caller's working directory (as
+    given by :func:`pymt.utils.cwd.getcwd`, so that the port can be used
+    from threads that each have their own directory).
+
+    Parameters
+    ----------
+    factory : callable
+        Function (usually a class) that creates the port. Unless the worker
+        is started with the *fork* method, *factory* and its arguments must
+        be picklable.
+    *args
+        Arguments passed to *factory*.
+    start_method : str, optional
+        Method used to start the worker process (see
+        :mod:`multiprocessing`).
+    timeout : float, optional
+        Time to wait for the worker to exit when the port is closed.
+    **kwds
+        Keyword arguments passed to *factory*.
+    """
+
+    def __init__(self, factory, *args, **kwds):
+        start_method = kwds.pop("start_method", None)
+        self._timeout = kwds.pop("timeout", 5.0)
+
+        share_resource_tracker()
+
+        context = multiprocessing.get_context(start_method)
+        if context.get_start_method() != "fork":
+            try:
+                pickle.dumps((factory, args, kwds))
+            except (pickle.PicklingError, AttributeError, TypeError) as error:
+                raise ValueError(
+                    "unable to start a port with the {0} method, which needs a "
+                    "picklable factory ({1})".format(context.get_start_method(), error)
+                )
+
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=serve_port, args=(child_conn, factory, args, kwds), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+        self._lock = threading.RLock()
+        self._arrays = SharedArrays()
+        self._methods = {}
+        self._finalizer = weakref.finalize(
+            self,
+            _shutdown_worker,
+            self._process,
+            self._conn,
+            self._arrays,
+            self._timeout,
+        )
+
+        try:
+            self._receive()
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def pid(self):
+        """Process ID of the worker."""
+        return self._process.pid
+
+    @property
+    def is_alive(self):
+        """`True` if the worker process is running."""
+        return self._conn is not None and self._process.is_alive()
+
+    def close(self):
+        """Shut down the worker process."""
+        with self._lock:
+            self._conn = None
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name == "get_value_ptr":
+            raise AttributeError("pointers can not be shared between processes")
+
+        try:
+            return self._methods[name]
+        except KeyError:
+            pass
+
+        reply = self._request("__getattr__", name)
+        if reply[0] == "method":
+            self._methods[name] = RemoteMethod(self, name)
+            return self._methods[name]
+        else:
+            return reply[1]
+
+    def get_value(self, name, *args, **kwds):
+        """Get values of a variable from the port.
+
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+        out : ndarray, optional
+            Array into which to place the values.
+        *args, **kwds
+            Other arguments passed to the port's `get_value` method.
+
+        Returns
+        -------
+        ndarray
+            The values, as a read-only view of shared memory or *out*.
+        """
+        out = kwds.pop("out", None)
+        with self._lock:
+            desc = self._request("get_value", name, *args, **kwds)[1]
+            values = self._arrays.get(name, desc)
+            values.flags.writeable = False
+            if out is None:
+                return values
+            out[...] = values.reshape(out.shape)
+            return out
+
+    get_value_view = get_value
+
+    def set_value(self, name, values, **kwds):
+        """Set values of a variable of the port.
+
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+        values : array_like
+            The new values.
+        """
+        with self._lock:
+            desc = self._arrays.put(name, values)
+            return self._request("set_value", name, desc, **kwds)[1]
+
+    def call(self, method, *args, **kwds):
+        """Call a method of the port."""
+        return self._request(method, *args, **kwds)[1]
+
+    def _request(self, method, *args, **kwds):
+        with self._lock:
+            if self._conn is None:
+                raise ComponentProcessError("component process has been shut down")
+            try:
+                self._conn.send((getcwd(), method, args, kwds))
+            except (OSError, ValueError):
+                self._crashed()
+            return self._receive()
+
+    def _receive(self):
+        try:
+            reply = self._conn.recv()
+        except (EOFError, OSError):
+            self._crashed()
+
+        if reply[0] == "error":
+            (_, error, tb) = reply
+            remote = ComponentProcessError("error in component process", traceback=tb)
+            if error is None:
+                raise remote
+            else:
+                six.raise_from(error, remote)
+
+        return reply
+
+    def _crashed(self):
+        self._process.join(self._timeout)
+        exitcode = self._process.exitcode
+        self.close()
+        raise ComponentProcessError(
+            "component process exited unexpectedly (exit code {0})".format(exitcode)
+        )
+
+
+class RemoteMethod(object):
+
+    """A method of a port that runs in another process."""
+
+    def __init__(self, port, name):
+        self._port = weakref.proxy(port)
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    def __call__(self, *args, **kwds):
+        return self._port.call(self._name, *args, **kwds)
@@ -15,3 +15,21 @@ class BmiError(PymtError):
         return "Error calling BMI function: {fname} ({code})".format(
             fname=self._fname, code=self._status
         )
+
+
+class ComponentProcessError(PymtError):
+    def __init__(self, msg, traceback=None):
+        self._msg = msg
+        self._traceback = traceback
+
+    @property
+    def traceback(self):
+        return self._traceback
+
+    def __str__(self):
+        if self._traceback:
+            return "{msg}\n\n{traceback}".format(
+                msg=self._msg, traceback=self._traceback
+            )
+        else:
+            return self._msg
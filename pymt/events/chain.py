@@ -1,7 +1,29 @@
+from .manager import event_access
+
+
 class ChainEvent(object):
     def __init__(self, events):
         self._events = events
 
+    @property
+    def reads(self):
+        """Data read by the events of the chain."""
+        return self._access(0)
+
+    @property
+    def writes(self):
+        """Data written by the events of the chain."""
+        return self._access(1)
+
+    def _access(self, index):
+        items = set()
+        for event in self._events:
+            access = event_access(event)
+            if access is None:
+                return None
+            items |= access[index]
+        return frozenset(items)
+
     def initialize(self):
         for event in self._events:
             event.initialize()
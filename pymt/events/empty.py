@@ -10,6 +10,9 @@ class PassEvent(object):
     """An event that doesn't do anything.
     """
 
+    reads = frozenset()
+    writes = frozenset()
+
     def initialize(self):
         pass
 
@@ -0,0 +1,264 @@
+"""Couple ports with values from the previous coupling step.
+
+A :class:`LaggedEvent` runs a port in a background thread while the
+component that uses it carries on with its own time step. When the event
+comes around again, it waits for the port to catch up and then passes the
+port's values on. Over a coupling interval, each component therefore
+only sees values from the start of the interval, that is, from the
+previous coupling step (explicit, or lagged, coupling), and the two no
+longer have to take turns.
+
+If the port uses the component back through a lagged connection of its
+own, the values passed in that direction are also taken while both are
+stopped at the same time, so that neither reads values that are in the
+middle of being updated.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .manager import event_access, run_event
+from .port import PortMapEvent
+
+
+class ExchangeBuffer(object):
+
+    """Double-buffered values on their way to a port.
+
+    Values are set into the back buffer (with a port's `set_value`
+    interface so that it can be the destination of a
+    :class:`~pymt.events.port.PortMapEvent`), and passed on to the port
+    from the front buffer. Other attributes are those of the port.
+
+    Parameters
+    ----------
+    port : port-like
+        Port to which values are passed.
+    """
+
+    def __init__(self, port):
+        self._port = port
+        self._front = {}
+        self._back = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._port, name)
+
+    def set_value(self, name, values):
+        """Copy values into the back buffer."""
+        try:
+            buffer = self._back[name]
+        except KeyError:
+            buffer = None
+
+        values = np.asarray(values)
+        if buffer is None or buffer.shape != values.shape:
+            self._back[name] = values.copy()
+        else:
+            np.copyto(buffer, values, casting="unsafe")
+
+    def swap(self):
+        """Swap the front and back buffers."""
+        (self._front, self._back) = (self._back, self._front)
+
+    def push(self):
+        """Set the port's values from the front buffer."""
+        for (name, values) in self._front.items():
+            self._port.set_value(name, values)
+
+
+def lagged_events(port):
+    """Lagged events of a port (a component, for instance).
+
+    Parameters
+    ----------
+    port : port-like
+        A port whose *events* are searched.
+
+    Returns
+    -------
+    list of LaggedEvent
+        The port's lagged events.
+    """
+    return [
+        event for event in getattr(port, "events", ()) if isinstance(event, LaggedEvent)
+    ]
+
+
+class LaggedEvent(object):
+
+    """Run a port concurrently and pass on its values at coupling steps.
+
+    Parameters
+    ----------
+    port : port-like
+        Port that provides values (usually a component).
+    dst_port : port-like
+        Port that uses the values.
+    vars_to_map : list, optional
+        Destination and source names of the variables to pass on.
+    interval : float, optional
+        Coupling interval.
+    method : {'direct', 'nearest'}, optional
+        Method used to map values.
+    stop_time : float, optional
+        Time past which the port is never run ahead (usually the time the
+        port that uses the values is being run until).
+    dtype : data-type, optional
+        Type used to pass values (see
+        :class:`~pymt.events.port.PortMapEvent`).
+    """
+
+    def __init__(
+        self,
+        port,
+        dst_port,
+        vars_to_map=(),
+        interval=1.0,
+        method="direct",
+        stop_time=None,
+        dtype=None,
+    ):
+        self._port = port
+        self._dst = dst_port
+        self._vars_to_map = list(vars_to_map)
+        self._interval = interval
+        self._stop_time = stop_time
+
+        self._buffer = ExchangeBuffer(dst_port)
+        self._mapper = PortMapEvent(
+            src_port=port,
+            dst_port=self._buffer,
+            vars_to_map=self._vars_to_map,
+            method=method,
+            dtype=dtype,
+        )
+
+        self._executor = None
+        self._future = None
+        self._started = False
+        self._driven = False
+        self._run_to = None
+
+    @property
+    def port(self):
+        """Port that provides values."""
+        return self._port
+
+    @property
+    def dst_port(self):
+        """Port that uses the values."""
+        return self._dst
+
+    @property
+    def stop_time(self):
+        """Time past which the port is never run ahead, or `None`."""
+        return self._stop_time
+
+    @stop_time.setter
+    def stop_time(self, stop_time):
+        self._stop_time = stop_time
+
+    @property
+    def reads(self):
+        """Data read by the event."""
+        return frozenset()
+
+    @property
+    def writes(self):
+        """Data written by the event (including all of the running port's)."""
+        access = event_access(self._port)
+        items = set([(self._dst, dst_name) for (dst_name, _) in self._vars_to_map])
+        if access is None:
+            items.add((self._port, None))
+        else:
+            items |= access[1]
+        return frozenset(items)
+
+    def initialize(self):
+        """Initialize the port and the data mappers."""
+        self._port.initialize()
+        self._mapper.initialize()
+
+    def snapshot(self):
+        """Take the port's current values and make them the next to pass on."""
+        self._mapper.run(None)
+        self._buffer.swap()
+
+    def run(self, time):
+        """Pass on values and start running the port to its next time.
+
+        Wait for the port to finish its last run (if it has not been run
+        to *time*, run it there first), pass its values on and then start it running, in the
+        background, for another interval (but not past :attr:`stop_time`
+        or the port's end time).
+
+        If the port is run by a lagged event of the port that uses it,
+        just pass on the values that event took.
+
+        Parameters
+        ----------
+        time : float
+            Current coupling time.
+        """
+        if self._driven:
+            self._buffer.push()
+            return
+
+        if self._started:
+            self.wait()
+        else:
+            self._drive_reverse_events()
+            self._started = True
+
+        if self._run_to is None or self._run_to < time:
+            # The port was not run ahead this far (the first time, or if it
+            # was held back by the stop time), so catch it up here.
+            run_event(self._port, time)
+            self._run_to = time
+
+        self.snapshot()
+        self._buffer.push()
+        self._drive_reverse_events()
+
+        stop_time = time + self._interval
+        if self._stop_time is not None:
+            stop_time = min(stop_time, self._stop_time)
+        try:
+            stop_time = min(stop_time, self._port.end_time)
+        except AttributeError:
+            pass
+
+        if stop_time > time:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._future = self._executor.submit(run_event, self._port, stop_time)
+            self._run_to = stop_time
+
+    def _drive_reverse_events(self):
+        """Take values for lagged events of the port that use our destination."""
+        for event in lagged_events(self._port):
+            if event.port is self._dst:
+                event._driven = True
+                event.snapshot()
+
+    def wait(self):
+        """Wait for the port to finish running.
+
+        Any exception raised while the port was running is raised here.
+        """
+        if self._future is not None:
+            (future, self._future) = (self._future, None)
+            future.result()
+
+    def finalize(self):
+        """Wait for the port and finalize it."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            self._port.finalize()
@@ -45,9 +45,38 @@ hello from initialize
 hello!
 hello!
 hello from finalize
+
+Events that happen at the same time can be run concurrently, in a pool
+of threads, by giving the manager a number of workers. Events declare the
+data they use through *reads* and *writes* attributes, which are sets of
+*(port, var_name)* pairs (a *var_name* of `None` stands for all of a port's
+variables). Same-time events are run in waves such that an event never
+runs at the same time as an earlier event whose data it reads or writes.
+Events that do not declare their data run on their own. Events that
+change into different run directories (with :func:`pymt.utils.cwd.cd`)
+take turns doing so, as the working directory is shared by all threads.
+
+>>> class Count(object):
+...     reads, writes = frozenset(), frozenset()
+...     def __init__(self):
+...         self.count = 0
+...     def initialize(self):
+...         pass
+...     def run(self, time):
+...         self.count += 1
+...     def finalize(self):
+...         pass
+>>> (first, second) = (Count(), Count())
+>>> with EventManager([(first, 1.), (second, 1.)], max_workers=2) as mngr:
+...     mngr.run(4.)
+>>> (first.count, second.count)
+(4, 4)
 """
 from __future__ import print_function
 
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
 from six import StringIO
 from six.moves.configparser import ConfigParser
 
@@ -55,12 +84,177 @@ from ..timeline import Timeline
 from ..utils.prefix import names_with_prefix
 
 
+def event_access(event):
+    """Data read and written by an event.
+
+    Parameters
+    ----------
+    event : event-like
+        An event.
+
+    Returns
+    -------
+    tuple of frozenset or None
+        The *(port, var_name)* pairs that the event reads and writes, or
+        `None` if the event does not declare them.
+
+    Examples
+    --------
+    >>> from pymt.events.manager import event_access
+    >>> from pymt.events.empty import PassEvent
+    >>> event_access(PassEvent())
+    (frozenset(), frozenset())
+    >>> event_access(object()) is None
+    True
+    """
+    (reads, writes) = (getattr(event, "reads", None), getattr(event, "writes", None))
+    if reads is None or writes is None:
+        return None
+    return (frozenset(reads), frozenset(writes))
+
+
+def data_port(port):
+    """Port that holds the data of a port-like object.
+
+    Objects that pass their data through to another port (a component
+    passes it to the port it wraps, for instance) name that port with a
+    *data_port* attribute.
+
+    Parameters
+    ----------
+    port : port-like
+        A port.
+
+    Returns
+    -------
+    port-like
+        The port that holds the data.
+
+    Examples
+    --------
+    >>> from pymt.events.manager import data_port
+    >>> class Wrapper(object):
+    ...     def __init__(self, port):
+    ...         self.data_port = port
+    >>> port = object()
+    >>> data_port(Wrapper(Wrapper(port))) is port
+    True
+    >>> data_port(port) is port
+    True
+    """
+    # Look the attribute up statically so that ports that forward unknown
+    # attributes (to another process, for instance) are not asked for it.
+    while inspect.getattr_static(port, "data_port", None) is not None:
+        port = port.data_port
+    return port
+
+
+def _overlap(items, others):
+    for (port, name) in items:
+        for (other_port, other_name) in others:
+            if data_port(port) == data_port(other_port) and (
+                name is None or other_name is None or name == other_name
+            ):
+                return True
+    return False
+
+
+def events_conflict(access, other):
+    """Check if two events can not run at the same time.
+
+    Parameters
+    ----------
+    access, other : tuple of frozenset or None
+        Reads and writes of the two events (see :func:`event_access`).
+
+    Returns
+    -------
+    bool
+        `True` if either event writes data that the other uses.
+
+    Examples
+    --------
+    >>> from pymt.events.manager import events_conflict
+    >>> reader = (frozenset([("air", "temperature")]), frozenset())
+    >>> writer = (frozenset(), frozenset([("air", None)]))
+    >>> events_conflict(reader, reader)
+    False
+    >>> events_conflict(reader, writer)
+    True
+    >>> events_conflict(reader, None)
+    True
+    """
+    if access is None or other is None:
+        return True
+    ((reads, writes), (other_reads, other_writes)) = (access, other)
+    return _overlap(writes, other_reads | other_writes) or _overlap(other_writes, reads)
+
+
+def schedule_waves(events):
+    """Group events into waves of events that can run at the same time.
+
+    Each event is placed in the wave after the last wave that contains an
+    event, that came before it, with which it conflicts.
+
+    Parameters
+    ----------
+    events : iterable of event-like
+        Events, in the order in which they would run one after another.
+
+    Returns
+    -------
+    list of list
+        Waves of events.
+
+    Examples
+    --------
+    >>> from pymt.events.manager import schedule_waves
+    >>> class Event(object):
+    ...     def __init__(self, name, reads=(), writes=()):
+    ...         (self.name, self.reads, self.writes) = (name, reads, writes)
+    ...     def __repr__(self):
+    ...         return self.name
+    >>> schedule_waves([
+    ...     Event("a", writes=[("air", None)]),
+    ...     Event("b", writes=[("earth", None)]),
+    ...     Event("c", reads=[("air", "temperature")], writes=[("earth", "temp")]),
+    ...     Event("d", reads=[("air", "wind")]),
+    ... ])
+    [[a, b], [c, d]]
+    """
+    (waves, scheduled) = ([], [])
+    for event in events:
+        access = event_access(event)
+        wave = 0
+        for (other, other_wave) in scheduled:
+            if events_conflict(access, other):
+                wave = max(wave, other_wave + 1)
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(event)
+        scheduled.append((access, wave))
+    return waves
+
+
+def run_event(event, time):
+    """Run an event, or update it if it has no run method."""
+    try:
+        event.run
+    except AttributeError:
+        event.update(time)
+    else:
+        event.run(time)
+
+
 class EventManager(object):
     """
     Parameters
     ----------
     events : dict-like
         Events as event-object/repeat interval pairs.
+    max_workers : int, optional
+        If given, run same-time events that do not conflict with one
+        another concurrently in a pool of this many threads.
 
     See Also
     --------
@@ -90,12 +284,19 @@ class EventManager(object):
     2
     """
 
-    def __init__(self, *args):
+    def __init__(self, *args, **kwds):
         if len(args) > 1:
             raise TypeError(
                 "__init__() takes 1 or 2 arguments (%d given)" % (len(args) + 1,)
             )
 
+        self._max_workers = kwds.pop("max_workers", None)
+        self._executor = None
+        if kwds:
+            raise TypeError(
+                "__init__() got an unexpected keyword argument '%s'" % (list(kwds)[0],)
+            )
+
         self._timeline = Timeline(*args)
         self._initializing = False
         self._initialized = False
@@ -137,14 +338,42 @@ class EventManager(object):
         self.initialize()
         if not self._running:
             self._running = True
-            for event in self._timeline.iter_until(stop_time):
-                try:
-                    event.run
-                except AttributeError:
-                    event.update(self._timeline.time)
+            try:
+                if self._max_workers:
+                    self._run_concurrently(stop_time)
                 else:
-                    event.run(self._timeline.time)
-            self._running = False
+                    for event in self._timeline.iter_until(stop_time):
+                        run_event(event, self._timeline.time)
+            finally:
+                self._running = False
+
+    def _run_concurrently(self, stop_time):
+        """Run events until some time, running same-time events in waves."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        batch = []
+        for event in self._timeline.iter_until(stop_time):
+            batch.append(event)
+
+            time = self._timeline.time
+            try:
+                batch_is_done = self._timeline.time_of_next_event != time
+            except IndexError:
+                batch_is_done = True
+
+            if batch_is_done:
+                for wave in schedule_waves(batch):
+                    self._run_wave(wave, time)
+                batch = []
+
+    def _run_wave(self, wave, time):
+        if len(wave) == 1:
+            run_event(wave[0], time)
+        else:
+            futures = [self._executor.submit(run_event, event, time) for event in wave]
+            for future in futures:
+                future.result()
 
     def finalize(self):
         """Finalize managed events.
@@ -161,6 +390,10 @@ class EventManager(object):
                     event.finalize()
             self._initialized = False
 
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def add_recurring_event(self, event, interval):
         """Add a managed event.
 
@@ -183,6 +416,23 @@ class EventManager(object):
         """
         return self._timeline.time
 
+    @property
+    def events(self):
+        """Managed events, in the order they were added."""
+        return [event for (event, _) in self._order]
+
+    @property
+    def max_workers(self):
+        """Number of threads used to run same-time events, or `None`."""
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers):
+        if max_workers != self._max_workers and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._max_workers = max_workers
+
     @classmethod
     def from_string(cls, source, prefix=""):
         """Create an `EventManager` from a string.
@@ -5,13 +5,16 @@ from __future__ import print_function
 import os
 import sys
 
+import numpy as np
 import six
 import yaml
-from scripting import cd
 
 from ..component.grid import GridMixIn
+from ..component.process import ProcessPort
 from ..framework import services
+from ..framework.units import UnitConverter, get_converter
 from ..mappers import NearestVal
+from ..utils.cwd import cd, working_dir
 
 
 class PortEvent(GridMixIn):
@@ -34,24 +37,44 @@ class PortEvent(GridMixIn):
             self._port = kwds["port"]
 
         self._init_args = kwds.get("init_args", [])
-        self._run_dir = kwds.get("run_dir", ".")
+        self._run_dir = os.path.abspath(kwds.get("run_dir", "."))
 
         if isinstance(self._init_args, six.string_types):
             self._init_args = [self._init_args]
 
-        self._status_fp = open(
-            os.path.abspath(os.path.join(self._run_dir, "_time.txt")), "w"
-        )
+        self._status_fp = open(os.path.join(self._run_dir, "_time.txt"), "w")
 
         GridMixIn.__init__(self)
 
+    @property
+    def reads(self):
+        """Data read by the event."""
+        return frozenset()
+
+    @property
+    def writes(self):
+        """Data written by the event (all of the port's variables)."""
+        return frozenset([(self._port, None)])
+
+    def _in_run_dir(self):
+        """Context in which to call the port from its run directory.
+
+        A port that runs in its own process is sent the directory with
+        each call, so the working directory of this process, which other
+        threads may be using, is left alone.
+        """
+        if isinstance(self._port, ProcessPort):
+            return working_dir(self._run_dir)
+        else:
+            return cd(self._run_dir)
+
     def initialize(self):
         """Initialize the event.
 
         Run the underlying port's initialization method in its *run_dir*. The event's *init_args* are passed to
         the initialize method as arguments.
         """
-        with cd(self._run_dir):
+        with self._in_run_dir():
             status = {"name": self.name, "time": 0.0, "status": "initializing"}
             self._status_fp.write(yaml.dump(status))
             try:
@@ -69,7 +92,7 @@ class PortEvent(GridMixIn):
         time : float
             Time to run the event to.
         """
-        with cd(self._run_dir):
+        with self._in_run_dir():
             status = {"name": self.name, "time": time, "status": "running"}
             print(yaml.dump(status), file=self._status_fp)
             self._status_fp.flush()
@@ -83,7 +106,7 @@ class PortEvent(GridMixIn):
             sys.stderr.flush()
 
     def update(self, time):
-        with cd(self._run_dir):
+        with self._in_run_dir():
             self._port.update_until(time)
 
     def finalize(self):
@@ -91,7 +114,7 @@ class PortEvent(GridMixIn):
 
         Run the `finalize` method of the underlying port.
         """
-        with cd(self._run_dir):
+        with self._in_run_dir():
             status = {"name": self.name, "time": None, "status": "finishing"}
             self._status_fp.write(yaml.dump(status))
             self._port.finalize()
@@ -100,6 +123,109 @@ class PortEvent(GridMixIn):
         self._status_fp.close()
 
 
+class ExchangePlan(object):
+    """Transfer of a variable from one port to another.
+
+    Everything about the transfer that does not change from one step to
+    the next (units and their conversion, the data mapper, and buffers)
+    is worked out once, so that :meth:`run` only has to move values.
+    Buffers are reused from one step to the next so, as with BMI's
+    *set_value*, the destination port must copy the values it is given.
+
+    Parameters
+    ----------
+    src_port : port-like
+        Port that is the data source.
+    dst_port : port-like
+        Port that is the destination.
+    dst_name : str
+        Name of the destination variable.
+    src_name : str
+        Name of the source variable.
+    mapper : mapper, optional
+        Initialized data mapper, or `None` to transfer values directly.
+    dtype : data-type, optional
+        Type used to transport values (`float32`, for instance). By
+        default, values keep the type given by the source.
+    """
+
+    def __init__(self, src_port, dst_port, dst_name, src_name, mapper=None, dtype=None):
+        self._src = src_port
+        self._dst = dst_port
+        self._dst_name = dst_name
+        self._src_name = src_name
+        self._mapper = mapper
+        self._dtype = None if dtype is None else np.dtype(dtype)
+
+        self._units = dst_port.get_var_units(dst_name)
+        self._convert = self._compile_converter()
+
+        try:
+            self._get_value = src_port.get_value_view
+        except AttributeError:
+            self._get_value = src_port.get_value
+
+        self._src_buffer = None
+        self._dst_buffer = None
+
+    def _compile_converter(self):
+        """Get the units conversion, or `None` to leave it to the source.
+
+        Units that are not convertible here are left for the source's
+        *get_value* to convert (or to report as not convertible).
+        """
+        src_units = self._src.get_var_units(self._src_name)
+        if src_units == self._units:
+            return UnitConverter()
+        try:
+            return get_converter(src_units, self._units)
+        except ValueError:
+            return None
+
+    @property
+    def units(self):
+        """Units of the destination variable."""
+        return self._units
+
+    def run(self):
+        """Transfer values from the source to the destination."""
+        if self._convert is None:
+            values = self._get_value(self._src_name, units=self._units)
+        else:
+            values = self._get_value(self._src_name)
+        values = np.asarray(values)
+
+        if (self._convert is not None and not self._convert.is_identity) or (
+            self._dtype is not None and values.dtype != self._dtype
+        ):
+            values = self._transport(values)
+
+        if self._mapper is not None:
+            if self._dst_buffer is not None:
+                # Destinations without good source values are not mapped,
+                # so clear what the last step left in them.
+                self._dst_buffer.fill(0)
+            values = self._mapper.run(values, dst_vals=self._dst_buffer)
+            self._dst_buffer = values
+
+        self._dst.set_value(self._dst_name, values)
+
+    def _transport(self, values):
+        """Copy values into the transport buffer and convert their units."""
+        dtype = values.dtype if self._dtype is None else self._dtype
+        if (
+            self._src_buffer is None
+            or self._src_buffer.shape != values.shape
+            or self._src_buffer.dtype != dtype
+        ):
+            self._src_buffer = np.empty(values.shape, dtype=dtype)
+
+        np.copyto(self._src_buffer, values, casting="unsafe")
+        if self._convert is not None:
+            self._convert(self._src_buffer, inplace=True)
+        return self._src_buffer
+
+
 class PortMapEvent(object):
     """An event that maps values between ports.
 
@@ -113,6 +239,8 @@ class PortMapEvent(object):
         Names of variable to map.
     method : {'direct', 'nearest'}, optional
         Method used to map values.
+    dtype : data-type, optional
+        Type used to transport values between the ports.
     """
 
     def __init__(self, *args, **kwds):
@@ -126,6 +254,8 @@ class PortMapEvent(object):
             self._dst = kwds["dst_port"]
         self._vars_to_map = kwds.get("vars_to_map", [])
         self._method = kwds.get("method", "direct")
+        self._dtype = kwds.get("dtype", None)
+        self._plans = None
 
         if self._method == "direct":
             self._mapper = None
@@ -134,24 +264,40 @@ class PortMapEvent(object):
         else:
             raise ValueError("method %s not understood" % self._method)
 
+    @property
+    def reads(self):
+        """Source port variables read by the event."""
+        return frozenset([(self._src, src_name) for (_, src_name) in self._vars_to_map])
+
+    @property
+    def writes(self):
+        """Destination port variables written by the event."""
+        return frozenset([(self._dst, dst_name) for (dst_name, _) in self._vars_to_map])
+
     def initialize(self):
-        """Initialize the data mappers."""
+        """Initialize the data mappers and build the exchange plans."""
         if self._mapper is not None:
             self._mapper.initialize(self._dst, self._src, vars=self._vars_to_map)
 
-    def run(self, stop_time):
-        """Map values from one port to another."""
-        for (dst_name, src_name) in self._vars_to_map:
-            src_values = self._src.get_value(
-                src_name, units=self._dst.get_var_units(dst_name)
+        self._plans = [
+            ExchangePlan(
+                self._src,
+                self._dst,
+                dst_name,
+                src_name,
+                mapper=self._mapper,
+                dtype=self._dtype,
             )
+            for (dst_name, src_name) in self._vars_to_map
+        ]
 
-            if self._mapper is None:
-                dst_values = src_values
-            else:
-                dst_values = self._mapper.run(src_values)
+    def run(self, stop_time):
+        """Map values from one port to another."""
+        if self._plans is None:
+            self.initialize()
 
-            self._dst.set_value(dst_name, dst_values)
+        for plan in self._plans:
+            plan.run()
 
     def finalize(self):
         pass
@@ -1,23 +1,187 @@
-from scripting import cd
+import os
+import threading
 
+import numpy as np
+import six
+from six.moves.queue import Queue
+
+from ..framework import services
 from ..portprinter.port_printer import PortPrinter
+from ..portprinter.utils import get_port_value
+from ..utils.cwd import cd
+
+# netCDF (through HDF5) is not safe to use from more than one thread at a
+# time, so printers only write while holding this lock.
+_WRITE_LOCK = threading.Lock()
+
+
+class BackgroundWriter(object):
+
+    """Write values with a port printer from a background thread.
+
+    Values are copied into one of a pool of buffers and queued. A writer
+    thread takes them off the queue and writes them with the printer.
+    When all of the buffers are in use, :meth:`put` blocks until the
+    writer has caught up.
+
+    An exception raised while writing values is raised by the next call to
+    :meth:`put`, :meth:`flush`, or :meth:`close`.
+
+    Parameters
+    ----------
+    printer : PortPrinter
+        An open port printer.
+    queue_size : int, optional
+        Number of values that can be waiting to be written.
+    """
+
+    def __init__(self, printer, queue_size=2):
+        if queue_size < 1:
+            raise ValueError("queue size must be at least 1")
+
+        self._printer = printer
+        self._queue = Queue(maxsize=queue_size)
+        self._free = Queue()
+        for _ in range(queue_size + 1):
+            self._free.put(None)
+        self._error = None
+
+        self._thread = threading.Thread(target=self._drain)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _drain(self):
+        while True:
+            values = self._queue.get()
+            try:
+                if values is None:
+                    return
+                if self._error is None:
+                    with _WRITE_LOCK:
+                        self._printer.write(values)
+            except Exception as error:
+                self._error = error
+            finally:
+                if values is not None:
+                    self._free.put(values)
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            (error, self._error) = (self._error, None)
+            raise error
+
+    def put(self, values):
+        """Queue a copy of values to be written.
+
+        Parameters
+        ----------
+        values : array_like
+            Values to write.
+        """
+        self._raise_error()
+
+        values = np.asarray(values)
+        buffer = self._free.get()
+        if (
+            buffer is None
+            or buffer.shape != values.shape
+            or buffer.dtype != values.dtype
+        ):
+            buffer = np.empty_like(values)
+        np.copyto(buffer, values)
+
+        self._queue.put(buffer)
+
+    def flush(self):
+        """Wait for all queued values to be written."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Write any queued values and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
 
 
 class PrintEvent(object):
+
+    """Print values of a port variable to a file.
+
+    Parameters
+    ----------
+    port : str or port-like
+        Port (or name of the port) that provides the values.
+    name : str
+        Name of the variable to print.
+    format : str
+        Format of the file.
+    run_dir : str, optional
+        Path to directory to print into.
+    background : bool, optional
+        Write files from a background thread so that a port can carry on
+        while its last values are being written.
+    queue_size : int, optional
+        Number of values that can be waiting to be written by the
+        background thread before the event waits for it to catch up.
+    """
+
     def __init__(self, *args, **kwds):
         # self._printer = PortPrinter.from_dict(kwds)
         self._run_dir = kwds.pop("run_dir", ".")
+        self._background = kwds.pop("background", False)
+        self._queue_size = int(kwds.pop("queue_size", 2))
         self._kwds = kwds
+        self._writer = None
+
+    @property
+    def reads(self):
+        """Port variable read by the event."""
+        port = self._kwds["port"]
+        if isinstance(port, six.string_types):
+            port = services.get_component_instance(port)
+        return frozenset([(port, self._kwds["name"])])
+
+    @property
+    def writes(self):
+        """Data written by the event (none, other than its file)."""
+        return frozenset()
 
     def initialize(self, *args):
         with cd(self._run_dir):
+            # Values are written (by this thread or a writer thread) without
+            # changing into *run_dir*.
+            self._kwds["filename"] = os.path.abspath(
+                self._kwds.get("filename", self._kwds["name"])
+            )
             self._printer = PortPrinter.from_dict(self._kwds)
             self._printer.open()
+        if self._background:
+            self._writer = BackgroundWriter(self._printer, queue_size=self._queue_size)
 
     def run(self, time):
-        with cd(self._run_dir):
-            self._printer.write()
+        if self._writer is None:
+            with _WRITE_LOCK:
+                self._printer.write()
+            return
+
+        values = get_port_value(self._printer.port, self._printer.var_name)
+        if self._printer.mesh_size_has_changed(values):
+            # The port's mesh is read from this thread, so write these
+            # values here once everything before them has been written.
+            self._writer.flush()
+            with _WRITE_LOCK:
+                self._printer.write()
+        else:
+            self._writer.put(values)
 
     def finalize(self):
-        with cd(self._run_dir):
-            self._printer.close()
+        try:
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            self._writer = None
+            with cd(self._run_dir):
+                self._printer.close()
@@ -4,26 +4,27 @@ from __future__ import print_function
 import ctypes
 import json
 import os
+import warnings
 from pprint import pformat
 
 import numpy as np
 import yaml
-from cfunits import Units
 from deprecated import deprecated
-from scripting.contexts import cd
 
 from ..errors import BmiError
+from ..utils.cwd import cd
 from .bmi_docstring import bmi_docstring
 from .bmi_mapper import GridMapperMixIn
 from .bmi_plot import quick_plot
 from .bmi_setup import SetupMixIn
 from .bmi_timeinterp import BmiTimeInterpolator
-from .bmi_ugrid import dataset_from_bmi_grid
+from .bmi_ugrid import BmiGridDatasets
+from .units import get_converter, units_are_equivalent
 
 
 def transform_math_to_azimuth(angle, units):
     angle *= -1.0
-    if units == Units("rad"):
+    if units_are_equivalent(units, "rad"):
         angle += np.pi * 0.5
     else:
         angle += 90.0
@@ -31,7 +32,7 @@ def transform_math_to_azimuth(angle, units):
 
 def transform_azimuth_to_math(angle, units):
     angle *= -1.0
-    if units == Units("rad"):
+    if units_are_equivalent(units, "rad"):
         angle -= np.pi * 0.5
     else:
         angle -= 90.0
@@ -72,7 +73,20 @@ class DataValues(object):
 
     @property
     def data(self):
-        return self.values()
+        """A copy of the values of the variable."""
+        return self.values(copy=True)
+
+    @property
+    def view(self):
+        """Read-only values of the variable, without copying if possible.
+
+        The values are flattened, as for :attr:`data`, but may be a live
+        view of the model's memory (see *get_value_view*).
+        """
+        if "out" in self.intent:
+            return self._bmi.get_value_view(self.name)
+        else:
+            raise ValueError("not an output var")
 
     def values(self, **kwds):
         if "out" in self.intent:
@@ -165,6 +179,11 @@ class _BmiCap(object):
         self._initialized = False
         self._grid = dict()
         self._var = dict()
+        self._buffers = dict()
+        self._reuse_buffers = False
+        self._snapshots = dict()
+        self._snapshot_time = None
+        self._metadata = None
         self._time_units = None
         self._initdir = None
         super(_BmiCap, self).__init__()
@@ -189,6 +208,110 @@ class _BmiCap(object):
     def initdir(self):
         return self._initdir
 
+    @property
+    def reuse_buffers(self):
+        """Return output values in buffers that are reused between calls.
+
+        When set, an output buffer is allocated once for each output
+        variable (at initialization, or immediately if the component is
+        already initialized) and *get_value* fills and returns a read-only
+        view of that buffer whenever *out* is not given. The returned
+        values are overwritten by the next call to *get_value* for that
+        variable so callers that keep values must ask for a copy (with
+        ``copy=True``).
+        """
+        return self._reuse_buffers
+
+    @reuse_buffers.setter
+    def reuse_buffers(self, reuse):
+        self._reuse_buffers = bool(reuse)
+        self._buffers.clear()
+        if self._reuse_buffers and self._initialized:
+            self._allocate_buffers()
+
+    def _allocate_buffers(self):
+        for name in self.output_var_names:
+            try:
+                self._buffers[name] = self._empty_value(name)
+            except ValueError:
+                pass
+
+    def _empty_value(self, name):
+        grid = self.get_var_grid(name)
+        dtype = self.get_var_type(name)
+        if dtype == "":
+            raise ValueError("{name} not understood".format(name=name))
+        loc = self.get_var_grid_loc(name)
+        return np.empty(self.get_grid_dim(grid, loc), dtype=dtype)
+
+    def _cached(self, key, func, *args):
+        """Look up metadata in the snapshot, querying the model if needed."""
+        if self._metadata is None:
+            return func(*args)
+        try:
+            return self._metadata[key]
+        except KeyError:
+            self._metadata[key] = func(*args)
+            return self._metadata[key]
+
+    def _get_grid_array(self, func, grid, size, dtype):
+        out = np.empty(size, dtype=dtype)
+        func(grid, out)
+        return out
+
+    def _cached_grid_array(self, key, grid, func, size, dtype, out=None):
+        array = self._cached((key, grid), self._get_grid_array, func, grid, size, dtype)
+        if out is None:
+            return array.copy()
+        else:
+            out[...] = array
+            return out
+
+    def refresh(self):
+        """Take a new snapshot of the model's metadata.
+
+        After initialization, metadata of the model's variables and
+        grids (names, units, types, grid shapes, connectivity, etc.) are
+        stored so that they are not requested from the model each time
+        they are used. Call this method if a model changes its grids or
+        variables while running.
+
+        Metadata the model does not provide (its BMI raises a
+        :class:`~pymt.errors.BmiError`, raises ``NotImplementedError``, or
+        does not have the method) is left out of the snapshot. Cached
+        regridders that map to or from the model are discarded.
+        """
+        self._metadata = dict()
+
+        for name in set(self.input_var_names + self.output_var_names):
+            self.get_var_intent(name)
+            for get_metadata in (
+                self.get_var_grid,
+                self.get_var_type,
+                self.get_var_units,
+                self.get_var_grid_loc,
+                self.get_var_itemsize,
+                self.get_var_nbytes,
+            ):
+                try:
+                    get_metadata(name)
+                except (BmiError, NotImplementedError, AttributeError):
+                    pass
+
+        self._grid = BmiGridDatasets(self, self._grid_ids())
+
+        try:
+            self.invalidate_regridders
+        except AttributeError:
+            pass
+        else:
+            self.invalidate_regridders()
+
+        self._snapshots.clear()
+        self._buffers.clear()
+        if self.reuse_buffers:
+            self._allocate_buffers()
+
     def _grid_ids(self):
         grids = set()
         for var in set(self.input_var_names + self.output_var_names):
@@ -213,57 +336,85 @@ class _BmiCap(object):
             self.bmi.initialize(fname or "")
             self._initialized = True
 
-        for grid_id in self._grid_ids():
-            self._grid[grid_id] = dataset_from_bmi_grid(self, grid_id)
+        self.refresh()
 
         for name in set(self.output_var_names + self.input_var_names):
             self._var[name] = DataValues(self, name)
 
     def update(self):
+        self._snapshots.clear()
         with cd(self.initdir):
             return self.bmi.update()
 
     def finalize(self):
         with cd(self.initdir):
             self._initialized = False
+            self._buffers.clear()
+            self._snapshots.clear()
+            self._metadata = None
             return self.bmi.finalize()
 
     def set_value(self, name, val):
+        self._snapshots.clear()
         val = np.asarray(val).reshape((-1,))
         return self.bmi.set_value(name, val)
 
-    def get_value(self, name, out=None, units=None, angle=None, at=None, method=None):
-        if out is None:
-            grid = self.get_var_grid(name)
-            dtype = self.get_var_type(name)
-            if dtype == "":
-                raise ValueError("{name} not understood".format(name=name))
-            loc = self.get_var_grid_loc(name)
-            out = np.empty(self.get_grid_dim(grid, loc), dtype=dtype)
+    def get_value(
+        self, name, out=None, units=None, angle=None, at=None, method=None, copy=False
+    ):
+        """Get the values of a variable.
 
-        self.bmi.get_value(name, out)
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+        out : ndarray, optional
+            Array into which to place the values.
+        units : str, optional
+            Units to convert the values to.
+        angle : {'azimuth', 'math'}, optional
+            Convention to use for angles.
+        at : float, optional
+            Time at which to interpolate the values. If the variable
+            was not buffered during the last update, a warning is issued
+            and its current values are returned.
+        copy : bool, optional
+            If *reuse_buffers* is set, return a newly-allocated array
+            rather than a read-only view of the variable's buffer.
+
+        Returns
+        -------
+        ndarray
+            The values of the variable.
+        """
+        pooled = out is None and not copy and name in self._buffers
+        if pooled:
+            out = self._buffers[name]
+        elif out is None:
+            out = self._empty_value(name)
 
-        if name in self._interpolators and at is not None:
-            out[:] = self._interpolators[name].interpolate(at)
+        self.bmi.get_value(name, out)
 
-        from_units = Units(self.get_var_units(name))
+        if at is not None:
+            if self.is_buffered(name):
+                out[:] = self.interpolate(name, at)
+            else:
+                warnings.warn(
+                    "{name} is not buffered for time interpolation, returning its"
+                    " current value (it is buffered after the next update)".format(
+                        name=name
+                    )
+                )
+                if name not in self.subscriptions:
+                    self.subscribe(name)
+
+        from_units = self.get_var_units(name)
         if units is not None:
-            to_units = Units(units)
+            to_units = units
+            get_converter(from_units, to_units)(out, inplace=True)
         else:
             to_units = from_units
 
-        if units is not None and from_units != to_units:
-            Units.conform(out, from_units, to_units, inplace=True)
-
-        # if units is not None:
-        #     try:
-        #         from_units = self.get_var_units(name)
-        #     except AttributeError, NotImplementedError:
-        #         pass
-        #     else:
-        #         Units.conform(out, Units(from_units), Units(units),
-        #                       inplace=True)
-
         if angle not in ("azimuth", "math", None):
             raise ValueError("angle not understood")
 
@@ -272,17 +423,98 @@ class _BmiCap(object):
         elif angle == "math" and "azimuth" in name:
             transform_azimuth_to_math(out, to_units)
 
+        if pooled:
+            out = out.view()
+            out.flags.writeable = False
+
         return out
 
     def get_value_ptr(self, name):
         return self.bmi.get_value_ptr(name)
 
+    def get_value_view(self, name, units=None):
+        """Get the values of a variable without copying them, if possible.
+
+        If the model provides a reference to its values through
+        *get_value_ptr* and no units conversion is needed, return a
+        read-only, flattened view of the model's memory. The view is live,
+        that is, its values change as the model is updated. Otherwise,
+        return a read-only snapshot of the values (flattened, as returned
+        by *get_value*).
+
+        Snapshots are shared by everyone that asks for the same variable,
+        in the same units, at the same model time, so that the values are
+        only fetched (and converted) once per time step. They are
+        discarded when the model's time changes or when it is updated or
+        has values set.
+
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+        units : str, optional
+            Units to convert the values to.
+
+        Returns
+        -------
+        ndarray
+            The values of the variable.
+        """
+        if units is None or get_converter(self.get_var_units(name), units).is_identity:
+            try:
+                ptr = self.get_value_ptr(name)
+            except (AttributeError, NotImplementedError, BmiError):
+                ptr = None
+
+            if isinstance(ptr, np.ndarray):
+                view = ptr.view()
+                try:
+                    view.shape = (-1,)
+                except AttributeError:
+                    pass  # The values can't be flattened without a copy.
+                else:
+                    view.flags.writeable = False
+                    return view
+
+        return self.get_value_snapshot(name, units=units)
+
+    def get_value_snapshot(self, name, units=None):
+        """Get a read-only snapshot of the values of a variable.
+
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+        units : str, optional
+            Units to convert the values to.
+
+        Returns
+        -------
+        ndarray
+            The values of the variable at the current time.
+        """
+        try:
+            time = self.bmi.get_current_time()
+        except Exception:  # pylint: disable=broad-except
+            time = None
+        if time != self._snapshot_time:
+            self._snapshots.clear()
+            self._snapshot_time = time
+
+        try:
+            return self._snapshots[(name, units)]
+        except KeyError:
+            values = self.get_value(name, units=units, copy=True)
+            values.flags.writeable = False
+            self._snapshots[(name, units)] = values
+            return values
+
     @deprecated(reason="use get_grid_ndim")
     def get_grid_rank(self, grid):
         return self.get_grid_ndim(grid)
 
     def get_grid_ndim(self, grid):
-        return self.bmi.get_grid_rank(grid)
+        return self._cached(("grid_rank", grid), self.bmi.get_grid_rank, grid)
 
     NUMBER_OF_ELEMENTS = {
         "node": "get_grid_number_of_nodes",
@@ -299,56 +531,78 @@ class _BmiCap(object):
         return self.get_grid_number_of_nodes(grid)
 
     def get_grid_type(self, grid):
-        return self.bmi.get_grid_type(grid)
+        return self._cached(("grid_type", grid), self.bmi.get_grid_type, grid)
 
     def get_grid_shape(self, grid, out=None):
-        if out is None:
-            out = np.empty(self.get_grid_ndim(grid), dtype=ctypes.c_int)
-        self.bmi.get_grid_shape(grid, out)
-        return out
+        return self._cached_grid_array(
+            "grid_shape",
+            grid,
+            self.bmi.get_grid_shape,
+            self.get_grid_ndim(grid),
+            ctypes.c_int,
+            out=out,
+        )
 
     def get_grid_spacing(self, grid, out=None):
-        if out is None:
-            out = np.empty(self.get_grid_ndim(grid), dtype=ctypes.c_double)
-        self.bmi.get_grid_spacing(grid, out)
-        return out
+        return self._cached_grid_array(
+            "grid_spacing",
+            grid,
+            self.bmi.get_grid_spacing,
+            self.get_grid_ndim(grid),
+            ctypes.c_double,
+            out=out,
+        )
 
     def get_grid_origin(self, grid, out=None):
-        if out is None:
-            out = np.empty(self.get_grid_ndim(grid), dtype=ctypes.c_double)
-        self.bmi.get_grid_origin(grid, out)
-        return out
+        return self._cached_grid_array(
+            "grid_origin",
+            grid,
+            self.bmi.get_grid_origin,
+            self.get_grid_ndim(grid),
+            ctypes.c_double,
+            out=out,
+        )
 
     def get_grid_number_of_nodes(self, grid):
-        return self.bmi.get_grid_size(grid)
+        return self._cached(("grid_size", grid), self.bmi.get_grid_size, grid)
 
     def get_grid_number_of_vertices(self, grid):
-        return self.get_grid_nodes_per_face(grid).sum()
+        return self._cached(
+            ("grid_vertices", grid),
+            lambda: self.get_grid_nodes_per_face(grid).sum(),
+        )
 
     def get_grid_number_of_faces(self, grid):
-        return self.bmi.get_grid_number_of_faces(grid)
+        return self._cached(
+            ("grid_faces", grid), self.bmi.get_grid_number_of_faces, grid
+        )
 
     def get_grid_face_node_connectivity(self, grid, out=None):
-        if out is None:
-            out = np.empty(self.get_grid_number_of_vertices(grid), dtype=ctypes.c_int)
-        self.bmi.get_grid_face_nodes(grid, out)
-        return out
+        return self.get_grid_face_nodes(grid, out=out)
 
     def get_grid_face_nodes(self, grid, out=None):
-        if out is None:
-            out = np.empty(self.get_grid_number_of_vertices(grid), dtype=ctypes.c_int)
-        self.bmi.get_grid_face_nodes(grid, out)
-        return out
+        return self._cached_grid_array(
+            "grid_face_nodes",
+            grid,
+            self.bmi.get_grid_face_nodes,
+            self.get_grid_number_of_vertices(grid),
+            ctypes.c_int,
+            out=out,
+        )
 
     def get_grid_face_node_offset(self, grid, out=None):
         nodes_per_face = self.get_grid_nodes_per_face(grid, out=out)
         return np.cumsum(nodes_per_face, out=out)
 
     def get_grid_nodes_per_face(self, grid, out=None):
-        if out is None:
-            out = np.empty(self.get_grid_number_of_faces(grid), dtype=ctypes.c_int)
-        self.bmi.get_grid_nodes_per_face(grid, out)
-        return out
+        return self._cached_grid_array(
+            "grid_nodes_per_face",
+            grid,
+            self.bmi.get_grid_nodes_per_face,
+            self.get_grid_number_of_faces(grid),
+            ctypes.c_int,
+            out=out,
+        )
 
     def get_grid_x(self, grid, out=None):
         if out is None:
@@ -370,14 +624,18 @@ class _BmiCap(object):
 
     @property
     def input_var_names(self):
-        return tuple(self.bmi.get_input_var_names())
+        return self._cached(
+            "input_var_names", lambda: tuple(self.bmi.get_input_var_names())
+        )
 
     def get_input_var_names(self):
         return self.input_var_names
 
     @property
     def output_var_names(self):
-        return tuple(self.bmi.get_output_var_names())
+        return self._cached(
+            "output_var_names", lambda: tuple(self.bmi.get_output_var_names())
+        )
 
     def get_output_var_names(self):
         return self.output_var_names
@@ -425,11 +683,7 @@ class _BmiCap(object):
         except (AttributeError, NotImplementedError):
             pass
         else:
-            from_units = Units(units_str)
-            to_units = Units(units)
-
-            if not from_units.equals(to_units):
-                time = Units.conform(time, from_units, to_units)
+            time = get_converter(units_str, units)(time)
 
         return time
 
@@ -443,19 +697,19 @@ class _BmiCap(object):
         except (AttributeError, NotImplementedError):
             pass
         else:
-            to_units = Units(units_str)
-            from_units = Units(units)
-
-            if not from_units.equals(to_units):
-                time = Units.conform(time, from_units, to_units)
+            time = get_converter(units, units_str)(time)
 
         return time
 
     def get_var_intent(self, name):
+        (inputs, outputs) = self._cached(
+            "var_intents",
+            lambda: (frozenset(self.input_var_names), frozenset(self.output_var_names)),
+        )
         intent = ""
-        if name in self.input_var_names:
+        if name in inputs:
             intent += "in"
-        if name in self.output_var_names:
+        if name in outputs:
             intent += "out"
         return intent
 
@@ -463,6 +717,9 @@ class _BmiCap(object):
         return self.get_var_grid_loc(name)
 
     def get_var_grid_loc(self, name):
+        return self._cached(("var_location", name), self._get_var_location, name)
+
+    def _get_var_location(self, name):
         try:
             self.bmi.get_var_location
         except AttributeError:
@@ -471,18 +728,24 @@ class _BmiCap(object):
             return self.bmi.get_var_location(name)
 
     def get_var_grid(self, name):
-        return self.bmi.get_var_grid(name)
+        return self._cached(("var_grid", name), self.bmi.get_var_grid, name)
 
     def get_var_itemsize(self, name):
-        return self.bmi.get_var_itemsize(name)
+        return self._cached(("var_itemsize", name), self.bmi.get_var_itemsize, name)
 
     def get_var_nbytes(self, name):
-        return self.bmi.get_var_nbytes(name)
+        return self._cached(("var_nbytes", name), self.bmi.get_var_nbytes, name)
+
+    def get_var_size(self, name):
+        return self.get_grid_dim(self.get_var_grid(name), self.get_var_grid_loc(name))
 
     def get_var_type(self, name):
-        return self.bmi.get_var_type(name)
+        return self._cached(("var_type", name), self.bmi.get_var_type, name)
 
     def get_var_units(self, name):
+        return self._cached(("var_units", name), self._get_var_units, name)
+
+    def _get_var_units(self, name):
         units = self.bmi.get_var_units(name)
         if units == "-":
             return ""
@@ -583,3 +846,28 @@ def bmi_factory(cls):
 
     BmiWrapper.__name__ = cls.__name__
     return BmiWrapper
+
+
+def bmi_instance(cls, *args, **kwds):
+    """Create an instance of a class wrapped with :func:`bmi_factory`.
+
+    Classes made by :func:`bmi_factory` are defined within the function and
+    so can not be pickled. This function and *cls* can, which makes them
+    usable as the factory of a port that runs in another process (see
+    :class:`~pymt.component.process.ProcessPort`).
+
+    Parameters
+    ----------
+    cls : type
+        The BMI class to wrap.
+    *args
+        Arguments passed to the wrapper class.
+    **kwds
+        Keyword arguments passed to the wrapper class.
+
+    Returns
+    -------
+    BmiCap
+        An instance of the wrapped class.
+    """
+    return bmi_factory(cls)(*args, **kwds)
@@ -1,8 +1,15 @@
 #! /usr/bin/env python
+import functools
+import os
+import shutil
+import tempfile
 import warnings
+import weakref
 
 import numpy as np
 
+from ..mappers.cache import cache_path, fingerprint, get_cache_dir
+
 try:
     import ESMF as esmf
 except ImportError:
@@ -37,6 +44,21 @@ def ravel_jaggedarray(array):
     return raveled_array, values_per_row
 
 
+def bmi_grid_fingerprint(bmi_grid):
+    """Hash the coordinates and connectivity of a BMI grid."""
+    return fingerprint(
+        *[
+            bmi_grid[name].values if name in bmi_grid else None
+            for name in (
+                "node_x",
+                "node_y",
+                "face_node_connectivity",
+                "face_node_offset",
+            )
+        ]
+    )
+
+
 def bmi_as_esmf_mesh(bmi_grid):
     xy_at_node = np.vstack((bmi_grid.node_x.values, bmi_grid.node_y.values)).T.copy()
 
@@ -115,20 +137,35 @@ def graph_as_esmf(graph, field_name, data=None, at="node"):
     return field
 
 
-def run_regridding(srcfield, dstfield, method="nearest", unmapped="pass"):
-    """run_regridding(source_field, destination_field, method=ESMP_REGRIDMETHOD_CONSERVE, unmapped=ESMP_UNMAPPEDACTION_ERROR)
-
-    **PRECONDITIONS:**
-        Two ESMP_Fields have been created and a regridding operation is desired from 'srcfield' to 'dstfield'.
-    **POSTCONDITIONS:**
-        An ESMP regridding operation has set the data on 'dstfield'.
+def as_esmf_regridder(
+    srcfield, dstfield, method="nearest", unmapped="pass", filename=None
+):
+    """Create an ESMF regridder that maps values from one field to another.
+
+    The interpolation weights are computed once, when the regridder is
+    created, and can then be applied to any fields that are built on the
+    same source and destination meshes. If a weights file is given, the
+    weights are read from that file if it exists and, otherwise, written
+    to it (through a temporary file).
+
+    Parameters
+    ----------
+    srcfield : esmf.Field
+        Source field.
+    dstfield : esmf.Field
+        Destination field.
+    method : {'nearest', 'bilinear', 'conserve'}, optional
+        Regridding method.
+    unmapped : {'pass', 'raise'}, optional
+        Action to take on unmapped destination elements.
+    filename : str, optional
+        Path to a netCDF file of regridding weights.
+
+    Returns
+    -------
+    esmf.Regrid
+        The regridder.
     """
-    # method = kwds.get('method', ESMF.RegridMethod.NEAREST_STOD)
-    # method = kwds.get('method', ESMF.RegridMethod.BILINEAR)
-    # unmapped = kwds.get('unmapped', ESMF.UnmappedAction.IGNORE)
-    # method = kwds.get('method', ESMF.RegridMethod.CONSERVE)
-    # unmapped = kwds.get('unmapped', ESMF.UnmappedAction.ERROR)
-
     try:
         method = REGRID_METHODS[method]
     except KeyError:
@@ -138,16 +175,52 @@ def run_regridding(srcfield, dstfield, method="nearest", unmapped="pass"):
     except KeyError:
         raise ValueError("unmapped action not understood")
 
-    # call the regridding functions
-    masked_values = np.array([-9999.0])
-    regridder = esmf.Regrid(
-        srcfield,
-        dstfield,
-        regrid_method=method,
-        unmapped_action=unmapped,
-        src_mask_values=masked_values,
-        dst_mask_values=masked_values,
-    )
+    if filename is not None and os.path.isfile(filename):
+        return esmf.RegridFromFile(srcfield, dstfield, filename)
+
+    def regrid(filename):
+        masked_values = np.array([-9999.0])
+        return esmf.Regrid(
+            srcfield,
+            dstfield,
+            filename=filename,
+            regrid_method=method,
+            unmapped_action=unmapped,
+            src_mask_values=masked_values,
+            dst_mask_values=masked_values,
+        )
+
+    if filename is None:
+        return regrid(None)
+
+    # The weights are written to a temporary file that is then moved into
+    # place so that concurrent runs never read a partially written file.
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        tmp_path = os.path.join(tmp_dir, os.path.basename(filename))
+        regridder = regrid(tmp_path)
+        os.replace(tmp_path, filename)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return regridder
+
+
+def run_regridding(
+    srcfield, dstfield, method="nearest", unmapped="pass", regridder=None
+):
+    """run_regridding(source_field, destination_field, method=ESMP_REGRIDMETHOD_CONSERVE, unmapped=ESMP_UNMAPPEDACTION_ERROR)
+
+    **PRECONDITIONS:**
+        Two ESMP_Fields have been created and a regridding operation is desired from 'srcfield' to 'dstfield'.
+        If provided, 'regridder' was created for the meshes of 'srcfield' and 'dstfield'.
+    **POSTCONDITIONS:**
+        An ESMP regridding operation has set the data on 'dstfield'.
+    """
+    if regridder is None:
+        regridder = as_esmf_regridder(
+            srcfield, dstfield, method=method, unmapped=unmapped
+        )
+
     dstfield = regridder(srcfield, dstfield)
 
     return dstfield
@@ -186,6 +259,122 @@ class GridMapperMixIn(object):
 
         return self._esmf_field[_id]
 
+    def _esmf_regridder_by_id(
+        self, gid, dst, dst_gid, method="nearest", unmapped="pass"
+    ):
+        try:
+            self._esmf_regridder
+        except AttributeError:
+            self._esmf_regridder = dict()
+
+        # Key by the identity of *dst*, rather than *dst* itself, so that
+        # the cache does not keep the destination alive.
+        _id = (gid, id(dst), dst_gid, method, unmapped)
+
+        src_field = self._esmf_field_by_id(gid, at="node")
+        dst_field = dst._esmf_field_by_id(dst_gid, at="node")
+
+        try:
+            regridder, fields, dst_ref = self._esmf_regridder[_id]
+        except KeyError:
+            fields, dst_ref = (None, None), None
+
+        if (
+            dst_ref is None
+            or dst_ref() is not dst
+            or fields[0] is not src_field
+            or fields[1] is not dst_field
+        ):
+            regridder = as_esmf_regridder(
+                src_field,
+                dst_field,
+                method=method,
+                unmapped=unmapped,
+                filename=self._esmf_weights_file(gid, dst, dst_gid, method, unmapped),
+            )
+            dst_ref = weakref.ref(dst, functools.partial(self._drop_regridder, _id))
+            self._esmf_regridder[_id] = (regridder, (src_field, dst_field), dst_ref)
+            dst._esmf_regridder_sources().add(self)
+
+        return regridder
+
+    def _drop_regridder(self, _id, dst_ref):
+        """Forget a regridder once its destination has been deleted."""
+        regridders = getattr(self, "_esmf_regridder", {})
+        if _id in regridders and regridders[_id][2] is dst_ref:
+            del regridders[_id]
+
+    def _esmf_regridder_sources(self):
+        """Objects that have cached regridders onto this object's grids."""
+        try:
+            self._esmf_sources
+        except AttributeError:
+            self._esmf_sources = weakref.WeakSet()
+
+        return self._esmf_sources
+
+    def _forget_regridders_to(self, dst, gid=None):
+        """Discard cached regridders onto the grids of another object.
+
+        Parameters
+        ----------
+        dst : bmi_like
+            The destination object.
+        gid : int, optional
+            Grid identifier of the destination. If not provided, discard
+            regridders onto all of its grids.
+        """
+        self._esmf_regridder = dict(
+            (_id, regridder)
+            for _id, regridder in getattr(self, "_esmf_regridder", {}).items()
+            if _id[1] != id(dst) or (gid is not None and _id[2] != gid)
+        )
+
+    def _esmf_weights_file(self, gid, dst, dst_gid, method, unmapped):
+        cache_dir = get_cache_dir()
+        if cache_dir is None:
+            return None
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        key = fingerprint(
+            np.array([bmi_grid_fingerprint(self.grid[gid])]),
+            np.array([bmi_grid_fingerprint(dst.grid[dst_gid])]),
+            np.array([method, unmapped]),
+        )
+        return cache_path(key, cache_dir, ext=".nc")
+
+    def invalidate_regridders(self, gid=None):
+        """Discard cached ESMF meshes, fields and regridders.
+
+        Call this whenever one of the object's grids changes so that
+        the interpolation weights are recomputed the next time values
+        are regridded to or from it. Regridders that other objects have
+        cached onto the grid are discarded as well.
+
+        Parameters
+        ----------
+        gid : int, optional
+            Grid identifier. If not provided, invalidate all grids.
+        """
+        self._esmf_mesh = dict(
+            (_id, mesh)
+            for _id, mesh in getattr(self, "_esmf_mesh", {}).items()
+            if gid is not None and _id != gid
+        )
+        self._esmf_field = dict(
+            (_id, field)
+            for _id, field in getattr(self, "_esmf_field", {}).items()
+            if gid is not None and not _id.startswith("{gid}.".format(gid=gid))
+        )
+        self._esmf_regridder = dict(
+            (_id, regridder)
+            for _id, regridder in getattr(self, "_esmf_regridder", {}).items()
+            if gid is not None and _id[0] != gid
+        )
+        for src in list(self._esmf_regridder_sources()):
+            src._forget_regridders_to(self, gid=gid)
+
     def regrid(self, name, **kwds):
         """Regrid values from one grid to another.
 
@@ -210,12 +399,18 @@ class GridMapperMixIn(object):
         data = self.get_value(name, **kwds)
 
         if esmf is not None:
-            src_field = self._esmf_field_by_id(self.var[name].grid, at="node")
-            dst_field = dst._esmf_field_by_id(dst.var[dst_name].grid, at="node")
+            src_grid, dst_grid = self.var[name].grid, dst.var[dst_name].grid
+
+            src_field = self._esmf_field_by_id(src_grid, at="node")
+            dst_field = dst._esmf_field_by_id(dst_grid, at="node")
 
             np.copyto(src_field.data, data.reshape(src_field.data.shape))
 
-            run_regridding(src_field, dst_field)
+            run_regridding(
+                src_field,
+                dst_field,
+                regridder=self._esmf_regridder_by_id(src_grid, dst, dst_grid),
+            )
 
             return dst_field.data
         else:
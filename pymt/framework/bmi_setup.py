@@ -7,8 +7,8 @@ import zipfile
 import yaml
 from model_metadata.model_data_files import FileTemplate
 from model_metadata.model_setup import FileSystemLoader
-from scripting.contexts import cd
 
+from ..utils.cwd import cd
 from .bmi_metadata import PluginMetadata
 
 
@@ -1,36 +1,137 @@
 #! /usr/bin/env python
-from scripting.contexts import cd
+import warnings
+
+import numpy as np
 
 from ..errors import BmiError
+from ..utils.cwd import cd
 from .timeinterp import TimeInterpolator
 
 
 class BmiTimeInterpolator(object):
+
+    """Interpolate output variables of a component in time.
+
+    By default, every output variable with a standard name is buffered
+    while updating. Set *buffer_all* to ``False`` to buffer only the
+    variables that have been subscribed to. The values of all buffered
+    variables are stacked into a single array so that they are stored,
+    and interpolated, together.
+    """
+
     def __init__(self, *args, **kwds):
-        method = kwds.pop("method", "linear")
-        self._interpolators = dict(
-            [(name, None) for name in self.output_var_names if "__" in name]
-        )
-        self.reset(method=method)
+        self._interp_method = kwds.pop("method", "linear")
+        self._buffer_all = kwds.pop("buffer_all", True)
+        self._subscriptions = dict()
+        self._ignored = set()
+        self.reset()
 
         super(BmiTimeInterpolator, self).__init__(*args, **kwds)
 
-    def reset(self, method="linear"):
-        for name in self._interpolators:
-            self._interpolators[name] = TimeInterpolator(method=method)
+    @property
+    def buffer_all(self):
+        """Buffer all output variables, not only those subscribed to."""
+        return self._buffer_all
 
-    def add_data(self):
-        time = self.get_current_time()
+    @buffer_all.setter
+    def buffer_all(self, buffer_all):
+        self._buffer_all = bool(buffer_all)
+
+    @property
+    def subscriptions(self):
+        """Names of variables that are interpolated in time."""
+        return tuple(self._subscriptions)
+
+    def subscribe(self, *names):
+        """Start buffering variables for time interpolation.
+
+        Variables are reference counted so that a variable is buffered
+        until all of its subscribers unsubscribe. New subscriptions take
+        effect the next time the component is updated.
+
+        Parameters
+        ----------
+        names : str
+            Names of output variables.
+        """
+        for name in names:
+            self._subscriptions[name] = self._subscriptions.get(name, 0) + 1
+
+    def unsubscribe(self, *names):
+        """Stop buffering variables for time interpolation.
 
-        for name in self._interpolators:
-            try:
-                self._interpolators[name].add_data([(time, self.get_value(name))])
-            except BmiError:
-                self._interpolators.pop(name)
-                print("unable to get value for {name}. ignoring".format(name=name))
+        Parameters
+        ----------
+        names : str
+            Names of output variables.
+        """
+        for name in names:
+            count = self._subscriptions.get(name, 0) - 1
+            if count > 0:
+                self._subscriptions[name] = count
+            else:
+                self._subscriptions.pop(name, None)
+
+    def is_buffered(self, name):
+        """Check if a variable has buffered values to interpolate."""
+        return self._slices is not None and name in self._slices
+
+    def reset(self, method=None):
+        if method is not None:
+            self._interp_method = method
+        self._interpolator = TimeInterpolator(method=self._interp_method)
+        self._slices = None
+        self._stack_size = 0
+        self._interpolated = (None, None)
+
+    def _buffered_names(self):
+        """Names of variables to buffer while updating."""
+        names = list(self._subscriptions)
+        if self._buffer_all:
+            names += [
+                name
+                for name in self.output_var_names
+                if "__" in name and name not in self._subscriptions
+            ]
+        return [name for name in names if name not in self._ignored]
+
+    def _stack_values(self):
+        """Values of all buffered variables as a single array."""
+        if self._slices is None:
+            values = []
+            for name in self._buffered_names():
+                try:
+                    values.append((name, np.ravel(self.get_value(name))))
+                except BmiError:
+                    self._ignored.add(name)
+                    warnings.warn(
+                        "unable to get value for {name}. ignoring".format(name=name)
+                    )
+
+            (self._slices, self._stack_size) = (dict(), 0)
+            for (name, value) in values:
+                self._slices[name] = slice(
+                    self._stack_size, self._stack_size + value.size
+                )
+                self._stack_size += value.size
+
+            return np.concatenate([value for (_, value) in values] or [[]])
+
+        stacked = np.empty(self._stack_size)
+        for (name, slice_) in self._slices.items():
+            stacked[slice_] = np.ravel(self.get_value(name))
+        return stacked
+
+    def add_data(self):
+        stacked = self._stack_values()
+        if self._slices:
+            self._interpolator.add_data([(self.get_current_time(), stacked)])
+            self._interpolated = (None, None)
 
     def interpolate(self, name, at):
-        return self._interpolators[name].interpolate(at)
+        if self._interpolated[0] != at:
+            self._interpolated = (at, self._interpolator.interpolate(at))
+        return self._interpolated[1][self._slices[name]].copy()
 
     def update_until(self, then, method=None, units=None):
         with cd(self.initdir):
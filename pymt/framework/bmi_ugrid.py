@@ -1,7 +1,25 @@
 from collections import OrderedDict
+from functools import partial
 
 import numpy as np
 import xarray as xr
+from xarray.backends import BackendArray
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# xarray only wraps backend arrays lazily through its (private) indexing
+# module. If that ever moves, variables are created with their values.
+try:
+    from xarray.core.indexing import (
+        IndexingSupport,
+        LazilyIndexedArray,
+        explicit_indexing_adapter,
+    )
+except ImportError:  # pragma: no cover
+    LazilyIndexedArray = None
 
 COORDINATE_NAMES = ["z", "y", "x"]
 INDEX_NAMES = ["k", "j", "i"]
@@ -15,6 +33,166 @@ def coordinate_names(rank):
     return ["node_" + d for d in COORDINATE_NAMES[-rank:]]
 
 
+class _ImplicitArray(BackendArray):
+
+    """A 1D array whose values are computed from their indices when read."""
+
+    def __init__(self, size, dtype, func):
+        self.shape = (size,)
+        self.dtype = np.dtype(dtype)
+        self._func = func
+
+    def __getitem__(self, key):
+        return explicit_indexing_adapter(
+            key, self.shape, IndexingSupport.BASIC, self._raw_indexing_method
+        )
+
+    def _raw_indexing_method(self, key):
+        (index,) = key
+        if isinstance(index, slice):
+            index = np.arange(*index.indices(self.shape[0]))
+        return np.asarray(self._func(index), dtype=self.dtype)
+
+
+def implicit_variable(dim, size, dtype, func, attrs=None):
+    """Create a lazily-evaluated, 1D, variable.
+
+    Parameters
+    ----------
+    dim : str
+        Name of the dimension.
+    size : int
+        Number of elements.
+    dtype : data-type
+        Data type of the variable.
+    func : callable
+        Function that returns the values at an array of indices.
+    attrs : dict, optional
+        Attributes of the variable.
+
+    Returns
+    -------
+    xarray.Variable
+        A variable whose values are only computed for the elements that
+        are read. If this version of xarray can not wrap arrays lazily,
+        the values of all elements are computed up front.
+
+    Examples
+    --------
+    >>> from pymt.framework.bmi_ugrid import implicit_variable
+    >>> var = implicit_variable("node", 10 ** 12, int, lambda index: index * 2)
+    >>> var[2:5].values
+    array([4, 6, 8])
+    """
+    if LazilyIndexedArray is None:
+        data = np.asarray(func(np.arange(size)), dtype=dtype)
+    else:
+        data = LazilyIndexedArray(_ImplicitArray(size, dtype, func))
+
+    return xr.Variable((dim,), data, attrs=attrs)
+
+
+def raster_node_coordinates(shape, spacing, origin, axis, nodes):
+    """Coordinates of nodes of a uniform rectilinear grid along an axis.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of nodes along each axis.
+    spacing : float
+        Spacing between nodes along the axis.
+    origin : float
+        Coordinate of the first node along the axis.
+    axis : int
+        Axis of the coordinate.
+    nodes : ndarray of int
+        Indices into the (flattened) nodes of the grid.
+
+    Returns
+    -------
+    ndarray of float
+        The coordinates of the nodes.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.framework.bmi_ugrid import raster_node_coordinates
+    >>> raster_node_coordinates((2, 3), 2.0, 1.0, 0, np.arange(6))
+    array([ 1.,  1.,  1.,  3.,  3.,  3.])
+    >>> raster_node_coordinates((2, 3), 1.0, 0.0, 1, np.arange(6))
+    array([ 0.,  1.,  2.,  0.,  1.,  2.])
+    """
+    stride = int(np.prod(shape[axis + 1 :]))
+    return (nodes // stride % shape[axis]) * spacing + origin
+
+
+def raster_face_nodes(shape, vertices):
+    """Face-node connectivity of a 2D raster.
+
+    Nodes of each face are listed counter-clockwise, starting with the
+    upper-right node.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of rows and columns of nodes.
+    vertices : ndarray of int
+        Indices into the (flattened) face-node connectivity.
+
+    Returns
+    -------
+    ndarray of int
+        The nodes at each vertex.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.framework.bmi_ugrid import raster_face_nodes
+    >>> raster_face_nodes((3, 4), np.arange(8))
+    array([5, 4, 0, 1, 6, 5, 1, 2])
+    """
+    n_cols = shape[1]
+    (face, corner) = np.divmod(vertices, 4)
+    lower_left = face // (n_cols - 1) * n_cols + face % (n_cols - 1)
+    return lower_left + np.array([n_cols + 1, n_cols, 0, 1])[corner]
+
+
+class BmiGridDatasets(Mapping):
+
+    """Mapping of grid ids to UGRID datasets that are built when first used.
+
+    Parameters
+    ----------
+    bmi : bmi_like
+        A BMI component.
+    grid_ids : iterable of int
+        Ids of the component's grids.
+    """
+
+    def __init__(self, bmi, grid_ids=()):
+        self._bmi = bmi
+        self._grid_ids = tuple(grid_ids)
+        self._datasets = dict()
+
+    def __getitem__(self, grid_id):
+        if grid_id not in self._grid_ids:
+            raise KeyError(grid_id)
+        try:
+            return self._datasets[grid_id]
+        except KeyError:
+            self._datasets[grid_id] = dataset_from_bmi_grid(self._bmi, grid_id)
+            return self._datasets[grid_id]
+
+    def __iter__(self):
+        return iter(self._grid_ids)
+
+    def __len__(self):
+        return len(self._grid_ids)
+
+    def __repr__(self):
+        return "BmiGridDatasets({0})".format(list(self._grid_ids))
+
+
 def dataset_from_bmi_grid(bmi, grid_id):
     grid_type = bmi.get_grid_type(grid_id)
     if grid_type == "points":
@@ -70,8 +248,6 @@ def dataset_from_bmi_vector(bmi, grid_id):
 
 
 def dataset_from_bmi_uniform_rectilinear(bmi, grid_id):
-    from landlab.graph import UniformRectilinearGraph
-
     rank = bmi.get_grid_ndim(grid_id)
     shape = bmi.get_grid_shape(grid_id)
     spacing = bmi.get_grid_spacing(grid_id)
@@ -104,43 +280,48 @@ def dataset_from_bmi_uniform_rectilinear(bmi, grid_id):
         }
     )
 
-    coords = []
-    for dim in range(rank):
-        coords.append(np.arange(shape[dim], dtype=float) * spacing[dim] + origin[dim])
-
-    coords_at_node = np.meshgrid(*coords, indexing="ij")
+    shape = tuple(int(n) for n in shape)
+    n_nodes = int(np.prod(shape))
 
     for axis, name in enumerate(COORDINATE_NAMES[-rank:]):
         dataset = dataset.update(
             {
                 "node_"
-                + name: xr.DataArray(
-                    data=coords_at_node[axis].reshape(-1),
-                    dims=("node",),
+                + name: implicit_variable(
+                    "node",
+                    n_nodes,
+                    float,
+                    partial(
+                        raster_node_coordinates,
+                        shape,
+                        spacing[axis],
+                        origin[axis],
+                        axis,
+                    ),
                     attrs={"standard_name": name, "units": "m"},
                 )
             }
         )
 
     if rank == 2:
-        graph = UniformRectilinearGraph(shape, spacing=spacing, origin=origin)
+        n_faces = (shape[0] - 1) * (shape[1] - 1)
 
         dataset = dataset.update(
             {
-                "face_node_connectivity": xr.DataArray(
-                    data=graph.nodes_at_patch.reshape((-1,)),
-                    dims=("vertex",),
+                "face_node_connectivity": implicit_variable(
+                    "vertex",
+                    n_faces * 4,
+                    int,
+                    partial(raster_face_nodes, shape),
                     attrs={"standard_name": "Face-node connectivity"},
-                )
-            }
-        )
-        dataset = dataset.update(
-            {
-                "face_node_offset": xr.DataArray(
-                    data=np.arange(1, graph.number_of_patches + 1, dtype=np.int32) * 4,
-                    dims=("face",),
+                ),
+                "face_node_offset": implicit_variable(
+                    "face",
+                    n_faces,
+                    np.int32,
+                    lambda faces: (faces + 1) * 4,
                     attrs={"standard_name": "Offset to face-node connectivity"},
-                )
+                ),
             }
         )
 
@@ -1,7 +1,5 @@
 #! /usr/bin/env python
-import bisect
-
-from scipy.interpolate import interp1d
+import numpy as np
 
 _MINIMUM_SIZE_FOR_METHOD = {
     "linear": 2,
@@ -14,6 +12,27 @@ _MINIMUM_SIZE_FOR_METHOD = {
     "next": 2,
 }
 
+_INITIAL_CAPACITY = 8
+
+
+def _lagrange_weights(times, time):
+    """Weights of the Lagrange polynomial through *times* evaluated at *time*.
+
+    Examples
+    --------
+    >>> from pymt.framework.timeinterp import _lagrange_weights
+    >>> _lagrange_weights([0.0, 1.0, 2.0], 1.5)
+    [-0.125, 0.75, 0.375]
+    """
+    weights = []
+    for j, time_j in enumerate(times):
+        weight = 1.0
+        for m, time_m in enumerate(times):
+            if m != j:
+                weight *= (time - time_m) / (time_j - time_m)
+        weights.append(weight)
+    return weights
+
 
 class TimeInterpolator(object):
 
@@ -33,6 +52,11 @@ class TimeInterpolator(object):
     ):
         """Interpolate data based on an evolving time series of data values.
 
+        Data are stored, sorted by time, in a preallocated ring buffer
+        so that adding new data does not copy the stored data and
+        interpolating only uses the stored values that bracket the
+        requested time.
+
         Parameters
         ---------
         data : iterable of (*time*, *data*), optional
@@ -48,9 +72,10 @@ class TimeInterpolator(object):
             the buffer reaches this size, the oldest times will be popped off a the
             stack.
         """
-        self._data = []
-        self._time = []
-        self._func = None
+        self._time = np.empty(_INITIAL_CAPACITY, dtype=float)
+        self._data = None
+        self._start = 0
+        self._size = 0
         self._method = None
         self._fill_value = None
         self._maxsize = None
@@ -95,7 +120,21 @@ class TimeInterpolator(object):
         if val is not None and val <= _MINIMUM_SIZE_FOR_METHOD[self.method]:
             raise ValueError("maxsize too small for method ({0})".format(self.method))
         self._maxsize = val
-        self._trim_data_to_maxsize()
+        if val is not None:
+            self._resize(val)
+
+    @property
+    def capacity(self):
+        """The number of times the buffer can hold before it is resized."""
+        return len(self._time)
+
+    @property
+    def times(self):
+        """The stored times, in increasing order."""
+        return self._time[self._slots()]
+
+    def __len__(self):
+        return self._size
 
     def add_data(self, time_and_data):
         """Add new data points to the interpolator.
@@ -112,38 +151,148 @@ class TimeInterpolator(object):
 
         for t, d in time_and_data:
             self._insert_data(t, d)
-        self._trim_data_to_maxsize()
 
-    def _trim_data_to_maxsize(self):
-        """Drop stored data to maxsize."""
-        if self.maxsize is not None:
-            while len(self._time) > self.maxsize:
-                self._time.pop(0)
-                self._data.pop(0)
+    def _slots(self, start=0, stop=None):
+        """Buffer slots of stored items, in time order."""
+        if stop is None:
+            stop = self._size
+        return (self._start + np.arange(start, stop)) % self.capacity
+
+    def _slot(self, ind):
+        """Buffer slot of the stored item at index *ind*."""
+        return (self._start + ind) % self.capacity
+
+    def _resize(self, capacity):
+        """Reallocate the buffer, keeping the most recent data that fit."""
+        slots = self._slots(max(self._size - capacity, 0))
+
+        time = np.empty(capacity, dtype=float)
+        time[: len(slots)] = self._time[slots]
+        self._time = time
+
+        if self._data is not None:
+            data = np.empty((capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+            data[: len(slots)] = self._data[slots]
+            self._data = data
+
+        self._start, self._size = 0, len(slots)
+
+    def _bisect(self, time, side="right"):
+        """Index at which to insert *time* to keep the stored times sorted."""
+        (lo, hi) = (0, self._size)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_time = self._time[self._slot(mid)]
+            if mid_time < time or (side == "right" and mid_time == time):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
 
     def _insert_data(self, time, data):
         """Insert data so that it is stored sorted by time."""
-        ind = bisect.bisect_right(self._time, time)
-        self._time.insert(ind, time)
-        self._data.insert(ind, data)
+        data = np.asarray(data)
+        if self._data is None:
+            self._data = np.empty(
+                (self.capacity,) + data.shape, dtype=np.result_type(data, float)
+            )
+        elif data.shape != self._data.shape[1:]:
+            raise ValueError(
+                "data shape mismatch ({0} != {1})".format(
+                    data.shape, self._data.shape[1:]
+                )
+            )
+
+        ind = self._bisect(time, side="right")
+        if self._size == self.capacity:
+            if self.maxsize is None:
+                self._resize(2 * self.capacity)
+            elif ind == 0:
+                return
+            else:
+                self._start = self._slot(1)
+                self._size -= 1
+                ind -= 1
+
+        for i in range(self._size, ind, -1):
+            (dst, src) = (self._slot(i), self._slot(i - 1))
+            self._time[dst] = self._time[src]
+            self._data[dst] = self._data[src]
+
+        slot = self._slot(ind)
+        self._time[slot] = time
+        self._data[slot] = data
+        self._size += 1
 
-        self._func = None
+    def _time_at(self, ind):
+        return self._time[self._slot(ind)]
+
+    def _data_at(self, ind):
+        return self._data[self._slot(ind)]
 
     def interpolate(self, time):
         """Interpolate the data at a given time."""
-        if self._func is None:
-            self._func = interp1d(
-                self._time,
-                self._data,
-                axis=0,
-                kind=self._method,
-                fill_value=self._fill_value,
-                copy=False,
-                assume_sorted=True,
-                bounds_error=False,
+        if np.ndim(time) > 0:
+            return np.array([self.interpolate(t) for t in time])
+
+        if self._size < _MINIMUM_SIZE_FOR_METHOD[self.method]:
+            raise ValueError(
+                "not enough data to interpolate with method ({0})".format(self.method)
             )
 
-        return self._func(time)
+        if self.fill_value != "extrapolate" and not (
+            self._time_at(0) <= time <= self._time_at(self._size - 1)
+        ):
+            return np.full(self._data.shape[1:], self.fill_value)
+
+        if self.method in ("linear", "slinear"):
+            return self._interpolate_linear(time)
+        elif self.method in ("quadratic", "cubic"):
+            return self._interpolate_stencil(time)
+        else:
+            return self._data_at(self._nearest_index(time)).copy()
+
+    def _bracket(self, time):
+        """Index of the first of the two stored times that bracket *time*."""
+        return min(max(self._bisect(time, side="right") - 1, 0), self._size - 2)
+
+    def _nearest_index(self, time):
+        """Index of the stored value used by the step-wise methods."""
+        if self.method == "next":
+            return min(self._bisect(time, side="left"), self._size - 1)
+        elif self.method in ("previous", "zero"):
+            return max(self._bisect(time, side="right") - 1, 0)
+        else:
+            lo = self._bracket(time)
+            if time - self._time_at(lo) <= self._time_at(lo + 1) - time:
+                return lo
+            else:
+                return lo + 1
+
+    def _interpolate_linear(self, time):
+        lo = self._bracket(time)
+        (time_lo, time_hi) = (self._time_at(lo), self._time_at(lo + 1))
+        (data_lo, data_hi) = (self._data_at(lo), self._data_at(lo + 1))
+
+        if time_hi == time_lo:
+            return data_hi.copy()
+
+        weight = (time - time_lo) / (time_hi - time_lo)
+        return data_lo + weight * (data_hi - data_lo)
+
+    def _interpolate_stencil(self, time):
+        n_points = _MINIMUM_SIZE_FOR_METHOD[self.method]
+        start = min(
+            max(self._bracket(time) - (n_points - 2) // 2, 0), self._size - n_points
+        )
+        inds = range(start, start + n_points)
+
+        weights = _lagrange_weights([self._time_at(ind) for ind in inds], time)
+
+        values = weights[0] * self._data_at(inds[0])
+        for weight, ind in zip(weights[1:], inds[1:]):
+            values += weight * self._data_at(ind)
+        return values
 
     def __call__(self, time):
         """Interpolate the data at a given time."""
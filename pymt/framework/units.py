@@ -0,0 +1,177 @@
+#! /usr/bin/env python
+"""Convert values between units.
+
+Converting values with *cfunits* means parsing both units strings and
+then asking *udunits* to convert the values, which is slow if it is
+done over and over again, for instance when getting a variable, or a
+time, inside a coupling loop. Instead, each pair of units is compiled,
+once, into a :class:`UnitConverter` that applies the (affine)
+conversion with numpy.
+
+Examples
+--------
+>>> from pymt.framework.units import get_converter
+>>> get_converter("m", "m").is_identity
+True
+>>> get_converter("m", "m") is get_converter("m", "m")
+True
+"""
+import numpy as np
+from cfunits import Units
+
+
+class UnitConverter(object):
+
+    """Affine conversion of values from one set of units to another.
+
+    Parameters
+    ----------
+    scale : float, optional
+        Scale factor.
+    offset : float, optional
+        Offset added after scaling.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.framework.units import UnitConverter
+    >>> convert = UnitConverter(scale=1000.0)
+    >>> convert(1.5)
+    1500.0
+
+    >>> values = np.array([1.0, 2.0])
+    >>> convert(values, inplace=True)
+    array([ 1000.,  2000.])
+    >>> values
+    array([ 1000.,  2000.])
+    """
+
+    def __init__(self, scale=1.0, offset=0.0):
+        self._scale = scale
+        self._offset = offset
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @property
+    def offset(self):
+        return self._offset
+
+    @property
+    def is_identity(self):
+        """Check if the conversion leaves values unchanged."""
+        return self._scale == 1.0 and self._offset == 0.0
+
+    def __call__(self, values, inplace=False):
+        """Convert values.
+
+        Parameters
+        ----------
+        values : float or ndarray
+            Values to convert.
+        inplace : bool, optional
+            Convert an array of values in place.
+
+        Returns
+        -------
+        float or ndarray
+            The converted values.
+        """
+        if self.is_identity:
+            return values
+
+        if inplace:
+            if self._scale != 1.0:
+                np.multiply(values, self._scale, out=values, casting="unsafe")
+            if self._offset != 0.0:
+                np.add(values, self._offset, out=values, casting="unsafe")
+            return values
+        else:
+            return values * self._scale + self._offset
+
+    def __repr__(self):
+        return "UnitConverter(scale={0!r}, offset={1!r})".format(
+            self._scale, self._offset
+        )
+
+
+def compile_converter(from_units, to_units):
+    """Compile the conversion between two units.
+
+    Parameters
+    ----------
+    from_units : str
+        Units to convert from.
+    to_units : str
+        Units to convert to.
+
+    Returns
+    -------
+    UnitConverter
+        The conversion.
+
+    Raises
+    ------
+    ValueError
+        If the units are not convertible.
+    """
+    if units_are_equivalent(from_units, to_units):
+        return UnitConverter()
+
+    (zero, one) = Units.conform(
+        np.array([0.0, 1.0]), Units(from_units), Units(to_units)
+    )
+    return UnitConverter(scale=float(one - zero), offset=float(zero))
+
+
+_CONVERTERS = {}
+
+
+def get_converter(from_units, to_units):
+    """Get the, cached, conversion between two units.
+
+    Parameters
+    ----------
+    from_units : str
+        Units to convert from.
+    to_units : str
+        Units to convert to.
+
+    Returns
+    -------
+    UnitConverter
+        The conversion.
+    """
+    key = (from_units, to_units)
+    try:
+        return _CONVERTERS[key]
+    except KeyError:
+        _CONVERTERS[key] = compile_converter(from_units, to_units)
+        return _CONVERTERS[key]
+
+
+_EQUIVALENT = {}
+
+
+def units_are_equivalent(units, other):
+    """Check, with caching, if two units strings are equivalent.
+
+    Parameters
+    ----------
+    units : str
+        Units.
+    other : str
+        Other units.
+
+    Returns
+    -------
+    bool
+        `True` if the units are equivalent.
+    """
+    key = (units, other)
+    try:
+        return _EQUIVALENT[key]
+    except KeyError:
+        _EQUIVALENT[key] = Units(units).equals(Units(other))
+        return _EQUIVALENT[key]
@@ -27,9 +27,9 @@ array([ 0.,  0.,  0.,  2.,  2.,  2.])
 Node 1 is shared by both cell 0, and 1; node 5 only is part of cell 1.
 
 >>> g.get_shared_cells (1)
-[0, 1]
+array([0, 1])
 >>> g.get_shared_cells (5)
-[1]
+array([1])
 
 Point (.5, 1.) is contained only within cell 0.
 
@@ -47,7 +47,9 @@ True
 
 """
 
-from shapely.geometry import Point, asLineString, asPoint, asPolygon
+import numpy as np
+from scipy.spatial import KDTree
+from shapely.geometry import LineString, Point, Polygon
 
 from pymt.grids import (
     Rectilinear,
@@ -58,38 +60,95 @@ from pymt.grids import (
 )
 
 
+def _sort_pairs(point_ids, cell_ids):
+    order = np.lexsort((cell_ids, point_ids))
+    return point_ids[order], cell_ids[order]
+
+
+def _cells_on_axis(coords, values):
+    """Range of cells along an axis that contain each value.
+
+    Values that lie on the boundary between two cells are in both.
+
+    Examples
+    --------
+    >>> from pymt.grids.map import _cells_on_axis
+    >>> _cells_on_axis(np.array([0., 1., 2.]), np.array([-1., 0., .5, 1., 2., 3.]))
+    (array([0, 0, 0, 0, 1, 2]), array([-1,  0,  0,  1,  1,  1]))
+    """
+    n_cells = len(coords) - 1
+    lo = np.searchsorted(coords, values, side="left") - 1
+    hi = np.searchsorted(coords, values, side="right") - 1
+    return np.maximum(lo, 0), np.minimum(hi, n_cells - 1)
+
+
+class RectilinearLocatorMixIn(object):
+
+    """Locate points in the cells of a 2D rectilinear grid.
+
+    Cells are found by searching the grid's axis coordinates rather than
+    by testing points against the cell polygons.
+    """
+
+    def locate_points(self, x, y, near=None):
+        """Find the cells that contain points.
+
+        Parameters
+        ----------
+        x : ndarray
+            x-coordinates of points.
+        y : ndarray
+            y-coordinates of points.
+        near : ndarray of int, optional
+            Not used.
+
+        Returns
+        -------
+        tuple of ndarray of int
+            Indices of points and the cells that contain them, sorted by
+            point and then by cell.
+        """
+        if self.get_dim_count() != 2:
+            return super(RectilinearLocatorMixIn, self).locate_points(x, y, near=near)
+
+        x_coords, y_coords = self.get_x_coordinates(), self.get_y_coordinates()
+        if np.any(np.diff(x_coords) <= 0) or np.any(np.diff(y_coords) <= 0):
+            return super(RectilinearLocatorMixIn, self).locate_points(x, y, near=near)
+
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        (col_lo, col_hi) = _cells_on_axis(x_coords, x.reshape((-1,)))
+        (row_lo, row_hi) = _cells_on_axis(y_coords, y.reshape((-1,)))
+        n_cols = len(x_coords) - 1
+
+        point_ids, cell_ids = [], []
+        for d_row in (0, 1):
+            for d_col in (0, 1):
+                row, col = row_lo + d_row, col_lo + d_col
+                (in_cell,) = np.where((row <= row_hi) & (col <= col_hi))
+                point_ids.append(in_cell)
+                cell_ids.append(row[in_cell] * n_cols + col[in_cell])
+
+        return _sort_pairs(np.concatenate(point_ids), np.concatenate(cell_ids))
+
+
 class UnstructuredMap(Unstructured):
     name = "Unstructured"
 
     def __init__(self, *args, **kwargs):
         super(UnstructuredMap, self).__init__(*args, **kwargs)
 
-        self._point = {}
-        last_offset = 0
-        for (cell_id, offset) in enumerate(self._offset):
-            cell = self._connectivity[last_offset:offset]
-            last_offset = offset
-
-            for point_id in cell:
-                try:
-                    self._point[point_id].append(cell_id)
-                except KeyError:
-                    self._point[point_id] = [cell_id]
-
-        (point_x, point_y) = (self.get_x(), self.get_y())
-        self._polys = []
-        last_offset = 0
-        for (cell_id, offset) in enumerate(self._offset):
-            cell = self._connectivity[last_offset:offset]
-            last_offset = offset
-
-            (x, y) = (point_x.take(cell), point_y.take(cell))
-            if len(x) > 2:
-                self._polys.append(asPolygon(zip(x, y)))
-            elif len(x) == 2:
-                self._polys.append(asLineString(zip(x, y)))
-            else:
-                self._polys.append(asPoint(zip(x, y)))
+        cell_at_vertex = np.repeat(
+            np.arange(self.get_cell_count()), self.nodes_per_cell()
+        )
+        self._cells_at_point = cell_at_vertex[
+            np.argsort(self._connectivity, kind="mergesort")
+        ]
+        self._cells_at_point_offset = np.zeros(self.get_point_count() + 1, dtype=int)
+        np.cumsum(
+            np.bincount(self._connectivity, minlength=self.get_point_count()),
+            out=self._cells_at_point_offset[1:],
+        )
+        self._polys = {}
 
     def get_shared_cells(self, point_id):
         """
@@ -103,10 +162,34 @@ class UnstructuredMap(Unstructured):
         ndarray of int
             Indices to cells that share a given node.
         """
-        return self._point[point_id]
+        return self._cells_at_point[
+            self._cells_at_point_offset[point_id] : self._cells_at_point_offset[
+                point_id + 1
+            ]
+        ]
+
+    def _get_poly(self, cell_id):
+        try:
+            return self._polys[cell_id]
+        except KeyError:
+            pass
+
+        start = self._offset[cell_id - 1] if cell_id > 0 else 0
+        cell = self._connectivity[start : self._offset[cell_id]]
+
+        xy = list(zip(self.get_x().take(cell), self.get_y().take(cell)))
+        if len(xy) > 2:
+            poly = Polygon(xy)
+        elif len(xy) == 2:
+            poly = LineString(xy)
+        else:
+            poly = Point(xy[0])
+        self._polys[cell_id] = poly
+
+        return poly
 
     def is_in_cell(self, x, y, cell_id):
-        """ Check if a point is in a cell.
+        """Check if a point is in a cell.
 
         Parameters
         ----------
@@ -123,7 +206,118 @@ class UnstructuredMap(Unstructured):
             True if the point (x, y) is contained in the cell.
         """
         pt = Point((x, y))
-        return self._polys[cell_id].contains(pt) or self._polys[cell_id].touches(pt)
+        poly = self._get_poly(cell_id)
+        return poly.contains(pt) or poly.touches(pt)
+
+    def _is_convex(self):
+        try:
+            return self._convex
+        except AttributeError:
+            pass
+
+        (point_x, point_y) = (self.get_x(), self.get_y())
+        nodes_per_cell = self.nodes_per_cell()
+        starts = self._offset - nodes_per_cell
+
+        self._convex = np.zeros(self.get_cell_count(), dtype=bool)
+        for n_nodes in (3, 4):
+            (cells,) = np.where(nodes_per_cell == n_nodes)
+            nodes = self._connectivity[starts[cells, np.newaxis] + np.arange(n_nodes)]
+            dx = np.roll(point_x[nodes], -1, axis=1) - point_x[nodes]
+            dy = np.roll(point_y[nodes], -1, axis=1) - point_y[nodes]
+            turn = dx * np.roll(dy, -1, axis=1) - dy * np.roll(dx, -1, axis=1)
+            self._convex[cells] = np.all(turn > 0, axis=1) | np.all(turn < 0, axis=1)
+
+        return self._convex
+
+    def is_in_cells(self, x, y, cell_ids):
+        """Check if points are in cells.
+
+        Triangles and convex quadrilaterals are checked all at once by
+        testing which side of each edge a point lies on. Other cells are
+        checked one at a time with :meth:`is_in_cell`.
+
+        Parameters
+        ----------
+        x: ndarray
+            x-coordinates of points to check.
+        y: ndarray
+            y-coordinates of points to check.
+        cell_ids: ndarray of int
+            ID of the cell to check for each point.
+
+        Returns
+        -------
+        ndarray of bool
+            True for each point (x, y) that is contained in its cell.
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        cell_ids = np.asarray(cell_ids, dtype=int)
+
+        (point_x, point_y) = (self.get_x(), self.get_y())
+        nodes_per_cell = self.nodes_per_cell()
+        starts = self._offset - nodes_per_cell
+        convex = self._is_convex()
+
+        is_in = np.zeros(len(cell_ids), dtype=bool)
+        for n_nodes in (3, 4):
+            (pairs,) = np.where(
+                convex[cell_ids] & (nodes_per_cell[cell_ids] == n_nodes)
+            )
+            nodes = self._connectivity[
+                starts[cell_ids[pairs], np.newaxis] + np.arange(n_nodes)
+            ]
+            (node_x, node_y) = (point_x[nodes], point_y[nodes])
+            side = (np.roll(node_x, -1, axis=1) - node_x) * (
+                y[pairs, np.newaxis] - node_y
+            ) - (np.roll(node_y, -1, axis=1) - node_y) * (x[pairs, np.newaxis] - node_x)
+            is_in[pairs] = np.all(side >= 0, axis=1) | np.all(side <= 0, axis=1)
+
+        (pairs,) = np.where(~convex[cell_ids])
+        for pair in pairs:
+            is_in[pair] = self.is_in_cell(x[pair], y[pair], cell_ids[pair])
+
+        return is_in
+
+    def locate_points(self, x, y, near=None):
+        """Find the cells that contain points.
+
+        Only the cells that share the node nearest to each point are
+        checked.
+
+        Parameters
+        ----------
+        x : ndarray
+            x-coordinates of points.
+        y : ndarray
+            y-coordinates of points.
+        near : ndarray of int, optional
+            ID of the node nearest to each point. If not provided, find
+            them.
+
+        Returns
+        -------
+        tuple of ndarray of int
+            Indices of points and the cells that contain them, sorted by
+            point and then by cell.
+        """
+        x = np.asarray(x, dtype=float).reshape((-1,))
+        y = np.asarray(y, dtype=float).reshape((-1,))
+        if near is None:
+            tree = KDTree(np.vstack((self.get_x(), self.get_y())).T)
+            (_, near) = tree.query(np.vstack((x, y)).T)
+
+        offset = self._cells_at_point_offset
+        n_cells = offset[1:][near] - offset[near]
+        point_ids = np.repeat(np.arange(len(near)), n_cells)
+        first = np.cumsum(n_cells) - n_cells
+        cell_ids = self._cells_at_point[
+            np.arange(n_cells.sum()) + np.repeat(offset[near] - first, n_cells)
+        ]
+
+        is_in = self.is_in_cells(x[point_ids], y[point_ids], cell_ids)
+
+        return _sort_pairs(point_ids[is_in], cell_ids[is_in])
 
 
 class UnstructuredPointsMap(UnstructuredPoints):
@@ -135,16 +329,21 @@ class UnstructuredPointsMap(UnstructuredPoints):
     def is_in_cell(self, x, y, cell_id):  # pylint: disable=no-self-use
         return False
 
+    def locate_points(self, x, y, near=None):  # pylint: disable=no-self-use
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
 
 class StructuredMap(Structured, UnstructuredMap):
     name = "Structured"
 
 
-class RectilinearMap(Rectilinear, UnstructuredMap):
+class RectilinearMap(RectilinearLocatorMixIn, Rectilinear, UnstructuredMap):
     name = "Rectilinear"
 
 
-class UniformRectilinearMap(UniformRectilinear, UnstructuredMap):
+class UniformRectilinearMap(
+    RectilinearLocatorMixIn, UniformRectilinear, UnstructuredMap
+):
     name = "UniformRectilinear"
 
 
@@ -2,6 +2,7 @@ from .mapper import find_mapper, IncompatibleGridError
 from .celltopoint import CellToPoint
 from .pointtopoint import NearestVal
 from .pointtocell import PointToCell
+from .sparse import SparseGridMapper
 
 __all__ = [
     "find_mapper",
@@ -9,4 +10,5 @@ __all__ = [
     "CellToPoint",
     "NearestVal",
     "PointToCell",
+    "SparseGridMapper",
 ]
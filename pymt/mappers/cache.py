@@ -0,0 +1,193 @@
+#! /bin/env python
+"""On-disk cache of mapping operators.
+
+Mapping operators are stored as compressed sparse-matrix files in a
+cache folder. Each file is named by a key that is a hash of the
+coordinates and connectivity of the source and destination grids
+along with the mapping method, so that a mapping is only computed
+once for a given pair of grids.
+
+The cache folder is given by the ``PYMT_MAPPER_CACHE`` environment
+variable. If it is not set, mapping operators are not cached.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.map import RectilinearMap
+>>> from pymt.mappers.cache import grid_fingerprint
+
+>>> grid = RectilinearMap([0, 1, 2], [0, 2])
+>>> grid_fingerprint(grid) == grid_fingerprint(RectilinearMap([0, 1, 2], [0, 2]))
+True
+>>> grid_fingerprint(grid) == grid_fingerprint(RectilinearMap([0, 1, 2], [0, 3]))
+False
+"""
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+from scipy.sparse import load_npz, save_npz
+
+CACHE_DIR_ENV = "PYMT_MAPPER_CACHE"
+
+
+def get_cache_dir():
+    """Path to the mapper cache folder, or `None` if caching is disabled."""
+    return os.environ.get(CACHE_DIR_ENV, None) or None
+
+
+def fingerprint(*arrays):
+    """Hash the contents of a series of arrays.
+
+    Parameters
+    ----------
+    arrays : array_like
+        Arrays to hash. Items that are `None` are hashed as a placeholder.
+
+    Returns
+    -------
+    str
+        Hex digest of the arrays' types, shapes and values.
+
+    Examples
+    --------
+    >>> from pymt.mappers.cache import fingerprint
+    >>> fingerprint([1, 2, 3]) == fingerprint([1, 2, 3])
+    True
+    >>> fingerprint([1, 2, 3]) == fingerprint([1., 2., 3.])
+    False
+    >>> fingerprint([1, 2], [3]) == fingerprint([1], [2, 3])
+    False
+    """
+    digest = hashlib.sha1()
+    for array in arrays:
+        if array is None:
+            digest.update(b"None")
+            continue
+        array = np.ascontiguousarray(array)
+        digest.update(
+            "{dtype}{shape}".format(dtype=array.dtype.str, shape=array.shape).encode()
+        )
+        digest.update(array.view(np.uint8))
+    return digest.hexdigest()
+
+
+def _grid_array(grid, name):
+    try:
+        return getattr(grid, name)()
+    except (AttributeError, IndexError, TypeError):
+        return None
+
+
+def grid_fingerprint(grid):
+    """Hash the coordinates and connectivity of a grid.
+
+    Parameters
+    ----------
+    grid : grid_like
+        A grid.
+
+    Returns
+    -------
+    str or None
+        Hex digest of the grid, or `None` if the grid has no coordinates.
+    """
+    arrays = [
+        _grid_array(grid, name)
+        for name in ("get_x", "get_y", "get_connectivity", "get_offset")
+    ]
+    if arrays[0] is None:
+        return None
+    return fingerprint(*arrays)
+
+
+def mapping_key(method, dst_grid, src_grid, **kwds):
+    """Key that identifies a mapping between two grids.
+
+    Parameters
+    ----------
+    method : str
+        Name of the mapping method.
+    dst_grid : grid_like
+        Grid onto which values are mapped.
+    src_grid : grid_like
+        Grid from which values are mapped.
+    kwds : dict, optional
+        Additional options that affect the mapping.
+
+    Returns
+    -------
+    str or None
+        The key, or `None` if either grid can not be fingerprinted.
+    """
+    dst, src = grid_fingerprint(dst_grid), grid_fingerprint(src_grid)
+    if dst is None or src is None:
+        return None
+
+    digest = hashlib.sha1()
+    for item in (method, dst, src, repr(sorted(kwds.items()))):
+        digest.update(str(item).encode())
+    return digest.hexdigest()
+
+
+def cache_path(key, cache_dir, ext=".npz"):
+    """Path to the cache file for a key."""
+    return os.path.join(cache_dir, key + ext)
+
+
+def load_operator(key, cache_dir=None):
+    """Load a cached mapping operator.
+
+    Parameters
+    ----------
+    key : str
+        Key of the mapping.
+    cache_dir : str, optional
+        Cache folder. If not provided, use the default cache folder.
+
+    Returns
+    -------
+    csr_matrix or None
+        The cached operator, or `None` if there is no cached operator.
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    if key is None or cache_dir is None:
+        return None
+
+    try:
+        return load_npz(cache_path(key, cache_dir)).tocsr()
+    except (IOError, ValueError):
+        return None
+
+
+def save_operator(key, operator, cache_dir=None):
+    """Save a mapping operator to the cache.
+
+    The operator is first written to a temporary file that is then
+    moved into place so that concurrent runs never read a partially
+    written file.
+
+    Parameters
+    ----------
+    key : str
+        Key of the mapping.
+    operator : sparse matrix
+        The mapping operator.
+    cache_dir : str, optional
+        Cache folder. If not provided, use the default cache folder.
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    if key is None or cache_dir is None:
+        return
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(suffix=".npz", dir=cache_dir)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            save_npz(fp, operator, compressed=True)
+        os.replace(tmp_path, cache_path(key, cache_dir))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
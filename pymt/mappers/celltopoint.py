@@ -1,65 +1,80 @@
 #! /bin/env python
 
 import numpy as np
-from scipy.spatial import KDTree
-from six.moves import zip
 
-from .imapper import IGridMapper, IncompatibleGridError
+from .sparse import SparseGridMapper, as_sparse_operator
 
 # from .mapper import IncompatibleGridError
 
 
-def map_points_to_cells(coords, src_grid, src_point_ids, bad_val=-1):
+def map_points_to_cells(coords, src_grid, src_point_ids=None, bad_val=-1):
+    """Find the cell of a grid that contains each point.
+
+    Parameters
+    ----------
+    coords : tuple of ndarray
+        x and y coordinates of points.
+    src_grid : grid_like
+        Grid whose cells are searched.
+    src_point_ids : ndarray of int, optional
+        ID of the grid node nearest to each point.
+    bad_val : int, optional
+        Cell ID for points that are not in any cell.
+
+    Returns
+    -------
+    ndarray of int
+        ID of the cell that contains each point. If a point is in more
+        than one cell, use the one with the largest ID.
+    """
     (dst_x, dst_y) = coords
 
-    point_to_cell_id = np.empty(len(dst_x), dtype=np.int)
+    point_to_cell_id = np.empty(len(dst_x), dtype=int)
     point_to_cell_id.fill(bad_val)
 
-    for (j, point_id) in enumerate(src_point_ids):
-        for cell_id in src_grid.get_shared_cells(point_id):
-            if src_grid.is_in_cell(dst_x[j], dst_y[j], cell_id):
-                point_to_cell_id[j] = cell_id
+    (point_ids, cell_ids) = src_grid.locate_points(dst_x, dst_y, near=src_point_ids)
+    is_last = np.append(point_ids[1:] != point_ids[:-1], True)
+    point_to_cell_id[point_ids[is_last]] = cell_ids[is_last]
 
     return point_to_cell_id
 
 
-class CellToPoint(IGridMapper):
+class CellToPoint(SparseGridMapper):
 
     _name = "CellToPoint"
 
-    def initialize(self, dest_grid, src_grid, **kwds):
-        if not CellToPoint.test(dest_grid, src_grid):
-            raise IncompatibleGridError(dest_grid.name, src_grid.name)
-        dst_x = dest_grid.get_x()
-        dst_y = dest_grid.get_y()
-
-        tree = KDTree(list(zip(src_grid.get_x(), src_grid.get_y())))
-        (_, self._nearest_src_id) = tree.query(list(zip(dst_x, dst_y)))
+    def _build_operator(self, dest_grid, src_grid, **kwds):
+        point_to_cell_id = map_points_to_cells(
+            (dest_grid.get_x(), dest_grid.get_y()), src_grid, bad_val=-1
+        )
 
-        self._map = map_points_to_cells(
-            (dst_x, dst_y), src_grid, self._nearest_src_id, bad_val=-1
+        (point_ids,) = np.where(point_to_cell_id != -1)
+        return as_sparse_operator(
+            point_ids,
+            point_to_cell_id[point_ids],
+            (len(point_to_cell_id), src_grid.get_cell_count()),
         )
-        self._bad = self._map == -1
+
+    @staticmethod
+    def _is_bad(values, bad_val):
+        return values < bad_val
 
     def run(self, src_values, **kwds):
         dst_vals = kwds.get("dst_vals", None)
         bad_val = kwds.get("bad_val", -999.0)
 
+        src_values = np.asarray(src_values)
         if dst_vals is None:
-            dst_vals = np.zeros(len(self._map)) + bad_val
+            dst_vals = self.empty_like_dst(src_values, fill_value=bad_val, dtype=float)
 
-        rtn = np.choose(
-            src_values.take(self._map) < bad_val, (src_values.take(self._map), dst_vals)
-        )
-        rtn[self._bad] = bad_val
-        dst_vals[:] = rtn
+        self.apply(src_values, dst_vals, bad_val=bad_val)
+
+        out = dst_vals.view()
+        out.shape = (-1, self.dst_count)
+        out[:, self.unmapped] = bad_val
 
-        return rtn
+        return dst_vals
 
     @staticmethod
     def test(dst_grid, src_grid):
         return all(np.diff(src_grid.get_offset()) > 2)
-
-    @property
-    def name(self):
-        return self._name
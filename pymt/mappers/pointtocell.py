@@ -1,71 +1,113 @@
 #! /bin/env python
 
-from collections import defaultdict
+from functools import partial
 
 import numpy as np
-from scipy.spatial import KDTree
-from six.moves import zip
 
-from .imapper import IGridMapper, IncompatibleGridError
+from .sparse import SparseGridMapper, as_sparse_operator, count_rows, reduce_rows
 
 # from .mapper import IncompatibleGridError
 
 
-def map_cells_to_points(coords, dst_grid, dst_point_ids, bad_val=-1):
-    src_x, src_y = coords
+def map_cells_to_points(coords, dst_grid, dst_point_ids=None, bad_val=-1):
+    """Find the cells of a grid that contain each point.
 
-    cell_to_point_id = defaultdict(list)
-    for (j, point_id) in enumerate(dst_point_ids):
-        for cell_id in dst_grid.get_shared_cells(point_id):
-            if dst_grid.is_in_cell(src_x[j], src_y[j], cell_id):
-                cell_to_point_id[cell_id].append(j)
+    Parameters
+    ----------
+    coords : tuple of ndarray
+        x and y coordinates of points.
+    dst_grid : grid_like
+        Grid whose cells are searched.
+    dst_point_ids : ndarray of int, optional
+        ID of the grid node nearest to each point.
+    bad_val : int, optional
+        Not used.
 
-    return cell_to_point_id
+    Returns
+    -------
+    tuple of ndarray of int
+        IDs of cells and the points that they contain, sorted by cell.
+    """
+    (src_x, src_y) = coords
 
+    (point_ids, cell_ids) = dst_grid.locate_points(src_x, src_y, near=dst_point_ids)
+    order = np.argsort(cell_ids, kind="mergesort")
 
-class PointToCell(IGridMapper):
+    return cell_ids[order], point_ids[order]
 
-    _name = "PointToCell"
 
-    def initialize(self, dest_grid, src_grid, **kwds):
-        if not self.test(dest_grid, src_grid):
-            raise IncompatibleGridError(dest_grid.name, src_grid.name)
-        src_x = src_grid.get_x()
-        src_y = src_grid.get_y()
+_REDUCERS = {
+    np.min: partial(reduce_rows, ufunc=np.minimum),
+    np.max: partial(reduce_rows, ufunc=np.maximum),
+    len: count_rows,
+    np.size: count_rows,
+}
+_REDUCERS.update(
+    {"min": _REDUCERS[np.min], "max": _REDUCERS[np.max], "count": count_rows}
+)
+
+
+class PointToCell(SparseGridMapper):
+
+    """Map values on points to the cells that contain them.
+
+    The mapping is stored as the rows of a sparse matrix (cell offsets
+    into an array of sorted point indices) so that the common reductions
+    (mean, sum, min, max and count) are computed for all cells at once.
+    Other reduction methods are applied one cell at a time.
+    """
 
-        tree = KDTree(list(zip(dest_grid.get_x(), dest_grid.get_y())))
-        (_, nearest_dest_id) = tree.query(list(zip(src_x, src_y)))
+    _name = "PointToCell"
 
-        self._map = map_cells_to_points(
-            (src_x, src_y), dest_grid, nearest_dest_id, bad_val=-1
+    def _build_operator(self, dest_grid, src_grid, **kwds):
+        (cell_ids, point_ids) = map_cells_to_points(
+            (src_grid.get_x(), src_grid.get_y()), dest_grid, bad_val=-1
         )
 
-        self._dst_cell_count = dest_grid.get_cell_count()
-        self._src_point_count = src_grid.get_point_count()
+        n_points = np.bincount(cell_ids, minlength=dest_grid.get_cell_count())
+        return as_sparse_operator(
+            cell_ids,
+            point_ids,
+            (dest_grid.get_cell_count(), src_grid.get_point_count()),
+            weights=1.0 / n_points[cell_ids],
+        )
 
     def run(self, src_values, **kwds):
         dst_vals = kwds.get("dst_vals", None)
         bad_val = kwds.get("bad_val", -999)
         method = kwds.get("method", np.mean)
 
-        if src_values.size != self._src_point_count:
+        if src_values.size != self.src_count and src_values.shape[-1] != self.src_count:
             raise ValueError("size mismatch between source and point count")
 
         if dst_vals is None:
-            dst_vals = np.array([bad_val] * self._dst_cell_count, dtype=np.float)
-        if dst_vals.size != self._dst_cell_count:
+            dst_vals = self.empty_like_dst(src_values, fill_value=bad_val, dtype=float)
+        if dst_vals.size != src_values.size // self.src_count * self.dst_count:
             raise ValueError("size mismatch between destination and cell count")
 
-        for (cell_id, point_ids) in self._map.items():
-            if all(src_values[point_ids] > bad_val):
-                dst_vals[cell_id] = method(src_values[point_ids])
+        if method in (np.mean, "mean"):
+            self.apply(src_values, dst_vals, bad_val=bad_val)
+        elif method in (np.sum, "sum"):
+            self.apply(src_values, dst_vals, bad_val=bad_val, operator=self._pattern)
+        elif method in _REDUCERS:
+            self.apply(src_values, dst_vals, bad_val=bad_val, reduce=_REDUCERS[method])
+        else:
+            self._run_method(src_values, dst_vals, bad_val, method)
 
         return dst_vals
 
+    def _run_method(self, src_values, dst_vals, bad_val, method):
+        src_values = src_values.reshape((-1, self.src_count))
+        dst_vals = dst_vals.view()
+        dst_vals.shape = (-1, self.dst_count)
+
+        indptr, indices = self._operator.indptr, self._operator.indices
+        for cell_id in np.where(np.diff(indptr) > 0)[0]:
+            point_ids = indices[indptr[cell_id] : indptr[cell_id + 1]]
+            for src, dst in zip(src_values, dst_vals):
+                if all(src[point_ids] > bad_val):
+                    dst[cell_id] = method(src[point_ids])
+
     @staticmethod
     def test(dst_grid, src_grid):
         return all(np.diff(dst_grid.get_offset()) > 2) and src_grid is not None
-
-    @property
-    def name(self):
-        return self._name
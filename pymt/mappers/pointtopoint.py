@@ -3,7 +3,7 @@
 import numpy as np
 from scipy.spatial import KDTree
 
-from .imapper import IGridMapper, IncompatibleGridError
+from .sparse import SparseGridMapper, as_sparse_operator
 
 # from .mapper import IncompatibleGridError
 
@@ -55,7 +55,7 @@ def copy_good_values(src, dst, bad_val=-999):
     return dst
 
 
-class NearestVal(IGridMapper):
+class NearestVal(SparseGridMapper):
     """
     Examples
     --------
@@ -83,16 +83,19 @@ class NearestVal(IGridMapper):
             Grid from which points are taken.
         var_names : iterable of tuples (optional)
             Iterable of (*dest*, *src*) variable names.
+        cache_dir : str (optional)
+            Folder of cached mapping operators.
         """
         var_names = kwds.get("var_names", None)
-        if var_names is None:
-            var_names = []
-
-        if len(var_names) > 1:
+        if var_names is not None and len(var_names) > 1:
             raise ValueError("only 0 or 1 var_names allowed")
 
-        if not NearestVal.test(dest_grid, src_grid):
-            raise IncompatibleGridError(dest_grid.name, src_grid.name)
+        super(NearestVal, self).initialize(dest_grid, src_grid, **kwds)
+
+    def _build_operator(self, dest_grid, src_grid, **kwds):
+        var_names = kwds.get("var_names", None)
+        if var_names is None:
+            var_names = []
 
         if len(var_names) == 0:
             (x, y) = src_grid.get_x().flat, src_grid.get_y().flat
@@ -108,37 +111,14 @@ class NearestVal(IGridMapper):
             dst_name, src_name = var_names[0]
             (x, y) = (dest_grid.get_x(dst_name).flat, dest_grid.get_y(dst_name).flat)
 
-        (_, self._nearest_src_id) = tree.query(list(zip(x, y)))
-
-    def run(self, src_values, **kwds):
-        """Map source values onto destination values.
+        (_, nearest_src_id) = tree.query(list(zip(x, y)))
 
-        Parameters
-        ----------
-        src_values : ndarray
-            Source values at points.
-        dst_vals : ndarray (optional)
-            Destination array to put mapped values.
-
-        Returns
-        -------
-        dest : ndarray
-            The (possibly newly-created) destination array.
-        """
-        dst_vals = kwds.get("dst_vals", None)
-        bad_val = kwds.get("bad_val", -999)
-
-        if dst_vals is None:
-            dst_vals = np.zeros(len(self._nearest_src_id), dtype=src_values.dtype)
-        elif not isinstance(dst_vals, np.ndarray):
-            raise TypeError("Destination array must be a numpy array")
-
-        copy_good_values(
-            src_values.flat[self._nearest_src_id], dst_vals, bad_val=bad_val
+        return as_sparse_operator(
+            np.arange(len(nearest_src_id)),
+            nearest_src_id,
+            (len(nearest_src_id), tree.n),
         )
 
-        return dst_vals
-
     @staticmethod
     def test(dst_grid, src_grid):
         """Test if grids are compatible with this mapper.
@@ -151,8 +131,3 @@ class NearestVal(IGridMapper):
             Grid from which points are taken.
         """
         return dst_grid is not None and src_grid is not None
-
-    @property
-    def name(self):
-        """Name of the grid mapper."""
-        return self._name
@@ -0,0 +1,383 @@
+#! /bin/env python
+"""Grid mappers that are expressed as sparse linear operators.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.mappers.sparse import SparseGridMapper, as_sparse_operator
+
+A mapper that averages pairs of source values,
+
+>>> mapper = SparseGridMapper.from_operator(
+...     as_sparse_operator([0, 0, 1, 1], [0, 1, 2, 3], (2, 4), weights=.5)
+... )
+>>> mapper.run(np.arange(4.))
+array([ 0.5,  2.5])
+
+Several variables that are defined on the same grids are mapped
+together with a single operation.
+
+>>> mapper.run(np.arange(8.).reshape((2, 4)))
+array([[ 0.5,  2.5],
+       [ 4.5,  6.5]])
+
+Mappers can be chained into a single operator.
+
+>>> double = SparseGridMapper.from_operator(
+...     as_sparse_operator([0, 1], [0, 1], (2, 2), weights=2.)
+... )
+>>> double.compose(mapper).run(np.arange(4.))
+array([ 1.,  5.])
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from .cache import get_cache_dir, load_operator, mapping_key, save_operator
+from .imapper import IGridMapper, IncompatibleGridError
+
+
+def as_sparse_operator(rows, cols, shape, weights=1.0):
+    """Create a sparse matrix that maps source values to a destination.
+
+    Parameters
+    ----------
+    rows : array_like of int
+        Destination element of each entry.
+    cols : array_like of int
+        Source element of each entry.
+    shape : tuple of int
+        Number of destination and source elements.
+    weights : array_like or float, optional
+        Weight of each entry.
+
+    Returns
+    -------
+    csr_matrix
+        The mapping operator.
+
+    Examples
+    --------
+    >>> from pymt.mappers.sparse import as_sparse_operator
+    >>> op = as_sparse_operator([0, 1, 1], [2, 0, 1], (3, 3))
+    >>> op.toarray()
+    array([[ 0.,  0.,  1.],
+           [ 1.,  1.,  0.],
+           [ 0.,  0.,  0.]])
+    """
+    rows = np.asarray(rows, dtype=int).reshape((-1,))
+    cols = np.asarray(cols, dtype=int).reshape((-1,))
+    weights = np.broadcast_to(np.asarray(weights, dtype=float), rows.shape)
+
+    return csr_matrix((weights, (rows, cols)), shape=shape)
+
+
+def reduce_rows(operator, values, ufunc):
+    """Reduce the source values of each row of an operator.
+
+    Parameters
+    ----------
+    operator : csr_matrix
+        Mapping operator. Only its sparsity pattern is used.
+    values : ndarray
+        Source values of shape *(n_src,)* or *(n_src, n_vars)*.
+    ufunc : ufunc
+        Binary ufunc used to reduce the values (*np.minimum*, for example).
+
+    Returns
+    -------
+    ndarray
+        Reduced values of shape *(n_dst,)* or *(n_dst, n_vars)*. Rows with
+        no source values are zero.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.mappers.sparse import as_sparse_operator, reduce_rows
+    >>> op = as_sparse_operator([0, 0, 2, 2, 2], [0, 1, 1, 2, 3], (3, 4))
+    >>> reduce_rows(op, np.array([4., 3., 2., 1.]), np.maximum)
+    array([ 4.,  0.,  3.])
+    """
+    indptr = operator.indptr
+    (rows,) = np.where(np.diff(indptr) > 0)
+
+    reduced = np.zeros((operator.shape[0],) + values.shape[1:], dtype=values.dtype)
+    if len(rows) > 0:
+        reduced[rows] = ufunc.reduceat(values[operator.indices], indptr[rows], axis=0)
+
+    return reduced
+
+
+def count_rows(operator, values):
+    """Count the source values of each row of an operator.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.mappers.sparse import as_sparse_operator, count_rows
+    >>> op = as_sparse_operator([0, 0, 2, 2, 2], [0, 1, 1, 2, 3], (3, 4))
+    >>> count_rows(op, np.array([4., 3., 2., 1.])).tolist()
+    [2, 0, 3]
+    """
+    counts = np.diff(operator.indptr)
+    return np.broadcast_to(
+        counts.reshape((-1,) + (1,) * (values.ndim - 1)),
+        (len(counts),) + values.shape[1:],
+    )
+
+
+class SparseGridMapper(IGridMapper):
+    """Grid mapper that maps values with a sparse matrix.
+
+    Subclasses compile the mapping between a source and destination grid
+    into a `csr_matrix` whose rows are destination elements and whose
+    columns are source elements. Mapping values is then a single
+    matrix-vector (or, for several variables, matrix-matrix) product.
+    """
+
+    _name = "Sparse"
+
+    def __init__(self):
+        self._operator = None
+        self._pattern = None
+        self._unmapped = None
+
+    @classmethod
+    def from_operator(cls, operator, name=None):
+        """Create a mapper from a mapping operator.
+
+        Parameters
+        ----------
+        operator : sparse matrix
+            Operator of shape *(n_dst, n_src)*.
+        name : str, optional
+            Name of the mapper.
+
+        Returns
+        -------
+        SparseGridMapper
+            The new mapper.
+        """
+        mapper = cls()
+        mapper._set_operator(operator)
+        if name is not None:
+            mapper._name = name
+        return mapper
+
+    @staticmethod
+    def test(dst_grid, src_grid):
+        """Test if grids are compatible with this mapper."""
+        return dst_grid is not None and src_grid is not None
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Initialize the mapper to map from a source grid to a destination
+        grid.
+
+        If a cache folder is given, the mapping operator is read from
+        the cache if the two grids have been mapped before and, if not,
+        computed and saved there.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which values are mapped.
+        src_grid : grid_like
+            Grid from which values are mapped.
+        cache_dir : str, optional
+            Folder of cached mapping operators. If not provided, use the
+            folder given by the ``PYMT_MAPPER_CACHE`` environment variable.
+        """
+        cache_dir = kwds.pop("cache_dir", None) or get_cache_dir()
+
+        if not self.test(dest_grid, src_grid):
+            raise IncompatibleGridError(dest_grid.name, src_grid.name)
+
+        if cache_dir is None:
+            key = None
+        else:
+            key = mapping_key(self.name, dest_grid, src_grid, **kwds)
+
+        operator = load_operator(key, cache_dir=cache_dir)
+        if operator is None:
+            operator = self._build_operator(dest_grid, src_grid, **kwds)
+            save_operator(key, operator, cache_dir=cache_dir)
+
+        self._set_operator(operator)
+
+    def _build_operator(self, dest_grid, src_grid, **kwds):
+        raise NotImplementedError("_build_operator")
+
+    def _set_operator(self, operator):
+        self._operator = csr_matrix(operator)
+        self._operator.sort_indices()
+        self._pattern = self._operator.copy()
+        self._pattern.data = np.ones_like(self._pattern.data, dtype=np.intc)
+        self._unmapped = np.diff(self._operator.indptr) == 0
+
+    @property
+    def name(self):
+        """Name of the grid mapper."""
+        return self._name
+
+    @property
+    def operator(self):
+        """Sparse matrix that maps source values to destination values."""
+        return self._operator
+
+    @property
+    def src_count(self):
+        """Number of source elements."""
+        return self._operator.shape[1]
+
+    @property
+    def dst_count(self):
+        """Number of destination elements."""
+        return self._operator.shape[0]
+
+    @property
+    def unmapped(self):
+        """Mask of destination elements that have no source elements."""
+        return self._unmapped
+
+    def transpose(self):
+        """Mapper that maps values in the reverse direction."""
+        return SparseGridMapper.from_operator(
+            self._operator.T, name="{name}.T".format(name=self.name)
+        )
+
+    def compose(self, other):
+        """Chain another mapper before this one.
+
+        Parameters
+        ----------
+        other : SparseGridMapper
+            Mapper whose destination is the source of this mapper.
+
+        Returns
+        -------
+        SparseGridMapper
+            A mapper that applies *other* and then this mapper.
+        """
+        if other.dst_count != self.src_count:
+            raise ValueError("size mismatch between mappers")
+        return SparseGridMapper.from_operator(
+            self._operator.dot(other.operator),
+            name="{0}.{1}".format(self.name, other.name),
+        )
+
+    @staticmethod
+    def _is_bad(values, bad_val):
+        return ~(values > bad_val)
+
+    def apply(self, src_values, dst_vals, bad_val=None, operator=None, reduce=None):
+        """Map source values into an array of destination values.
+
+        Destination values that have no source elements, or that have at
+        least one bad source value, are left unchanged.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Source values. To map several variables at once, the array is
+            of shape *(n_vars, n_src)*.
+        dst_vals : ndarray
+            Destination array to put mapped values.
+        bad_val : float, optional
+            Value at or below which a source value (or one that is NaN) is
+            bad.
+        operator : sparse matrix, optional
+            Operator to use in place of the mapper's own operator. It must
+            have the same sparsity pattern.
+        reduce : callable, optional
+            Function, ``reduce(operator, values)``, that reduces the source
+            values of each destination element. If not provided, multiply
+            the values by the operator.
+
+        Returns
+        -------
+        ndarray
+            The destination array.
+        """
+        if operator is None:
+            operator = self._operator
+
+        src_values = np.asarray(src_values)
+        if src_values.size == self.src_count:
+            src = src_values.reshape((self.src_count,))
+            shape = (self.dst_count,)
+        elif src_values.ndim == 2 and src_values.shape[1] == self.src_count:
+            src = src_values.T
+            shape = (src_values.shape[0], self.dst_count)
+        else:
+            raise ValueError("size mismatch between source and operator")
+
+        if dst_vals.size != np.prod(shape):
+            raise ValueError("size mismatch between destination and operator")
+
+        if reduce is None:
+            mapped = operator.dot(src)
+        else:
+            mapped = reduce(operator, src)
+        keep = self.unmapped.reshape((-1, 1) if src.ndim == 2 else (-1,))
+        if bad_val is not None:
+            keep = keep | (
+                self._pattern.dot(self._is_bad(src, bad_val).astype(np.intc)) > 0
+            )
+
+        out = dst_vals.view()
+        out.shape = shape
+        np.copyto(out, mapped.T, casting="unsafe", where=~keep.T)
+
+        return dst_vals
+
+    def run(self, src_values, **kwds):
+        """Map source values onto destination values.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Source values.
+        dst_vals : ndarray (optional)
+            Destination array to put mapped values.
+        bad_val : float (optional)
+            Value at or below which a source value (or one that is NaN) is
+            bad.
+
+        Returns
+        -------
+        dest : ndarray
+            The (possibly newly-created) destination array.
+        """
+        dst_vals = kwds.get("dst_vals", None)
+        bad_val = kwds.get("bad_val", -999)
+
+        if dst_vals is None:
+            dst_vals = self.empty_like_dst(src_values)
+        elif not isinstance(dst_vals, np.ndarray):
+            raise TypeError("Destination array must be a numpy array")
+
+        return self.apply(src_values, dst_vals, bad_val=bad_val)
+
+    def empty_like_dst(self, src_values, fill_value=0, dtype=None):
+        """Create an array to hold mapped destination values.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Source values to be mapped.
+        fill_value : float, optional
+            Initial value of the destination array.
+        dtype : data-type, optional
+            Data type of the destination array. If not provided, use that
+            of the source values.
+
+        Returns
+        -------
+        ndarray
+            The destination array.
+        """
+        if src_values.size == self.src_count:
+            shape = (self.dst_count,)
+        else:
+            shape = (len(src_values), self.dst_count)
+        return np.full(shape, fill_value, dtype=dtype or src_values.dtype)
@@ -4,13 +4,16 @@ import six
 from six.moves.configparser import ConfigParser
 
 from ..framework import services
-from ..printers.nc.database import Database as NcDatabase
+from ..printers.nc.database import StreamingDatabase as NcStreamingDatabase
 
 # from ..printers.vtk.vtu import Database as VtkDatabase
 from ..utils.prefix import names_with_prefix, strip_prefix
 from .utils import (
     construct_file_name,
     construct_port_as_field,
+    get_data_centering,
+    get_port_value,
+    mesh_size_has_changed,
     next_unique_file_name,
     reconstruct_port_as_field,
 )
@@ -19,8 +22,16 @@ from .utils import (
 class PortPrinter(object):
     _format = ""
     _printer_class = None
+    _printer_options = ()
+
+    def __init__(self, port, var_name, filename=None, **kwds):
+        for name in kwds:
+            if name not in self._printer_options:
+                raise TypeError(
+                    "%s: unexpected option for %s printer" % (name, self._format)
+                )
+        self._options = kwds
 
-    def __init__(self, port, var_name, filename=None):
         if isinstance(port, six.string_types):
             self._port = services.get_component_instance(port)
         else:
@@ -31,7 +42,14 @@ class PortPrinter(object):
             self._filename = var_name
 
         self._field = construct_port_as_field(self._port, var_name)
-        self._printer = self._printer_class()  # pylint: disable=not-callable
+        self._printer = self._new_printer()
+
+    def _new_printer(self):
+        return self._printer_class(**self._options)  # pylint: disable=not-callable
+
+    @property
+    def port(self):
+        return self._port
 
     @property
     def var_name(self):
@@ -50,12 +68,26 @@ class PortPrinter(object):
 
     def close(self):
         self._printer.close()
-        self._printer = self._printer_class()  # pylint: disable=not-callable
+        self._printer = self._new_printer()
 
-    def write(self):
-        self.resync_field_to_port()
+    def write(self, values=None):
+        """Write the port's current values, or *values*, to the file."""
+        if values is None:
+            self.resync_field_to_port()
+        else:
+            if self.mesh_size_has_changed(values):
+                self._field = construct_port_as_field(self._port, self._var_name)
+            self._field.add_field(
+                self._var_name,
+                values,
+                centering=get_data_centering(self._field, values),
+            )
         self._printer.write(self._field)
 
+    def mesh_size_has_changed(self, values):
+        """Check if *values* no longer fit on the printer's mesh."""
+        return mesh_size_has_changed(self._field, values)
+
     def resync_field_to_port(self):
         self._field = reconstruct_port_as_field(self._port, self._field)
 
@@ -95,8 +127,11 @@ class PortPrinter(object):
             printer_class = _FORMAT_TO_PRINTER[d["format"]]
         except KeyError:
             raise ValueError("%s: unknown printer format" % d["format"])
+        options = dict(
+            (name, d[name]) for name in printer_class._printer_options if name in d
+        )
         return printer_class(
-            d["port"], d["name"], filename=d.get("filename", d["name"])
+            d["port"], d["name"], filename=d.get("filename", d["name"]), **options
         )
 
 
@@ -106,8 +141,48 @@ class PortPrinter(object):
 
 
 class NcPortPrinter(PortPrinter):
+
+    """Print port values to a NetCDF file.
+
+    The file, its mesh and variables are created by the first write. After
+    that, each write copies the port's current values straight into the
+    next time slice of the open file. The port's mesh is only rebuilt (and
+    a new file started) if its size changes.
+
+    Parameters
+    ----------
+    port : str or port-like
+        Port (or name of the port) to print.
+    var_name : str
+        Name of the variable to print.
+    filename : str, optional
+        Name of the file to print to. By default, *var_name*.
+    buffer_steps : int, optional
+        Number of time slices to collect before writing them to the file
+        as a single block.
+    zlib, shuffle, complevel, chunksizes, least_significant_digit : optional
+        Compression and chunking of the printed variable (see
+        :class:`~pymt.printers.nc.database.StreamingDatabase`).
+    """
+
     _format = "nc"
-    _printer_class = NcDatabase
+    _printer_class = NcStreamingDatabase
+    _printer_options = (
+        "buffer_steps",
+        "zlib",
+        "shuffle",
+        "complevel",
+        "chunksizes",
+        "least_significant_digit",
+    )
+
+    def write(self, values=None):
+        if values is None:
+            values = get_port_value(self._port, self._var_name)
+        if self._printer.streaming and not self.mesh_size_has_changed(values):
+            self._printer.append({self._var_name: values})
+        else:
+            super(NcPortPrinter, self).write(values)
 
 
 _FORMAT_TO_PRINTER = {
@@ -201,6 +201,29 @@ def _construct_port_as_unstructured_field(port, grid_id):
     return UnstructuredField(x, y, c, o)
 
 
+def get_port_value(port, var_name):
+    """Get the values of a port variable, without a copy if possible.
+
+    Parameters
+    ----------
+    port : port_like
+        A port.
+    var_name : str
+        Name of the variable.
+
+    Returns
+    -------
+    ndarray
+        A view of the port's values, if the port supports it. Otherwise,
+        a copy of the values.
+    """
+    try:
+        get_value = port.get_value_view
+    except AttributeError:
+        get_value = port.get_value
+    return get_value(var_name)
+
+
 def construct_port_as_field(port, var_name):
     """Create a field object from a port.
 
@@ -216,7 +239,7 @@ def construct_port_as_field(port, var_name):
     field_like
         A newly created field that contains the data for *var_name*.
     """
-    data_array = port.get_value(var_name)
+    data_array = get_port_value(port, var_name)
     if data_array is None:
         raise ValueError(var_name)
 
@@ -278,7 +301,7 @@ def reconstruct_port_as_field(port, field):
         A (possibley) newly created field that contains the data for *var_name*.
     """
     for var_name in field.keys():
-        data_array = port.get_value(var_name)
+        data_array = get_port_value(port, var_name)
 
         if mesh_size_has_changed(field, data_array):
             field = construct_port_as_field(port, var_name)
@@ -2,8 +2,10 @@
 
 import os
 
+import numpy as np
+
 from .ugrid import close as ugrid_close
-from .write import field_tofile
+from .write import field_tofile, field_tostream
 
 
 class IDatabase(object):
@@ -77,3 +79,148 @@ class Database(IDatabase):
             self._count += 1
 
         return next_file_name
+
+
+class StreamingDatabase(Database):
+
+    """A database that keeps its file open and writes straight into it.
+
+    The file, with its mesh and variables, is created on the first write.
+    Later writes only append a time slice of data to the open file,
+    unless the size of the mesh changes, in which case a new file is
+    started.
+
+    Parameters
+    ----------
+    buffer_steps : int, optional
+        Number of time slices to collect before writing them to the file
+        as a single block. Collected slices are also written when the
+        database is closed, flushed, or the size of the mesh changes.
+    zlib : bool, optional
+        Compress data variables with zlib.
+    shuffle : bool, optional
+        Apply the HDF5 shuffle filter before compressing.
+    complevel : int, optional
+        Compression level, from 1 (fastest) to 9 (smallest).
+    chunksizes : sequence of int, optional
+        Chunk shape of the data variables, with the number of time slices
+        first (one time slice by a spatial tile, for instance). The time
+        variable is chunked with the same number of time slices.
+    least_significant_digit : int, optional
+        Quantize data so that it is only accurate to this power of ten
+        (1 keeps one digit after the decimal point), which improves
+        compression.
+    """
+
+    def __init__(
+        self,
+        buffer_steps=1,
+        zlib=False,
+        shuffle=True,
+        complevel=4,
+        chunksizes=None,
+        least_significant_digit=None,
+    ):
+        buffer_steps = int(buffer_steps)
+        if buffer_steps < 1:
+            raise ValueError("buffer_steps must be at least 1")
+        self._stream = None
+        self._buffer_steps = buffer_steps
+        self._encoding = {
+            "zlib": bool(zlib),
+            "shuffle": bool(shuffle),
+            "complevel": int(complevel),
+        }
+        if chunksizes is not None:
+            self._encoding["chunksizes"] = tuple(int(size) for size in chunksizes)
+        if least_significant_digit is not None:
+            self._encoding["least_significant_digit"] = int(least_significant_digit)
+        self._blocks = {}
+        self._times = []
+        super(StreamingDatabase, self).__init__()
+
+    @property
+    def streaming(self):
+        """Check if a file is open for appending data."""
+        return self._stream is not None
+
+    @property
+    def buffer_steps(self):
+        """Number of time slices written to the file as a block."""
+        return self._buffer_steps
+
+    @property
+    def encoding(self):
+        """Compression and chunking options of the data variables."""
+        return dict(self._encoding)
+
+    def write(self, field, **kwds):
+        time = kwds.get("time", None)
+        if self.streaming and not field_changed_size(
+            field, self._point_count, self._cell_count
+        ):
+            values = dict(field.get_point_fields())
+            values.update(field.get_cell_fields())
+            self.append(values, time=time)
+        else:
+            if self.streaming:
+                self.flush()
+                self._stream.close()
+                self._path = self._next_file_name()
+            self._blocks.clear()
+            self._stream = field_tostream(
+                field, self._path, time=time, encoding=self._encoding
+            )
+            self._point_count = field.get_point_count()
+            self._cell_count = field.get_cell_count()
+
+    def append(self, values, time=None):
+        """Append a time slice of data to the open file.
+
+        Parameters
+        ----------
+        values : dict
+            Values of the variables, on the mesh of the last field written.
+        time : float, optional
+            Time of the slice.
+        """
+        if not self.streaming:
+            raise RuntimeError("no field has been written to the database")
+
+        if self._buffer_steps == 1:
+            self._stream.append(values, time=time)
+            return
+
+        row = len(self._times)
+        for (name, array) in values.items():
+            array = np.asarray(array)
+            try:
+                block = self._blocks[name]
+            except KeyError:
+                block = None
+            if block is None or block.shape[1] != array.size:
+                block = np.empty((self._buffer_steps, array.size), dtype=array.dtype)
+                self._blocks[name] = block
+            block[row] = array.reshape(-1)
+        self._times.append(time)
+
+        if len(self._times) == self._buffer_steps:
+            self.flush()
+
+    def flush(self):
+        """Write any collected time slices to the file."""
+        n_rows = len(self._times)
+        if self.streaming and n_rows > 0:
+            self._stream.append_block(
+                dict((name, block[:n_rows]) for (name, block) in self._blocks.items()),
+                times=self._times,
+            )
+        self._times = []
+
+    def close(self):
+        if self._stream is not None:
+            self.flush()
+            self._stream.close()
+            self._stream = None
+        self._blocks.clear()
+        super(StreamingDatabase, self).close()
@@ -1,6 +1,8 @@
 #! /usr/bin/env python
 import os
 
+import numpy as np
+
 from ...grids import utils as gutils
 from .constants import _NP_TO_NC_TYPE, open_netcdf
 
@@ -23,11 +25,20 @@ def close(path):
 
 class NetcdfField(object):
     def __init__(
-        self, path, field, fmt="NETCDF4", append=False, time=None, keep_open=False
+        self,
+        path,
+        field,
+        fmt="NETCDF4",
+        append=False,
+        time=None,
+        keep_open=False,
+        stream=False,
+        encoding=None,
     ):
         path = os.path.abspath(path)
         self._path = path
         self._field = field
+        self._encoding = dict(encoding or {})
 
         if path in _OPENED_FILES and not os.path.isfile(path):
             close(path)
@@ -37,12 +48,15 @@ class NetcdfField(object):
         else:
             self._root = open_netcdf(path, mode="w", fmt=fmt, append=append)
 
-        self._set_mesh_topology()
+        if not self.has_mesh:
+            self._set_mesh_topology()
         self._set_node_variable_data()
         self._set_face_variable_data()
         self._set_time_variable(now=time)
 
-        if keep_open:
+        if stream:
+            pass
+        elif keep_open:
             _OPENED_FILES[path] = self._root
         else:
             self.close()
@@ -62,10 +76,56 @@ class NetcdfField(object):
         raise NotImplementedError("face_data_dimensions")
 
     def close(self):
-        if self._path in _OPENED_FILES:
+        if _OPENED_FILES.get(self._path) is self._root:
             del _OPENED_FILES[self._path]
         self._root.close()
 
+    def append(self, values, time=None):
+        """Append a time slice of data to the open file.
+
+        Parameters
+        ----------
+        values : dict
+            Arrays of values of the field's variables.
+        time : float, optional
+            Time of the slice. By default, the index of the slice.
+        """
+        n_times = self.time_count
+        for (var_name, array) in values.items():
+            variable = self.data_variable(var_name)
+            variable[n_times] = np.ascontiguousarray(array).reshape(variable.shape[1:])
+        self.data_variable("time")[n_times] = n_times if time is None else time
+
+    def append_block(self, values, times=None):
+        """Append a block of time slices of data to the open file.
+
+        Each variable is written with a single assignment to a slab of
+        the file, rather than one slice at a time.
+
+        Parameters
+        ----------
+        values : dict
+            Arrays of values of the field's variables, with one row for
+            each time slice.
+        times : sequence of float, optional
+            Times of the slices. By default (or for times that are `None`),
+            the index of the slice.
+        """
+        t0 = self.time_count
+        n_times = 0 if times is None else len(times)
+        for (var_name, block) in values.items():
+            variable = self.data_variable(var_name)
+            n_times = len(block)
+            variable[t0 : t0 + n_times] = np.ascontiguousarray(block).reshape(
+                (n_times,) + variable.shape[1:]
+            )
+
+        if times is None:
+            times = [None] * n_times
+        self.data_variable("time")[t0 : t0 + n_times] = [
+            t0 + offset if time is None else time for (offset, time) in enumerate(times)
+        ]
+
     @property
     def type(self):
         return "unknown"
@@ -117,6 +177,11 @@ class NetcdfField(object):
         except KeyError:
             return 0
 
+    @property
+    def has_mesh(self):
+        """Check if the mesh has already been written to the file."""
+        return self.has_variable("mesh")
+
     def has_dimension(self, name):
         return name in self._root.dimensions
 
@@ -131,8 +196,18 @@ class NetcdfField(object):
             pass
 
     def create_variable(self, name, *args, **kwds):
+        """Create a variable, if it does not already exist.
+
+        Returns
+        -------
+        bool
+            `True` if the variable was created.
+        """
         if not self.has_variable(name):
             self._root.createVariable(name, *args, **kwds)
+            return True
+        else:
+            return False
 
     def set_variable(self, name, *args, **kwds):
         if len(args) not in (0, 1):
@@ -145,15 +220,15 @@ class NetcdfField(object):
             variable.setncattr(attr, value)
 
         if len(args) > 0:
-            array = args[0]
+            array = np.ascontiguousarray(args[0])
             if "time" in variable.dimensions:
                 n_times = self.time_count
                 if array.size > 1:
-                    variable[n_times, :] = array.flat
+                    variable[n_times] = array.reshape(variable.shape[1:])
                 else:
-                    variable[n_times] = array[0]
+                    variable[n_times] = array.reshape(-1)[0]
             else:
-                variable[:] = array.flat
+                variable[:] = array.reshape(variable.shape)
 
     def data_variable(self, name):
         return self.root.variables[name]
@@ -187,12 +262,54 @@ class NetcdfField(object):
         self._set_mesh_coordinate_data()
         self._set_face_node_connectivity_data()
 
+    def data_variable_options(self, dimensions):
+        """Options used to create a data variable with the given dimensions.
+
+        These are the field's *encoding* (compression and chunking
+        options of :meth:`netCDF4.Dataset.createVariable`). Chunk sizes
+        are clipped to the sizes of fixed dimensions.
+
+        Parameters
+        ----------
+        dimensions : sequence of str
+            Names of the variable's dimensions.
+
+        Returns
+        -------
+        dict
+            Keywords for :meth:`create_variable`.
+        """
+        options = dict(self._encoding)
+        chunksizes = options.pop("chunksizes", None)
+        if chunksizes is not None:
+            if len(chunksizes) != len(dimensions):
+                raise ValueError(
+                    "chunksizes must have one size for each of the "
+                    "dimensions %s" % ", ".join(dimensions)
+                )
+            options["chunksizes"] = tuple(
+                int(size)
+                if self._root.dimensions[dim].isunlimited()
+                else min(int(size), len(self._root.dimensions[dim]))
+                for (dim, size) in zip(dimensions, chunksizes)
+            )
+        return options
+
     def _set_time_variable(self, now=None, units="days", reference="00:00:00 UTC"):
-        self.create_variable("time", "f8", ("time",))
+        options = {}
+        if self._encoding.get("chunksizes") is not None:
+            options["chunksizes"] = (int(self._encoding["chunksizes"][0]),)
+
+        if self.create_variable("time", "f8", ("time",), **options):
+            self.set_variable(
+                "time",
+                attrs={
+                    "units": " ".join([units, "since", reference]),
+                    "long_name": "time",
+                },
+            )
 
         time = self.data_variable("time")
-        time.units = " ".join([units, "since", reference])
-        time.long_name = "time"
 
         if now is not None:
             time[self.time_count - 1] = now
@@ -206,42 +323,46 @@ class NetcdfField(object):
     def _set_node_variable_data(self):
         point_fields = self.field.get_point_fields()
         for (var_name, array) in point_fields.items():
-            self.create_variable(
+            dimensions = ["time"] + list(self.node_data_dimensions)
+            if self.create_variable(
                 var_name,
                 _NP_TO_NC_TYPE[str(array.dtype)],
-                ["time"] + list(self.node_data_dimensions),
-            )
-            self.set_variable(
-                var_name,
-                array,
-                attrs={
-                    "units": self.field.get_field_units(var_name),
-                    "standard_name": var_name,
-                    "long_name": var_name,
-                    "location": "node",
-                    "coordinates": " ".join(self.node_data_dimensions),
-                },
-            )
+                dimensions,
+                **self.data_variable_options(dimensions)
+            ):
+                self.set_variable(
+                    var_name,
+                    attrs={
+                        "units": self.field.get_field_units(var_name),
+                        "standard_name": var_name,
+                        "long_name": var_name,
+                        "location": "node",
+                        "coordinates": " ".join(self.node_data_dimensions),
+                    },
+                )
+            self.set_variable(var_name, array)
 
     def _set_face_variable_data(self):
         face_fields = self.field.get_cell_fields()
         for (var_name, array) in face_fields.items():
-            self.create_variable(
+            dimensions = ["time"] + list(self.face_data_dimensions)
+            if self.create_variable(
                 var_name,
                 _NP_TO_NC_TYPE[str(array.dtype)],
-                ["time"] + list(self.face_data_dimensions),
-            )
-            self.set_variable(
-                var_name,
-                array,
-                attrs={
-                    "units": self.field.get_field_units(var_name),
-                    "standard_name": var_name,
-                    "long_name": var_name,
-                    "location": "face",
-                    "coordinates": " ".join(self.node_data_dimensions),
-                },
-            )
+                dimensions,
+                **self.data_variable_options(dimensions)
+            ):
+                self.set_variable(
+                    var_name,
+                    attrs={
+                        "units": self.field.get_field_units(var_name),
+                        "standard_name": var_name,
+                        "long_name": var_name,
+                        "location": "face",
+                        "coordinates": " ".join(self.node_data_dimensions),
+                    },
+                )
+            self.set_variable(var_name, array)
 
     def _set_face_node_connectivity_data(self):
         pass
@@ -33,9 +33,42 @@ def field_tofile(
     args = (path, field)
     kwds = dict(append=append, fmt=fmt, time=time, keep_open=True)
 
+    netcdf_field_class(field)(*args, **kwds)
+
+
+def field_tostream(field, path, fmt="NETCDF4", time=None, encoding=None):
+    """Write a field to a new file that is kept open for appending.
+
+    Parameters
+    ----------
+    field : field_like
+        Field to write.
+    path : str
+        Path to the file.
+    fmt : str, optional
+        NetCDF format.
+    time : float, optional
+        Time of the field's data.
+    encoding : dict, optional
+        Compression and chunking options for the data variables (see
+        :meth:`NetcdfField.data_variable_options`).
+
+    Returns
+    -------
+    NetcdfField
+        The open file. Use its *append* method to add more data and its
+        *close* method when done.
+    """
+    return netcdf_field_class(field)(
+        path, field, fmt=fmt, time=time, stream=True, encoding=encoding
+    )
+
+
+def netcdf_field_class(field):
+    """The NetCDF writer for a field's type of grid."""
     if is_rectilinear(field, strict=False):
-        NetcdfRectilinearField(*args, **kwds)
+        return NetcdfRectilinearField
     elif is_structured(field, strict=False):
-        NetcdfStructuredField(*args, **kwds)
+        return NetcdfStructuredField
     else:
-        NetcdfUnstructuredField(*args, **kwds)
+        return NetcdfUnstructuredField
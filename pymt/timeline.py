@@ -69,12 +69,17 @@ one-timer
 ('event', 0)
 ('event', 2)
 """
-import bisect
+import heapq
+import itertools
 
 
 class Timeline(object):
     """Create a timeline of events.
 
+    Events are kept in a binary heap ordered by the time of the event
+    and, for events that happen at the same time, by the order in which
+    they were (re)scheduled.
+
     Parameters
     ----------
     events : dict-like
@@ -129,9 +134,8 @@ class Timeline(object):
 
         self._time = float(start)
 
-        self._events = []
-        self._times = []
-        self._intervals = []
+        self._queue = []
+        self._counter = itertools.count()
 
         self.add_recurring_events(events)
 
@@ -166,7 +170,7 @@ class Timeline(object):
         0.0
         """
         try:
-            return self._events[0]
+            return self._queue[0][2]
         except IndexError:
             raise IndexError("empty timeline")
 
@@ -181,7 +185,7 @@ class Timeline(object):
         1.0
         """
         try:
-            return self._times[0]
+            return self._queue[0][0]
         except IndexError:
             raise IndexError("empty timeline")
 
@@ -198,7 +202,7 @@ class Timeline(object):
         >>> sorted(events)
         ['an event', 'another event']
         """
-        return set(self._events)
+        return set(item[2] for item in self._queue)
 
     def add_recurring_events(self, events):
         """Add a series of recurring events to the timeline.
@@ -293,11 +297,7 @@ class Timeline(object):
         self._insert_event(event, time, None)
 
     def _insert_event(self, event, time, interval):
-        index = bisect.bisect_right(self._times, time)
-
-        self._times.insert(index, time)
-        self._events.insert(index, event)
-        self._intervals.insert(index, interval)
+        heapq.heappush(self._queue, (time, next(self._counter), event, interval))
 
     def pop(self):
         """Pop the next event from the timeline.
@@ -309,18 +309,16 @@ class Timeline(object):
         'hello'
         """
         try:
-            (event, time, interval) = (
-                self._events.pop(0),
-                self._times.pop(0),
-                self._intervals.pop(0),
-            )
+            (time, _, event, interval) = self._queue[0]
         except IndexError:
             raise IndexError("pop from empty timeline")
 
-        try:
-            self._insert_event(event, time + interval, interval)
-        except TypeError:
-            pass
+        if interval is None:
+            heapq.heappop(self._queue)
+        else:
+            heapq.heapreplace(
+                self._queue, (time + interval, next(self._counter), event, interval)
+            )
 
         self._time = time
 
@@ -0,0 +1,155 @@
+"""Change working directories from more than one thread.
+
+The working directory belongs to the process rather than to a thread, so
+threads that each change into their own run directory (components that
+run at the same time, for instance) would change it out from under one
+another. Threads that use :func:`cd` to change into the same directory
+share it, while a thread that wants a different directory waits until
+the others have left theirs. The directory is always changed back when
+the last thread leaves it.
+
+Where the working directory of the process does not need to change,
+:func:`working_dir` only records a directory for the current thread (see
+:func:`getcwd`). Directories passed to :func:`cd` are relative to it, and
+it is sent along with requests to ports that run in their own process
+(see :class:`~pymt.component.process.ProcessPort`).
+
+Examples
+--------
+>>> import os
+>>> from pymt.utils.cwd import cd, getcwd, working_dir
+
+>>> here = os.getcwd()
+>>> with cd(os.path.dirname(here)):
+...     os.getcwd() == os.path.dirname(here)
+True
+>>> os.getcwd() == here
+True
+
+>>> with working_dir(os.path.dirname(here)):
+...     (getcwd() == os.path.dirname(here), os.getcwd() == here)
+(True, True)
+"""
+import contextlib
+import os
+import threading
+
+_CWD = threading.Condition()
+_SHARED = {"path": None, "home": None, "count": 0}
+_LOCAL = threading.local()
+
+
+def _dirs():
+    try:
+        return _LOCAL.dirs
+    except AttributeError:
+        _LOCAL.dirs = []
+        return _LOCAL.dirs
+
+
+def _entered():
+    try:
+        return _LOCAL.entered
+    except AttributeError:
+        _LOCAL.entered = []
+        return _LOCAL.entered
+
+
+def _enter(path):
+    """Wait until the process can be in *path*, and be in it."""
+    while _SHARED["count"] != 0 and _SHARED["path"] != path:
+        _CWD.wait()
+    if _SHARED["path"] != path:
+        if _SHARED["path"] is None:
+            _SHARED["home"] = os.getcwd()
+        os.chdir(path)
+        _SHARED["path"] = path
+    _SHARED["count"] += 1
+
+
+def _leave():
+    """Stop being in the current directory."""
+    _SHARED["count"] -= 1
+    if _SHARED["count"] == 0:
+        os.chdir(_SHARED["home"])
+        _SHARED["path"] = None
+    _CWD.notify_all()
+
+
+def getcwd():
+    """Working directory of the current thread.
+
+    Returns
+    -------
+    str
+        The directory most recently entered by the current thread with
+        :func:`cd` or :func:`working_dir`, or else that of the process.
+    """
+    dirs = _dirs()
+    if dirs:
+        return dirs[-1]
+    else:
+        return os.getcwd()
+
+
+@contextlib.contextmanager
+def cd(path, create=False):
+    """Change the working directory of the process.
+
+    Other threads can change into the same directory at the same time.
+    Threads that try to change into a different directory wait until
+    all other threads have changed back.
+
+    Parameters
+    ----------
+    path : str
+        Path to the new directory, relative to :func:`getcwd`.
+    create : bool, optional
+        Create the directory if it does not exist.
+    """
+    path = os.path.normpath(os.path.join(getcwd(), path))
+    entered = _entered()
+    with _CWD:
+        if create and not os.path.isdir(path):
+            os.makedirs(path)
+
+        if entered:
+            # Let go of the directory this thread is already in while it
+            # waits, so that threads that share that directory, and each
+            # want another one, do not wait on one another.
+            _leave()
+        try:
+            _enter(path)
+        except OSError:
+            if entered:
+                _enter(entered[-1])
+            raise
+
+    entered.append(path)
+    _dirs().append(path)
+    try:
+        yield path
+    finally:
+        _dirs().pop()
+        entered.pop()
+        with _CWD:
+            _leave()
+            if entered:
+                _enter(entered[-1])
+
+
+@contextlib.contextmanager
+def working_dir(path):
+    """Set the working directory of the current thread only.
+
+    Parameters
+    ----------
+    path : str
+        Path to the directory, relative to :func:`getcwd`.
+    """
+    path = os.path.normpath(os.path.join(getcwd(), path))
+    _dirs().append(path)
+    try:
+        yield path
+    finally:
+        _dirs().pop()
@@ -45,3 +45,54 @@ def test_model_from_file_like(tmpdir, with_no_components):
             model = Model.from_file_like(fp)
 
         assert model.components == ["air_port"]
+
+
+def test_model_load_lagged(tmpdir, with_no_components):
+    from pymt.events.lagged import LaggedEvent
+
+    del_component_instances(["air_port", "earth_port"])
+    contents = """
+name: air_port
+class: AirPort
+connectivity: []
+---
+name: earth_port
+class: EarthPort
+connectivity:
+- name: air_port
+  connect: air_port
+  exchange_items:
+  - [earth_surface__temperature, air__temperature]
+  lagged: true
+  dtype: float32
+"""
+    with tmpdir.as_cwd():
+        model = Model.load(contents)
+        model.driver = "earth_port"
+        model.duration = 3.0
+        model.go()
+
+        assert isinstance(model["earth_port"].events[1], LaggedEvent)
+        assert model["earth_port"].current_time == 3.0
+        assert model["air_port"].current_time == 3.0
+
+
+def test_model_load_max_workers(tmpdir, with_no_components):
+    del_component_instances(["air_port"])
+    contents = """
+name: air_port
+class: AirPort
+connectivity: []
+max_workers: 2
+"""
+    with tmpdir.as_cwd():
+        model = Model.load(contents)
+        assert model["air_port"].max_workers == 2
+
+        model.driver = "air_port"
+        model.duration = 2.0
+        model.max_workers = 3
+        model.go()
+
+        assert model["air_port"].max_workers == 3
+        assert model["air_port"].current_time == 2.0
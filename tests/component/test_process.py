@@ -0,0 +1,224 @@
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import pymt
+from pymt.component import component
+from pymt.component.component import Component, _process_port
+from pymt.component.process import ProcessPort
+from pymt.errors import ComponentProcessError
+from pymt.framework import bmi_bridge
+from pymt.framework.bmi_bridge import bmi_factory
+from pymt.framework.services import del_component_instances
+from pymt.testing.services import AirPort
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+
+class Counter(object):
+    def __init__(self, size=4):
+        self._value = np.zeros(size)
+        self._time = 0.0
+
+    def get_current_time(self):
+        return self._time
+
+    def update_until(self, time):
+        self._value += time - self._time
+        self._time = time
+
+    def get_value(self, name, units=None):
+        if name != "count":
+            raise KeyError(name)
+        return self._value
+
+    def set_value(self, name, values):
+        self._value[:] = values
+
+    def get_pid(self):
+        return os.getpid()
+
+    def get_cwd(self):
+        return os.getcwd()
+
+    def fail(self):
+        raise ValueError("failed on purpose")
+
+    def crash(self):
+        os._exit(3)
+
+
+def test_runs_in_another_process():
+    with ProcessPort(Counter) as port:
+        assert port.get_pid() == port.pid
+        assert port.pid != os.getpid()
+
+
+def test_factory_arguments():
+    with ProcessPort(Counter, size=6) as port:
+        assert port.get_value("count").shape == (6,)
+
+
+def test_get_and_set_value():
+    with ProcessPort(Counter) as port:
+        port.update_until(2.0)
+        assert port.get_current_time() == 2.0
+        assert_array_equal(port.get_value("count"), [2.0, 2.0, 2.0, 2.0])
+
+        port.set_value("count", np.arange(4.0))
+        port.update_until(3.0)
+        assert_array_equal(port.get_value("count"), [1.0, 2.0, 3.0, 4.0])
+
+
+def test_get_value_is_shared_and_read_only():
+    with ProcessPort(Counter) as port:
+        values = port.get_value("count")
+        assert not values.flags.writeable
+
+        port.update_until(1.0)
+        assert_array_equal(values, 0.0)
+        assert port.get_value("count") is not values
+        assert_array_equal(values, 1.0)
+
+
+def test_get_value_with_out():
+    with ProcessPort(Counter) as port:
+        port.update_until(5.0)
+        out = np.empty(4)
+        assert port.get_value("count", out=out) is out
+        assert_array_equal(out, 5.0)
+
+
+def test_errors_are_reraised():
+    with ProcessPort(Counter) as port:
+        with pytest.raises(ValueError) as excinfo:
+            port.fail()
+        assert isinstance(excinfo.value.__cause__, ComponentProcessError)
+        assert "failed on purpose" in excinfo.value.__cause__.traceback
+
+        with pytest.raises(KeyError):
+            port.get_value("not_a_variable")
+        with pytest.raises(AttributeError):
+            port.not_a_method()
+        with pytest.raises(AttributeError):
+            port.get_value_ptr
+
+        assert_array_equal(port.get_value("count"), 0.0)
+
+
+def test_factory_error():
+    with pytest.raises(TypeError):
+        ProcessPort(Counter, not_an_argument=1)
+
+
+def test_crash():
+    port = ProcessPort(Counter)
+    with pytest.raises(ComponentProcessError):
+        port.crash()
+    assert not port.is_alive
+    with pytest.raises(ComponentProcessError):
+        port.get_current_time()
+
+
+def test_close():
+    port = ProcessPort(Counter)
+    port.close()
+    assert not port.is_alive
+    with pytest.raises(ComponentProcessError):
+        port.get_current_time()
+
+
+@pytest.fixture
+def no_bmi_docstring(monkeypatch):
+    monkeypatch.setattr(bmi_bridge, "bmi_docstring", lambda cls: cls.__name__)
+
+
+def test_unpicklable_factory(no_bmi_docstring):
+    with pytest.raises(ValueError):
+        ProcessPort(bmi_factory(Counter), start_method="spawn")
+
+
+def test_bmi_factory_class_is_picklable(monkeypatch, no_bmi_docstring):
+    monkeypatch.setattr(component, "ProcessPort", lambda *args: args)
+
+    factory, cls = pickle.loads(pickle.dumps(_process_port(bmi_factory(Counter))))
+    assert factory is bmi_bridge.bmi_instance
+    assert cls is Counter
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_no_leaked_shared_memory(tmpdir, start_method):
+    script = textwrap.dedent(
+        """
+        from pymt.component.process import ProcessPort
+        from pymt.testing.services import AirPort
+
+        if __name__ == "__main__":
+            with ProcessPort(AirPort, start_method="{0}") as port:
+                port.initialize()
+                port.run(2.0)
+                values = port.get_value("air__temperature")
+                port.set_value("air__temperature", values + 1.0)
+                port.get_value("air__temperature")
+        """.format(
+            start_method
+        )
+    )
+    tmpdir.join("run_port.py").write(script)
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.abspath(pymt.__file__)))]
+        + [path for path in [env.get("PYTHONPATH")] if path]
+    )
+    with tmpdir.as_cwd():
+        process = subprocess.run(
+            [sys.executable, "run_port.py"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+            timeout=60,
+        )
+
+    assert process.returncode == 0, process.stderr
+    assert "resource_tracker" not in process.stderr
+    assert "shared_memory" not in process.stderr
+
+
+def test_runs_in_parent_cwd(tmpdir):
+    with ProcessPort(Counter) as port:
+        with tmpdir.as_cwd():
+            assert port.get_cwd() == os.getcwd()
+
+
+def test_component(tmpdir):
+    with tmpdir.as_cwd():
+        port = ProcessPort(AirPort)
+        comp = Component(port, uses=[], provides=[], events=[])
+        comp.go()
+        assert comp.current_time == 100.0
+        assert_array_equal(port.get_value("air__temperature"), 0.0)
+        port.close()
+
+
+def test_isolate_from_string(tmpdir, with_no_components):
+    del_component_instances(["air_port"])
+
+    contents = """
+name: air_port
+class: AirPort
+isolate: true
+    """
+    with tmpdir.as_cwd():
+        comp = Component.from_string(contents)
+        comp.go()
+    assert isinstance(comp._port, ProcessPort)
+    assert comp._port.current_time == 100.0
+    comp._port.close()
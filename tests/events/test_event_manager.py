@@ -0,0 +1,175 @@
+import os
+import threading
+from time import perf_counter, sleep
+
+import numpy as np
+import pytest
+
+from pymt.events.manager import EventManager, event_access, events_conflict
+from pymt.events.port import PortEvent
+
+
+class Event(object):
+    def __init__(self, name, log, reads=(), writes=(), barrier=None):
+        self.name = name
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+        self._log = log
+        self._barrier = barrier
+
+    def initialize(self):
+        pass
+
+    def run(self, time):
+        if self._barrier is not None:
+            self._barrier.wait(timeout=5.0)
+        self._log.append((time, self.name))
+
+    def finalize(self):
+        pass
+
+
+class UndeclaredEvent(Event):
+    def __init__(self, name, log):
+        super(UndeclaredEvent, self).__init__(name, log)
+        del self.reads
+        del self.writes
+
+
+def test_max_workers_runs_same_events():
+    log = []
+    events = [
+        (Event("a", log), 1.0),
+        (Event("b", log), 2.0),
+        (UndeclaredEvent("c", log), 1.0),
+    ]
+    with EventManager(events, max_workers=4) as mngr:
+        mngr.run(4.0)
+
+    assert sorted(log) == sorted(
+        [(t, "a") for t in (1.0, 2.0, 3.0, 4.0)]
+        + [(t, "b") for t in (2.0, 4.0)]
+        + [(t, "c") for t in (1.0, 2.0, 3.0, 4.0)]
+    )
+    assert [time for (time, _) in log] == sorted(time for (time, _) in log)
+    assert mngr.time == 4.0
+
+
+def test_independent_events_run_concurrently():
+    log = []
+    barrier = threading.Barrier(2)
+    events = [
+        (Event("a", log, writes=[("air", None)], barrier=barrier), 1.0),
+        (Event("b", log, writes=[("earth", None)], barrier=barrier), 1.0),
+    ]
+    with EventManager(events, max_workers=2) as mngr:
+        mngr.run(2.0)
+
+    assert sorted(log) == [(1.0, "a"), (1.0, "b"), (2.0, "a"), (2.0, "b")]
+
+
+def test_conflicting_events_keep_their_order():
+    log = []
+    events = [
+        (Event("update", log, writes=[("air", None)]), 1.0),
+        (Event("map", log, reads=[("air", "wind")], writes=[("earth", "wind")]), 1.0),
+        (Event("print", log, reads=[("earth", "wind")]), 1.0),
+        (UndeclaredEvent("other", log), 1.0),
+        (Event("last", log), 1.0),
+    ]
+    with EventManager(events, max_workers=4) as mngr:
+        mngr.run(1.0)
+
+    assert [name for (_, name) in log] == ["update", "map", "print", "other", "last"]
+
+
+class SlowPort(object):
+    def __init__(self, name):
+        self._name = name
+        self._time = 0.0
+        self._values = {"output": np.zeros(1)}
+        self.intervals = []
+        self.dirs = set()
+
+    def get_component_name(self):
+        return self._name
+
+    def initialize(self, *args):
+        pass
+
+    def run(self, time):
+        start = perf_counter()
+        sleep(0.05)
+        self._time = time
+        self.dirs.add(os.getcwd())
+        self.intervals.append((start, perf_counter()))
+
+    def finalize(self):
+        pass
+
+    def get_value(self, name, units=None):
+        return self._values.get(name, np.zeros(1))
+
+    def set_value(self, name, values):
+        self._values[name] = np.array(values)
+
+    def get_var_units(self, name):
+        return "-"
+
+    @property
+    def start_time(self):
+        return 0.0
+
+    @property
+    def current_time(self):
+        return self._time
+
+    @property
+    def end_time(self):
+        return 10.0
+
+
+def overlap(first, second):
+    total = 0.0
+    for (start_a, end_a) in first.intervals:
+        for (start_b, end_b) in second.intervals:
+            total += max(0.0, min(end_a, end_b) - max(start_a, start_b))
+    return total
+
+
+def test_port_events_run_concurrently(tmpdir):
+    with tmpdir.as_cwd():
+        run_dir = str(tmpdir.mkdir("run"))
+        ports = [SlowPort("a"), SlowPort("b")]
+        events = [PortEvent(port=port, run_dir=run_dir) for port in ports]
+        with EventManager([(event, 1.0) for event in events], max_workers=2) as mngr:
+            mngr.run(5.0)
+
+    assert len(ports[0].intervals) == len(ports[1].intervals) == 5
+    assert overlap(*ports) > 0.1
+    assert ports[0].dirs == ports[1].dirs == set([run_dir])
+
+
+def test_connected_components_run_concurrently(tmpdir):
+    from pymt.component.component import Component
+
+    with tmpdir.as_cwd():
+        ports = [SlowPort("a"), SlowPort("b"), SlowPort("c")]
+        (a, b, c) = [Component(port, uses=["b", "c"]) for port in ports]
+        a.connect("b", b, vars_to_map=[("input_b", "output")])
+        a.connect("c", c, vars_to_map=[("input_c", "output")])
+
+        (step, from_b, from_c) = [event_access(event) for event in a.events]
+        assert not events_conflict(from_b, from_c)
+        assert events_conflict(step, from_b)
+        assert events_conflict(step, from_c)
+
+        a.go(5.0, max_workers=3)
+
+    assert len(ports[1].intervals) == len(ports[2].intervals) == 5
+    assert overlap(ports[1], ports[2]) > 0.1
+
+
+def test_bad_keyword():
+    with pytest.raises(TypeError):
+        EventManager([], max_threads=2)
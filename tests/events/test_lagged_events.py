@@ -0,0 +1,218 @@
+import os
+import threading
+from time import perf_counter, sleep
+
+import numpy as np
+import pytest
+
+from pymt.component.component import Component
+from pymt.events.lagged import ExchangeBuffer, LaggedEvent
+
+
+class Stepper(object):
+    def __init__(self, name, end_time=10.0):
+        self._name = name
+        self._time = 0.0
+        self._end_time = end_time
+        self._values = {"output": np.zeros(1), "input": np.zeros(1)}
+        self.received = []
+        self.threads = set()
+        self.dirs = set()
+        self.dtypes = set()
+
+    def get_component_name(self):
+        return self._name
+
+    def initialize(self, *args):
+        pass
+
+    def run(self, time):
+        self.threads.add(threading.current_thread())
+        self.dirs.add(os.getcwd())
+        self._time = time
+        self._values["output"][:] = time
+
+    def finalize(self):
+        pass
+
+    def get_value(self, name, units=None):
+        return self._values[name]
+
+    def set_value(self, name, values):
+        self._values[name][:] = values
+        self.received.append((self._time, float(values[0])))
+        self.dtypes.add(np.asarray(values).dtype)
+
+    def get_var_units(self, name):
+        return "-"
+
+    @property
+    def start_time(self):
+        return 0.0
+
+    @property
+    def current_time(self):
+        return self._time
+
+    @property
+    def end_time(self):
+        return self._end_time
+
+
+class Broken(Stepper):
+    def run(self, time):
+        super(Broken, self).run(time)
+        if time > 1.0:
+            raise RuntimeError("broken")
+
+
+class Sleeper(Stepper):
+    def run(self, time):
+        super(Sleeper, self).run(time)
+        sleep(0.002)
+        self.dirs.add(os.getcwd())
+
+
+class SlowStepper(Stepper):
+    def __init__(self, *args, **kwds):
+        super(SlowStepper, self).__init__(*args, **kwds)
+        self.intervals = []
+
+    def run(self, time):
+        start = perf_counter()
+        super(SlowStepper, self).run(time)
+        sleep(0.05)
+        self.intervals.append((start, perf_counter()))
+
+
+def coupled(
+    first, second, lagged=False, two_way=False, run_dirs=(".", "."), dtype=None
+):
+    a = Component(first, uses=["b"], run_dir=run_dirs[0])
+    b = Component(second, uses=["a"], run_dir=run_dirs[1])
+    a.connect("b", b, vars_to_map=[("input", "output")], lagged=lagged, dtype=dtype)
+    if two_way:
+        b.connect("a", a, vars_to_map=[("input", "output")], lagged=lagged)
+    return a, b
+
+
+def test_exchange_buffer():
+    port = Stepper("a")
+    buffer = ExchangeBuffer(port)
+
+    buffer.set_value("input", np.array([1.0]))
+    buffer.push()
+    assert port.received == []
+
+    buffer.swap()
+    buffer.set_value("input", np.array([2.0]))
+    buffer.push()
+    assert port.received == [(0.0, 1.0)]
+    assert buffer.get_var_units("input") == "-"
+
+
+def test_one_way(tmpdir):
+    with tmpdir.as_cwd():
+        (first, second) = (Stepper("a"), Stepper("b"))
+        a, b = coupled(first, second, lagged=True)
+        assert isinstance(a.events[1], LaggedEvent)
+        a.go(3.0)
+
+    assert first.received == [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+    assert second.current_time == 3.0
+    assert len(second.threads - first.threads) == 1
+
+
+def test_lagged_ports_step_at_the_same_time(tmpdir):
+    with tmpdir.as_cwd():
+        (first, second) = (SlowStepper("a"), SlowStepper("b"))
+        a, b = coupled(first, second, lagged=True)
+        start = perf_counter()
+        a.go(10.0)
+        elapsed = perf_counter() - start
+
+    overlap = 0.0
+    for (start_a, end_a) in first.intervals:
+        for (start_b, end_b) in second.intervals:
+            overlap += max(0.0, min(end_a, end_b) - max(start_a, start_b))
+
+    assert overlap > 0.25
+    assert first.dirs == second.dirs == set([str(tmpdir)])
+    assert elapsed < 0.8 * (len(first.intervals) + len(second.intervals)) * 0.05
+
+
+def test_one_way_matches_sequential(tmpdir):
+    with tmpdir.as_cwd():
+        (first, second) = (Stepper("a"), Stepper("b"))
+        coupled(first, second)[0].go(3.0)
+        (lagged_first, lagged_second) = (Stepper("a"), Stepper("b"))
+        coupled(lagged_first, lagged_second, lagged=True)[0].go(3.0)
+
+    assert lagged_first.received == first.received
+
+
+def test_two_way(tmpdir):
+    with tmpdir.as_cwd():
+        (first, second) = (Stepper("a"), Stepper("b"))
+        a, b = coupled(first, second, lagged=True, two_way=True)
+        a.go(3.0)
+
+    assert first.received == [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+    assert second.received == [(1.0, 1.0), (2.0, 1.0), (3.0, 2.0)]
+    assert second.current_time == 3.0
+
+
+def test_end_time(tmpdir):
+    with tmpdir.as_cwd():
+        (first, second) = (Stepper("a", end_time=3.0), Stepper("b", end_time=3.0))
+        coupled(first, second, lagged=True)[0].go()
+
+    assert first.received == [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+    assert second.current_time == 3.0
+
+
+def test_error_is_raised_on_next_step(tmpdir):
+    with tmpdir.as_cwd():
+        (first, second) = (Stepper("a"), Broken("b"))
+        a, b = coupled(first, second, lagged=True)
+        a.initialize()
+        a.run(1.0)
+        with pytest.raises(RuntimeError):
+            a.run(2.0)
+
+
+def test_run_dirs(tmpdir):
+    with tmpdir.as_cwd():
+        run_dirs = (str(tmpdir.mkdir("a")), str(tmpdir.mkdir("b")))
+        (first, second) = (Sleeper("a", end_time=50.0), Sleeper("b", end_time=50.0))
+        a, b = coupled(first, second, lagged=True, two_way=True, run_dirs=run_dirs)
+        a.go(50.0)
+
+        assert first.dirs == set([run_dirs[0]])
+        assert second.dirs == set([run_dirs[1]])
+        assert os.getcwd() == str(tmpdir)
+
+
+def test_run_dirs_of_isolated_port(tmpdir):
+    pytest.importorskip("multiprocessing.shared_memory")
+    from pymt.component.process import ProcessPort
+
+    with tmpdir.as_cwd():
+        run_dirs = (str(tmpdir.mkdir("a")), str(tmpdir.mkdir("b")))
+        first = Sleeper("a", end_time=10.0)
+        with ProcessPort(Sleeper, "b", end_time=10.0) as second:
+            a, b = coupled(first, second, lagged=True, run_dirs=run_dirs)
+            a.go(10.0)
+
+            assert first.dirs == set([run_dirs[0]])
+            assert second.dirs == set([run_dirs[1]])
+            assert second.current_time == 10.0
+
+
+@pytest.mark.parametrize("lagged", [False, True])
+def test_dtype(tmpdir, lagged):
+    with tmpdir.as_cwd():
+        (first, second) = (Stepper("a"), Stepper("b"))
+        coupled(first, second, lagged=lagged, dtype="float32")[0].go(2.0)
+
+    assert first.dtypes == set([np.dtype("float32")])
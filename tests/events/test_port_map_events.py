@@ -1,8 +1,10 @@
+import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 from pymt.events.chain import ChainEvent
 from pymt.events.manager import EventManager
-from pymt.events.port import PortEvent, PortMapEvent
+from pymt.events.port import ExchangePlan, PortEvent, PortMapEvent
 from pymt.framework.services import get_component_instance
 
 
@@ -54,3 +56,111 @@ def test_chain(tmpdir, with_earth_and_air):
 
             mngr.run(2.0)
             assert_port_value_equal(air, "air__density", 1.2)
+
+
+class UnitsPort(object):
+    def __init__(self, units, values=None):
+        self._units = units
+        self._values = {"x": np.zeros(3) if values is None else np.array(values)}
+        self.calls = {"get_var_units": 0, "get_value": 0}
+        self.received = []
+
+    def get_var_units(self, name):
+        self.calls["get_var_units"] += 1
+        return self._units
+
+    def get_value(self, name, units=None):
+        self.calls["get_value"] += 1
+        return self._values[name]
+
+    def set_value(self, name, values):
+        self.received.append(values.copy())
+        self._values[name][:] = values
+
+
+def test_plan_is_built_once():
+    src = UnitsPort("m", [1.0, 2.0, 3.0])
+    dst = UnitsPort("m")
+    event = PortMapEvent(src_port=src, dst_port=dst, vars_to_map=[("x", "x")])
+
+    with EventManager(((event, 1.0),)) as mngr:
+        mngr.run(3.0)
+
+    assert dst.calls["get_var_units"] == 1
+    assert src.calls["get_var_units"] == 1
+    assert src.calls["get_value"] == 3
+    assert_array_equal(dst.received, [[1.0, 2.0, 3.0]] * 3)
+
+
+def test_map_does_not_subscribe_for_time_interpolation():
+    class SubscribingPort(UnitsPort):
+        def subscribe(self, *names):
+            raise AssertionError("values are never interpolated in time")
+
+    src = SubscribingPort("m", [1.0, 2.0, 3.0])
+    dst = UnitsPort("m")
+    event = PortMapEvent(src_port=src, dst_port=dst, vars_to_map=[("x", "x")])
+
+    with EventManager(((event, 1.0),)) as mngr:
+        mngr.run(1.0)
+
+    assert_array_equal(dst.received, [[1.0, 2.0, 3.0]])
+
+
+def test_plan_converts_units():
+    src = UnitsPort("m", [1000.0, 2000.0, 3000.0])
+    dst = UnitsPort("km")
+    event = PortMapEvent(src_port=src, dst_port=dst, vars_to_map=[("x", "x")])
+
+    with EventManager(((event, 1.0),)) as mngr:
+        mngr.run(1.0)
+        src._values["x"] *= 2
+        mngr.run(2.0)
+
+    assert_array_equal(dst.received, [[1.0, 2.0, 3.0], [2.0, 4.0, 6.0]])
+    assert_array_equal(src._values["x"], [2000.0, 4000.0, 6000.0])
+
+
+def test_plan_transport_dtype():
+    src = UnitsPort("m", [0.1, 0.2, 0.3])
+    dst = UnitsPort("m")
+    event = PortMapEvent(
+        src_port=src, dst_port=dst, vars_to_map=[("x", "x")], dtype="float32"
+    )
+
+    with EventManager(((event, 1.0),)) as mngr:
+        mngr.run(1.0)
+
+    assert dst.received[0].dtype == np.float32
+    assert_array_equal(dst._values["x"], np.array([0.1, 0.2, 0.3], dtype=np.float32))
+
+
+class GoodValuesMapper(object):
+    def run(self, values, dst_vals=None):
+        if dst_vals is None:
+            dst_vals = np.zeros_like(values)
+        is_good = values > -999.0
+        dst_vals[is_good] = values[is_good]
+        return dst_vals
+
+
+def test_plan_clears_unmapped_values():
+    src = UnitsPort("m", [1.0, 2.0, 3.0])
+    dst = UnitsPort("m")
+    plan = ExchangePlan(src, dst, "x", "x", mapper=GoodValuesMapper())
+
+    plan.run()
+    src._values["x"][:] = [-999.0, 5.0, 6.0]
+    plan.run()
+
+    assert_array_equal(dst.received, [[1.0, 2.0, 3.0], [0.0, 5.0, 6.0]])
+
+
+class NoUnitsPort(UnitsPort):
+    def get_var_units(self, name):
+        raise RuntimeError("no units")
+
+
+def test_plan_units_errors_are_raised():
+    with pytest.raises(RuntimeError):
+        ExchangePlan(NoUnitsPort("m"), UnitsPort("m"), "x", "x")
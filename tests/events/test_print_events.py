@@ -1,6 +1,7 @@
 import os
 
 import numpy as np
+import pytest
 from pytest import approx
 
 from pymt.events.manager import EventManager
@@ -52,3 +53,68 @@ def test_two_events(tmpdir, with_earth_and_air):
 
             mngr.run(5.0)
             assert mngr.time == approx(5.0)
+
+
+def test_background_event(tmpdir, with_earth_and_air):
+    from netCDF4 import Dataset
+    from numpy.testing import assert_array_equal
+
+    from pymt.framework.services import get_component_instance
+
+    air = get_component_instance("air_port")
+    with tmpdir.as_cwd():
+        foo = PrintEvent(
+            port="air_port", name="air__density", format="nc", background=True
+        )
+
+        expected = []
+        with EventManager(((foo, 1.0),)) as mngr:
+            for time in (1.0, 2.0, 3.0):
+                mngr.run(time)
+                expected.append(air.get_value("air__density").copy())
+
+        root = Dataset("air__density.nc")
+        try:
+            assert len(root.variables["time"]) == 3
+            assert_array_equal(
+                root.variables["air__density"][:].reshape((3, -1)),
+                np.array(expected).reshape((3, -1)),
+            )
+        finally:
+            root.close()
+
+
+class FailingPrinter(object):
+    def write(self, values=None):
+        raise IOError("disk is full")
+
+
+def test_background_writer_error():
+    from pymt.events.printer import BackgroundWriter
+
+    writer = BackgroundWriter(FailingPrinter(), queue_size=1)
+    writer.put(np.zeros(3))
+    with pytest.raises(IOError):
+        writer.flush()
+    writer.close()
+
+
+def test_background_writer_copies_values():
+    from pymt.events.printer import BackgroundWriter
+
+    class Printer(object):
+        written = []
+
+        def write(self, values=None):
+            self.written.append(values.copy())
+
+    values = np.zeros(3)
+    writer = BackgroundWriter(Printer(), queue_size=2)
+    for step in range(5):
+        values[:] = step
+        writer.put(values)
+    writer.close()
+
+    assert [list(written) for written in Printer.written] == [
+        [float(step)] * 3 for step in range(5)
+    ]
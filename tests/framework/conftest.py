@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from pymt.framework.bmi_bridge import _BmiCap
+from pymt.framework.bmi_timeinterp import BmiTimeInterpolator
+
+
+class CountingBmi(object):
+    def __init__(self):
+        self.calls = dict()
+        self.shape = np.array([4])
+        self._time = 0.0
+        self._values = {"soil__depth": np.arange(4.0), "air__temperature": np.zeros(4)}
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def initialize(self, fname):
+        pass
+
+    def finalize(self):
+        pass
+
+    def update(self):
+        for values in self._values.values():
+            values += 1.0
+        self._time += 1.0
+
+    def get_current_time(self):
+        return self._time
+
+    def get_input_var_names(self):
+        self._count("get_input_var_names")
+        return ("soil__depth",)
+
+    def get_output_var_names(self):
+        self._count("get_output_var_names")
+        return ("soil__depth", "air__temperature")
+
+    def get_var_grid(self, name):
+        self._count("get_var_grid")
+        return 0
+
+    def get_var_type(self, name):
+        return "float64"
+
+    def get_var_units(self, name):
+        self._count("get_var_units")
+        return "m"
+
+    def get_var_location(self, name):
+        return "node"
+
+    def get_var_itemsize(self, name):
+        return 8
+
+    def get_var_nbytes(self, name):
+        return 8 * self._values[name].size
+
+    def get_grid_rank(self, grid):
+        return len(self.shape)
+
+    def get_grid_size(self, grid):
+        return int(np.prod(self.shape))
+
+    def get_grid_type(self, grid):
+        return "uniform_rectilinear"
+
+    def get_grid_shape(self, grid, out):
+        self._count("get_grid_shape")
+        out[:] = self.shape
+        return out
+
+    def get_value(self, name, out):
+        self._count("get_value")
+        out[:] = self._values[name]
+        return out
+
+    def set_value(self, name, values):
+        self._values[name][:] = values
+
+
+class CountingPtrBmi(CountingBmi):
+    def get_value_ptr(self, name):
+        return self._values[name]
+
+
+class Bmi(_BmiCap, BmiTimeInterpolator):
+    _cls = CountingBmi
+
+
+class PtrBmi(_BmiCap, BmiTimeInterpolator):
+    _cls = CountingPtrBmi
+
+
+@pytest.fixture
+def new_bmi(tmpdir):
+    """Create components that wrap a BMI whose calls are counted."""
+
+    def _new_bmi(ptr=False, reuse_buffers=False, initialize=True):
+        bmi = PtrBmi() if ptr else Bmi()
+        bmi.reuse_buffers = reuse_buffers
+        if initialize:
+            bmi.initialize(dir=str(tmpdir))
+            bmi.bmi.calls.clear()
+        return bmi
+
+    return _new_bmi
+
+
+@pytest.fixture
+def bmi(new_bmi):
+    return new_bmi()
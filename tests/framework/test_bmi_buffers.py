@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+
+@pytest.fixture
+def bmi(new_bmi):
+    return new_bmi(reuse_buffers=True)
+
+
+def test_buffers_are_reused(bmi):
+    first = bmi.get_value("soil__depth")
+    second = bmi.get_value("soil__depth")
+
+    assert np.shares_memory(first, second)
+    assert_array_equal(second, [0.0, 1.0, 2.0, 3.0])
+
+
+def test_buffers_are_read_only(bmi):
+    values = bmi.get_value("soil__depth")
+    with pytest.raises(ValueError):
+        values[0] = 1.0
+
+
+def test_buffer_copy(bmi):
+    kept = bmi.get_value("soil__depth", copy=True)
+    bmi.update()
+    values = bmi.get_value("soil__depth")
+
+    assert not np.shares_memory(kept, values)
+    assert_array_equal(kept, [0.0, 1.0, 2.0, 3.0])
+    assert_array_equal(values, [1.0, 2.0, 3.0, 4.0])
+
+
+def test_buffers_are_opt_in(new_bmi):
+    bmi = new_bmi()
+
+    first = bmi.get_value("soil__depth")
+    assert first.flags.writeable
+    assert not np.shares_memory(first, bmi.get_value("soil__depth"))
+
+
+def test_value_view(new_bmi):
+    bmi = new_bmi(ptr=True)
+
+    view = bmi.get_value_view("soil__depth")
+    assert np.shares_memory(view, bmi.bmi.get_value_ptr("soil__depth"))
+    with pytest.raises(ValueError):
+        view[0] = 1.0
+
+    bmi.update()
+    assert_array_equal(view, [1.0, 2.0, 3.0, 4.0])
+    assert_array_equal(bmi.var["soil__depth"].view, [1.0, 2.0, 3.0, 4.0])
+
+
+def test_value_view_without_ptr(bmi):
+    view = bmi.get_value_view("soil__depth")
+    assert_array_equal(view, [0.0, 1.0, 2.0, 3.0])
+
+    bmi.update()
+    assert_array_equal(view, [0.0, 1.0, 2.0, 3.0])
+
+
+def test_value_view_is_flat(new_bmi):
+    bmi = new_bmi(ptr=True)
+    bmi.bmi._values["soil__depth"] = np.arange(4.0).reshape((2, 2))
+
+    view = bmi.get_value_view("soil__depth")
+    assert view.shape == (4,)
+    assert np.shares_memory(view, bmi.bmi.get_value_ptr("soil__depth"))
+
+    bmi.bmi._values["soil__depth"] = np.arange(8.0).reshape((2, 4))[:, ::2]
+    assert bmi.get_value_view("soil__depth").shape == (4,)
+
+
+def test_data_is_a_copy(new_bmi):
+    bmi = new_bmi(ptr=True)
+
+    data = bmi.var["soil__depth"].data
+    data[0] = 10.0
+    assert data.shape == bmi.var["soil__depth"].view.shape
+    assert_array_equal(bmi.var["soil__depth"].data, [0.0, 1.0, 2.0, 3.0])
+
+
+def test_data_is_a_copy_with_reused_buffers(bmi):
+    first = bmi.var["soil__depth"].data
+    bmi.update()
+    second = bmi.var["soil__depth"].data
+
+    assert first.flags.writeable
+    assert not np.shares_memory(first, second)
+    assert not np.shares_memory(second, bmi.get_value("soil__depth"))
+    assert_array_equal(first, [0.0, 1.0, 2.0, 3.0])
+    assert_array_equal(second, [1.0, 2.0, 3.0, 4.0])
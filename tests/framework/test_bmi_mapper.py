@@ -0,0 +1,97 @@
+import gc
+
+import pytest
+
+from pymt.framework import bmi_mapper
+from pymt.framework.bmi_mapper import GridMapperMixIn, as_esmf_regridder
+from pymt.mappers.cache import CACHE_DIR_ENV
+
+
+class Grids(GridMapperMixIn):
+    def __init__(self):
+        self.grid = {0: "grid-0", 1: "grid-1"}
+
+
+@pytest.fixture(autouse=True)
+def without_esmf(monkeypatch):
+    monkeypatch.setattr(bmi_mapper, "bmi_as_esmf_mesh", lambda grid: object())
+    monkeypatch.setattr(bmi_mapper, "as_esmf_field", lambda mesh, name, at: object())
+    monkeypatch.setattr(
+        bmi_mapper, "as_esmf_regridder", lambda src, dst, **kwds: object()
+    )
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+
+
+def test_regridder_is_cached():
+    src, dst = Grids(), Grids()
+    regridder = src._esmf_regridder_by_id(0, dst, 1)
+
+    assert src._esmf_regridder_by_id(0, dst, 1) is regridder
+    assert src._esmf_regridder_by_id(0, dst, 0) is not regridder
+
+
+def test_cache_does_not_keep_destination():
+    src, dst = Grids(), Grids()
+    src._esmf_regridder_by_id(0, dst, 1)
+
+    del dst
+    gc.collect()
+    assert src._esmf_regridder == {}
+
+
+def test_invalidate_destination():
+    src, dst = Grids(), Grids()
+    to_0 = src._esmf_regridder_by_id(0, dst, 0)
+    to_1 = src._esmf_regridder_by_id(0, dst, 1)
+
+    dst.invalidate_regridders(gid=1)
+    assert src._esmf_regridder_by_id(0, dst, 0) is to_0
+    assert src._esmf_regridder_by_id(0, dst, 1) is not to_1
+
+    dst.invalidate_regridders()
+    assert src._esmf_regridder == {}
+
+
+def test_invalidate_source():
+    src, dst = Grids(), Grids()
+    from_0 = src._esmf_regridder_by_id(0, dst, 0)
+    from_1 = src._esmf_regridder_by_id(1, dst, 0)
+
+    src.invalidate_regridders(gid=0)
+    assert src._esmf_regridder_by_id(1, dst, 0) is from_1
+    assert src._esmf_regridder_by_id(0, dst, 0) is not from_0
+
+
+class FakeEsmf(object):
+    def __init__(self):
+        self.written_to = []
+        self.read_from = []
+
+    def Regrid(self, src, dst, filename=None, **kwds):
+        self.written_to.append(filename)
+        if filename is not None:
+            with open(filename, "w") as fp:
+                fp.write("weights")
+        return "computed"
+
+    def RegridFromFile(self, src, dst, filename):
+        self.read_from.append(filename)
+        return "from-file"
+
+
+def test_weights_file_is_moved_into_place(tmpdir, monkeypatch):
+    esmf = FakeEsmf()
+    monkeypatch.setattr(bmi_mapper, "esmf", esmf)
+    monkeypatch.setitem(bmi_mapper.REGRID_METHODS, "nearest", "nearest")
+    monkeypatch.setitem(bmi_mapper.UNMAPPED_ACTIONS, "pass", "pass")
+
+    filename = str(tmpdir.join("weights.nc"))
+    assert as_esmf_regridder(None, None, filename=filename) == "computed"
+
+    assert esmf.written_to[0] != filename
+    assert tmpdir.listdir() == [tmpdir.join("weights.nc")]
+    assert tmpdir.join("weights.nc").read() == "weights"
+
+    assert as_esmf_regridder(None, None, filename=filename) == "from-file"
+    assert esmf.read_from == [filename]
+
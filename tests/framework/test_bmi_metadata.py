@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+
+def test_var_metadata_is_cached(bmi):
+    for _ in range(3):
+        assert bmi.get_var_intent("soil__depth") == "inout"
+        assert bmi.get_var_intent("air__temperature") == "out"
+        assert bmi.get_var_grid("soil__depth") == 0
+        assert bmi.get_var_units("soil__depth") == "m"
+        assert bmi.input_var_names == ("soil__depth",)
+        assert bmi.var["soil__depth"].size == 4
+
+    assert bmi.bmi.calls == {}
+
+
+def test_grid_metadata_is_cached(bmi):
+    shape = bmi.get_grid_shape(0)
+    shape[0] = 10
+
+    assert_array_equal(bmi.get_grid_shape(0), [4])
+    assert bmi.bmi.calls == {"get_grid_shape": 1}
+
+    out = np.empty(1, dtype=int)
+    assert bmi.get_grid_shape(0, out=out) is out
+    assert_array_equal(out, [4])
+
+
+def test_refresh(bmi):
+    assert_array_equal(bmi.get_grid_shape(0), [4])
+
+    bmi.bmi.shape = np.array([5])
+    assert_array_equal(bmi.get_grid_shape(0), [4])
+
+    bmi.refresh()
+    assert_array_equal(bmi.get_grid_shape(0), [5])
+
+
+def test_refresh_invalidates_regridders(bmi):
+    calls = []
+    bmi.invalidate_regridders = lambda: calls.append("invalidate_regridders")
+
+    bmi.refresh()
+    assert calls == ["invalidate_regridders"]
+
+
+def test_refresh_without_metadata(bmi):
+    def not_implemented(name):
+        raise NotImplementedError("get_var_nbytes")
+
+    bmi.bmi.get_var_nbytes = not_implemented
+    bmi.refresh()
+    assert bmi.get_var_units("soil__depth") == "m"
+
+
+def test_refresh_errors_are_raised(bmi):
+    def broken(name):
+        raise RuntimeError("get_var_nbytes")
+
+    bmi.bmi.get_var_nbytes = broken
+    with pytest.raises(RuntimeError):
+        bmi.refresh()
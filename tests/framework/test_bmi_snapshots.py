@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+
+def test_snapshot_is_shared(bmi):
+    first = bmi.get_value_view("soil__depth")
+    second = bmi.get_value_view("soil__depth")
+
+    assert first is second
+    assert bmi.bmi.calls["get_value"] == 1
+    assert_array_equal(first, [0.0, 1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        first[0] = 1.0
+
+
+def test_snapshot_is_not_a_buffer(new_bmi):
+    bmi = new_bmi(reuse_buffers=True)
+    snapshot = bmi.get_value_view("soil__depth")
+    assert not np.shares_memory(snapshot, bmi.get_value("soil__depth"))
+
+
+def test_snapshot_by_units(bmi):
+    in_m = bmi.get_value_view("soil__depth")
+    in_km = bmi.get_value_view("soil__depth", units="km")
+
+    assert in_m is not in_km
+    assert_array_equal(in_km, [0.0, 0.001, 0.002, 0.003])
+    assert bmi.get_value_view("soil__depth", units="km") is in_km
+
+
+def test_snapshot_after_update(bmi):
+    before = bmi.get_value_view("soil__depth")
+    bmi.update()
+    after = bmi.get_value_view("soil__depth")
+
+    assert after is not before
+    assert_array_equal(before, [0.0, 1.0, 2.0, 3.0])
+    assert_array_equal(after, [1.0, 2.0, 3.0, 4.0])
+
+
+def test_snapshot_after_set_value(bmi):
+    bmi.get_value_view("soil__depth")
+    bmi.set_value("soil__depth", np.zeros(4))
+    assert_array_equal(bmi.get_value_view("soil__depth"), 0.0)
+
+
+def test_snapshot_after_time_changes(bmi):
+    bmi.get_value_view("soil__depth")
+    bmi.bmi.update()
+    assert_array_equal(bmi.get_value_view("soil__depth"), [1.0, 2.0, 3.0, 4.0])
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+from pytest import approx
+
+from pymt.errors import BmiError
+
+from pymt.framework.bmi_timeinterp import BmiTimeInterpolator
+
+
+class SimpleBmi(object):
+    def __init__(self):
+        self._time = 0.0
+        self._values = {"air__temperature": np.zeros(3), "soil__depth": np.zeros(2)}
+        self.n_get_value = dict((name, 0) for name in self._values)
+
+    @property
+    def initdir(self):
+        return "."
+
+    @property
+    def output_var_names(self):
+        return tuple(self._values)
+
+    def get_current_time(self):
+        return self._time
+
+    def get_time_step(self):
+        return 1.0
+
+    def time_from(self, time, units):
+        return time
+
+    def update(self):
+        self._time += 1.0
+        for name, values in self._values.items():
+            values[:] = self._time * (np.arange(values.size) + 1)
+
+    def get_value(self, name):
+        self.n_get_value[name] += 1
+        return self._values[name].copy()
+
+
+class Bmi(BmiTimeInterpolator, SimpleBmi):
+    bmi = None
+
+
+class BrokenBmi(Bmi):
+    def get_value(self, name):
+        if name == "soil__depth":
+            raise BmiError("get_value", 1)
+        return super(BrokenBmi, self).get_value(name)
+
+
+def test_all_vars_are_buffered_by_default():
+    bmi = Bmi()
+    assert bmi.buffer_all
+    bmi.update_until(2.5)
+
+    assert bmi.is_buffered("air__temperature")
+    assert bmi.is_buffered("soil__depth")
+    assert_array_almost_equal(bmi.interpolate("soil__depth", 2.5), [2.5, 5.0])
+
+
+def test_only_subscribed_vars_are_buffered():
+    bmi = Bmi(buffer_all=False)
+    bmi.subscribe("air__temperature")
+    bmi.update_until(2.5)
+
+    assert bmi.is_buffered("air__temperature")
+    assert not bmi.is_buffered("soil__depth")
+    assert bmi.n_get_value["soil__depth"] == 0
+    assert_array_almost_equal(bmi.interpolate("air__temperature", 2.5), [2.5, 5, 7.5])
+
+
+def test_stacked_interpolation():
+    bmi = Bmi(buffer_all=False)
+    bmi.subscribe("air__temperature", "soil__depth")
+    bmi.update_until(2.25)
+
+    assert_array_almost_equal(
+        bmi.interpolate("air__temperature", 2.25), [2.25, 4.5, 6.75]
+    )
+    assert_array_almost_equal(bmi.interpolate("soil__depth", 2.25), [2.25, 4.5])
+
+
+def test_unsubscribe():
+    bmi = Bmi(buffer_all=False)
+    bmi.subscribe("soil__depth")
+    bmi.subscribe("soil__depth")
+    bmi.unsubscribe("soil__depth")
+    assert bmi.subscriptions == ("soil__depth",)
+
+    bmi.unsubscribe("soil__depth")
+    assert bmi.subscriptions == ()
+
+    bmi.update_until(2.5)
+    assert not bmi.is_buffered("soil__depth")
+    assert bmi.n_get_value["soil__depth"] == 0
+
+
+def test_interpolation_method():
+    bmi = Bmi(method="previous", buffer_all=False)
+    bmi.subscribe("soil__depth")
+    bmi.update_until(2.5)
+
+    assert bmi.interpolate("soil__depth", 2.5) == approx([2.0, 4.0])
+
+
+def test_interpolated_values_are_copies():
+    bmi = Bmi()
+    bmi.update_until(2.5)
+
+    values = bmi.interpolate("soil__depth", 2.5)
+    values[:] = 0.0
+    assert_array_almost_equal(bmi.interpolate("soil__depth", 2.5), [2.5, 5.0])
+
+
+def test_unreadable_vars_are_ignored():
+    bmi = BrokenBmi()
+    with pytest.warns(UserWarning, match="soil__depth"):
+        bmi.update_until(2.5)
+
+    assert bmi.is_buffered("air__temperature")
+    assert not bmi.is_buffered("soil__depth")
+
+
+def test_value_at_unbuffered_var_warns(bmi):
+    with pytest.warns(UserWarning, match="not buffered"):
+        values = bmi.get_value("soil__depth", at=1.0)
+
+    assert_array_almost_equal(values, [0.0, 1.0, 2.0, 3.0])
+    assert bmi.subscriptions == ("soil__depth",)
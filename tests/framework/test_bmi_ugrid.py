@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.framework import bmi_ugrid
+from pymt.framework.bmi_ugrid import (
+    BmiGridDatasets,
+    dataset_from_bmi_grid,
+    implicit_variable,
+)
+
+
+class RasterBmi:
+    def __init__(self, shape=(3, 4)):
+        self._shape = shape
+        self.calls = 0
+
+    def get_grid_type(self, grid_id):
+        self.calls += 1
+        return "uniform_rectilinear"
+
+    def get_grid_ndim(self, grid_id):
+        return 2
+
+    def get_grid_shape(self, grid_id):
+        return np.array(self._shape)
+
+    def get_grid_spacing(self, grid_id):
+        return np.array([2.0, 1.0])
+
+    def get_grid_origin(self, grid_id):
+        return np.array([1.0, 0.0])
+
+
+def test_datasets_are_lazy():
+    bmi = RasterBmi()
+    grids = BmiGridDatasets(bmi, [0])
+
+    assert list(grids) == [0]
+    assert len(grids) == 1
+    assert bmi.calls == 0
+
+    grid = grids[0]
+    assert grids[0] is grid
+    assert bmi.calls == 1
+
+    with pytest.raises(KeyError):
+        grids[1]
+
+
+def test_raster_connectivity():
+    landlab = pytest.importorskip("landlab.graph")
+
+    grid = dataset_from_bmi_grid(RasterBmi(), 0)
+    graph = landlab.UniformRectilinearGraph(
+        (3, 4), spacing=(2.0, 1.0), origin=(1.0, 0.0)
+    )
+
+    assert_array_equal(
+        grid.face_node_connectivity.values, graph.nodes_at_patch.reshape(-1)
+    )
+    assert_array_equal(grid.face_node_offset.values, [4, 8, 12, 16, 20, 24])
+
+
+def test_raster_connectivity_is_implicit():
+    grid = dataset_from_bmi_grid(RasterBmi(shape=(1000, 2000)), 0)
+
+    assert grid.face_node_connectivity.size == 999 * 1999 * 4
+    assert_array_equal(
+        grid.face_node_connectivity[:8].values,
+        [2001, 2000, 0, 1, 2002, 2001, 1, 2],
+    )
+
+
+def test_raster_coordinates():
+    grid = dataset_from_bmi_grid(RasterBmi(), 0)
+
+    (y, x) = np.meshgrid([1.0, 3.0, 5.0], [0.0, 1.0, 2.0, 3.0], indexing="ij")
+    assert_array_equal(grid.node_x.values, x.reshape(-1))
+    assert_array_equal(grid.node_y.values, y.reshape(-1))
+    assert grid.node_x.attrs == {"standard_name": "x", "units": "m"}
+
+
+def test_raster_coordinates_are_implicit():
+    grid = dataset_from_bmi_grid(RasterBmi(shape=(100000, 100000)), 0)
+
+    assert grid.node_x.size == 100000 * 100000
+    assert_array_equal(grid.node_x[99999:100002].values, [99999.0, 0.0, 1.0])
+    assert_array_equal(grid.node_y[99999:100002].values, [1.0, 3.0, 3.0])
+    assert grid.face_node_connectivity.size == 99999 * 99999 * 4
+
+
+@pytest.mark.parametrize("lazy", (True, False))
+def test_implicit_variable(monkeypatch, lazy):
+    if not lazy:
+        monkeypatch.setattr(bmi_ugrid, "LazilyIndexedArray", None)
+
+    var = implicit_variable("node", 5, float, lambda index: index * 2.0)
+    assert var.dims == ("node",)
+    assert var.dtype == np.dtype(float)
+    assert_array_equal(var[1:4].values, [2.0, 4.0, 6.0])
+    assert_array_equal(var.values, [0.0, 2.0, 4.0, 6.0, 8.0])
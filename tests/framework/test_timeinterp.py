@@ -103,3 +103,62 @@ def test_interp_with_fill_value(method):
     )
     assert interp(4.5) == approx(-1.0)
     assert interp(-0.5) == approx(-1.0)
+
+
+def test_timeinterp_maxsize():
+    interp = TimeInterpolator(maxsize=3)
+    interp.add_data([(float(t), np.full(2, t, dtype=float)) for t in range(10)])
+
+    assert len(interp) == 3
+    assert interp.capacity == 3
+    assert interp.times == approx([7.0, 8.0, 9.0])
+    assert interp(8.5) == approx(np.full(2, 8.5))
+
+
+def test_timeinterp_unsorted_data():
+    interp = TimeInterpolator(((2.0, 3.0), (0.0, 1.0), (3.0, 4.0), (1.0, 2.0)))
+    assert interp.times == approx([0.0, 1.0, 2.0, 3.0])
+    assert interp(0.5) == approx(1.5)
+    assert interp(2.5) == approx(3.5)
+
+
+def test_timeinterp_unsorted_data_with_maxsize():
+    interp = TimeInterpolator(((2.0, 3.0), (3.0, 4.0), (4.0, 5.0)), maxsize=3)
+    interp.add_data(((1.0, 2.0),))
+    assert interp.times == approx([2.0, 3.0, 4.0])
+
+    interp.add_data(((2.5, 3.5),))
+    assert interp.times == approx([2.5, 3.0, 4.0])
+
+
+def test_timeinterp_grows():
+    interp = TimeInterpolator([(float(t), float(t)) for t in range(100)])
+    assert len(interp) == 100
+    assert interp.capacity >= 100
+    assert interp(42.25) == approx(42.25)
+
+
+@pytest.mark.parametrize(
+    "method,expected",
+    [("nearest", 2.0), ("previous", 2.0), ("zero", 2.0), ("next", 3.0)],
+)
+def test_interp_step_methods(method, expected):
+    interp = TimeInterpolator(((0.0, 1.0), (1.0, 2.0), (2.0, 3.0)), method=method)
+    assert interp(1.25) == approx(expected)
+
+
+@pytest.mark.parametrize("method", ["quadratic", "cubic"])
+def test_interp_polynomial(method):
+    interp = TimeInterpolator(
+        [(t, t**2) for t in (0.0, 1.0, 2.0, 3.0, 4.0)], method=method
+    )
+    assert interp(2.5) == approx(6.25)
+    assert interp(0.5) == approx(0.25)
+    assert interp(3.5) == approx(12.25)
+
+
+def test_interp_does_not_alias_buffer():
+    interp = TimeInterpolator(((0.0, np.zeros(2)), (1.0, np.ones(2))), method="next")
+    values = interp(0.5)
+    values[:] = 10.0
+    assert interp(0.5) == approx(np.ones(2))
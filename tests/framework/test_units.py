@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+from pytest import approx
+
+from pymt.framework.units import UnitConverter, get_converter
+
+
+def test_identity():
+    convert = get_converter("m", "m")
+    values = np.array([1.0, 2.0])
+
+    assert convert.is_identity
+    assert convert(values) is values
+
+
+def test_scale():
+    convert = get_converter("km", "m")
+    assert convert.scale == approx(1000.0)
+    assert convert.offset == approx(0.0)
+    assert convert(1.5) == approx(1500.0)
+
+
+def test_offset():
+    convert = get_converter("degC", "K")
+    assert convert.scale == approx(1.0)
+    assert convert.offset == approx(273.15)
+    assert_array_almost_equal(convert(np.array([0.0, 10.0])), [273.15, 283.15])
+
+
+def test_converter_is_cached():
+    assert get_converter("h", "min") is get_converter("h", "min")
+    assert get_converter("h", "min") is not get_converter("min", "h")
+
+
+def test_inplace():
+    values = np.array([1.0, 2.0])
+    converted = get_converter("h", "min")(values, inplace=True)
+
+    assert converted is values
+    assert_array_almost_equal(values, [60.0, 120.0])
+
+
+def test_inplace_int():
+    values = np.array([1, 2])
+    UnitConverter(scale=2.5)(values, inplace=True)
+    assert values.dtype == int
+    assert list(values) == [2, 5]
+
+
+def test_not_convertible():
+    with pytest.raises(ValueError):
+        get_converter("m", "h")
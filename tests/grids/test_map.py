@@ -0,0 +1,134 @@
+#! /usr/bin/env python
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.grids.map import (
+    RectilinearMap,
+    UniformRectilinearMap,
+    UnstructuredMap,
+    UnstructuredPointsMap,
+)
+
+
+def brute_force_locate(grid, x, y):
+    point_ids, cell_ids = [], []
+    for point_id in range(len(x)):
+        for cell_id in range(grid.get_cell_count()):
+            if grid.is_in_cell(x[point_id], y[point_id], cell_id):
+                point_ids.append(point_id)
+                cell_ids.append(cell_id)
+    return np.array(point_ids, dtype=int), np.array(cell_ids, dtype=int)
+
+
+def points_on_and_off_grid():
+    x = np.array([0.5, 1.0, 1.0, 0.0, 2.5, 3.0, -0.5, 1.5, 2.0, 0.25])
+    y = np.array([0.5, 1.0, 0.5, 0.0, 1.5, 3.5, 1.0, 2.0, 1.0, 2.75])
+    return x, y
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [
+        UniformRectilinearMap((4, 3), (1.0, 1.5), (0.0, 0.0)),
+        RectilinearMap([0.0, 1.0, 2.0, 3.0], [0.0, 1.0, 3.0]),
+    ],
+)
+def test_locate_in_rectilinear(grid):
+    x, y = points_on_and_off_grid()
+
+    point_ids, cell_ids = grid.locate_points(x, y)
+    expected_points, expected_cells = brute_force_locate(grid, x, y)
+
+    assert_array_equal(point_ids, expected_points)
+    assert_array_equal(cell_ids, expected_cells)
+
+
+def test_locate_in_triangles():
+    # (2) - (3)
+    #  |  \  |
+    # (0) - (1)
+    grid = UnstructuredMap(
+        [0.0, 0.0, 1.0, 1.0],
+        [0.0, 1.0, 0.0, 1.0],
+        connectivity=[0, 1, 2, 1, 3, 2],
+        offset=[3, 6],
+    )
+    x = np.array([0.25, 0.75, 0.25, 0.0, 2.0, 1.0])
+    y = np.array([0.25, 0.75, 0.75, 1.0, 0.0, 1.0])
+
+    point_ids, cell_ids = grid.locate_points(x, y)
+    expected_points, expected_cells = brute_force_locate(grid, x, y)
+
+    assert_array_equal(point_ids, expected_points)
+    assert_array_equal(cell_ids, expected_cells)
+
+
+def test_locate_in_non_convex_cell():
+    grid = UnstructuredMap(
+        [0.0, 2.0, 1.0, 2.0, 0.0],
+        [0.0, 0.0, 1.0, 2.0, 2.0],
+        connectivity=[0, 1, 2, 3, 4],
+        offset=[5],
+    )
+    x = np.array([0.5, 1.0, 1.0])
+    y = np.array([1.0, 1.5, 0.5])
+
+    assert_array_equal(grid.is_in_cells(x, y, [0, 0, 0]), [True, False, True])
+
+
+def test_is_in_cells_matches_is_in_cell():
+    grid = UnstructuredMap(
+        [0.0, 0.0, 1.0, 1.0],
+        [0.0, 1.0, 0.0, 1.0],
+        connectivity=[0, 1, 3, 2],
+        offset=[4],
+    )
+    x, y = np.meshgrid(np.linspace(-0.5, 1.5, 9), np.linspace(-0.5, 1.5, 9))
+    x, y = x.flatten(), y.flatten()
+
+    is_in = grid.is_in_cells(x, y, np.zeros(len(x), dtype=int))
+
+    assert_array_equal(is_in, [grid.is_in_cell(*xy, cell_id=0) for xy in zip(x, y)])
+
+
+def test_is_in_cell_with_mixed_cells():
+    # (2) - (3)
+    #  |     |  \
+    # (0) - (1) - (4)
+    grid = UnstructuredMap(
+        [0.0, 0.0, 1.0, 1.0, 0.0],
+        [0.0, 1.0, 0.0, 1.0, 2.0],
+        connectivity=[0, 1, 3, 2, 1, 4, 3],
+        offset=[4, 7],
+    )
+
+    assert grid.is_in_cell(0.5, 0.5, 0)
+    assert not grid.is_in_cell(1.25, 0.25, 0)
+    assert grid.is_in_cell(1.25, 0.25, 1)
+    assert not grid.is_in_cell(0.5, 0.5, 1)
+
+
+def test_locate_in_points():
+    grid = UnstructuredPointsMap([0.0, 1.0], [0.0, 1.0])
+    point_ids, cell_ids = grid.locate_points([0.0], [0.0])
+    assert len(point_ids) == 0
+    assert len(cell_ids) == 0
+
+
+def test_shared_cells():
+    grid = UnstructuredMap(
+        [0.0, 0.0, 1.0, 1.0, 2.0],
+        [0.0, 1.0, 0.0, 1.0, 0.0],
+        connectivity=[0, 1, 2, 1, 3, 2, 3, 4, 2],
+        offset=[3, 6, 9],
+    )
+    shared = [grid.get_shared_cells(point_id) for point_id in range(5)]
+
+    for point_id, cells in enumerate(shared):
+        expected = [
+            cell_id
+            for cell_id in range(grid.get_cell_count())
+            if point_id in grid.get_connectivity()[3 * cell_id : 3 * cell_id + 3]
+        ]
+        assert_array_equal(cells, expected)
@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+import os
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from pymt.grids.map import RectilinearMap as Rectilinear
+from pymt.grids.map import UniformRectilinearMap as UniformRectilinear
+from pymt.grids.map import UnstructuredPointsMap as UnstructuredPoints
+from pymt.mappers import NearestVal, PointToCell
+from pymt.mappers.cache import CACHE_DIR_ENV, mapping_key
+
+
+def test_mapping_key():
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+
+    key = mapping_key("PointToPoint", dst, src)
+    assert key == mapping_key("PointToPoint", dst, Rectilinear([0, 1, 2], [0, 2]))
+    assert key != mapping_key("PointToPoint", src, dst)
+    assert key != mapping_key("PointToCell", dst, src)
+
+
+def test_cache_is_written_and_read(tmpdir, monkeypatch):
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+
+    mapper = NearestVal()
+    mapper.initialize(dst, src, cache_dir=str(tmpdir))
+    expected = mapper.run(src_vals)
+
+    assert os.listdir(str(tmpdir)) == [mapping_key(mapper.name, dst, src) + ".npz"]
+
+    def _build_operator(*args, **kwds):
+        raise AssertionError("mapping was not read from the cache")
+
+    cached = NearestVal()
+    monkeypatch.setattr(cached, "_build_operator", _build_operator)
+    cached.initialize(dst, src, cache_dir=str(tmpdir))
+
+    assert_array_equal(cached.run(src_vals), expected)
+
+
+def test_cache_dir_from_environ(tmpdir, monkeypatch):
+    (src_x, src_y) = (
+        np.array([0.45, 1.25, 3.5, 0.0, 1.0]),
+        np.array([0.75, 2.25, 3.25, 0.9, 1.1]),
+    )
+    src = UnstructuredPoints(src_x, src_y)
+    dst = UniformRectilinear((2, 4), (2, 1), (0, 0))
+
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmpdir.join("mappers")))
+
+    for _ in range(2):
+        mapper = PointToCell()
+        mapper.initialize(dst, src)
+        assert_array_equal(mapper.run(np.arange(5.0), bad_val=-999), [1.5, 4.0, 1.0])
+
+    assert len(tmpdir.join("mappers").listdir()) == 1
+
+
+def test_no_cache_dir(tmpdir, monkeypatch):
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    with tmpdir.as_cwd():
+        NearestVal().initialize(dst, src)
+        assert tmpdir.listdir() == []
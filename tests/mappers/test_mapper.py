@@ -1,6 +1,7 @@
 #! /usr/bin/env python
 
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 from pymt.grids.map import UniformRectilinearMap as UniformRectilinear
@@ -44,6 +45,41 @@ def test_cell_to_point():
     assert_array_equal(dst_vals, [100.0, 2.0, -999.0])
 
 
+def test_cell_to_point_nan():
+    (dst_x, dst_y) = (np.array([0.45, 1.25, 3.5]), np.array([0.75, 2.25, 3.25]))
+
+    src = UniformRectilinear((2, 4), (2, 1), (0, 0))
+    dst = UnstructuredPoints(dst_x, dst_y)
+
+    mapper = CellToPoint()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(src.get_cell_count(), dtype=float)
+    src_vals[0] = np.nan
+    dst_vals = mapper.run(src_vals, dst_vals=np.zeros(dst.get_point_count()) + 100)
+
+    # As before, values below bad_val are bad but NaN values are passed on.
+    assert_array_equal(dst_vals, [np.nan, 2.0, -999.0])
+
+
+def test_cell_to_point_many():
+    (dst_x, dst_y) = (np.array([0.45, 1.25, 3.5]), np.array([0.75, 2.25, 3.25]))
+
+    src = UniformRectilinear((2, 4), (2, 1), (0, 0))
+    dst = UnstructuredPoints(dst_x, dst_y)
+
+    mapper = CellToPoint()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(2 * src.get_cell_count(), dtype=float).reshape((2, -1))
+    dst_vals = mapper.run(src_vals, bad_val=-999)
+
+    assert dst_vals.shape == (2, dst.get_point_count())
+    assert_array_equal(dst_vals, [[0.0, 2.0, -999.0], [3.0, 5.0, -999.0]])
+    assert_array_equal(dst_vals[0], mapper.run(src_vals[0], bad_val=-999))
+    assert_array_equal(dst_vals[1], mapper.run(src_vals[1], bad_val=-999))
+
+
 def test_point_to_cell():
     (src_x, src_y) = (
         np.array([0.45, 1.25, 3.5, 0.0, 1.0]),
@@ -100,3 +136,80 @@ def test_point_to_cell_big():
     dst_vals = np.zeros(dst.get_cell_count(), dtype=np.float) - 1
     mapper.run(src_vals, dst_vals=dst_vals)
     assert_array_equal(dst_vals, src_vals)
+
+
+@pytest.mark.parametrize(
+    "method,expected",
+    [
+        (np.min, [0.0, 4.0, 1.0]),
+        ("min", [0.0, 4.0, 1.0]),
+        (np.max, [3.0, 4.0, 1.0]),
+        ("max", [3.0, 4.0, 1.0]),
+        ("count", [2.0, 1.0, 1.0]),
+        (len, [2.0, 1.0, 1.0]),
+        (np.median, [1.5, 4.0, 1.0]),
+        (lambda x: x[0] - x[-1], [-3.0, 0.0, 0.0]),
+    ],
+)
+def test_point_to_cell_reductions(method, expected):
+    (src_x, src_y) = (
+        np.array([0.45, 1.25, 3.5, 0.0, 1.0]),
+        np.array([0.75, 2.25, 3.25, 0.9, 1.1]),
+    )
+
+    src = UnstructuredPoints(src_x, src_y)
+    dst = UniformRectilinear((2, 4), (2, 1), (0, 0))
+
+    mapper = PointToCell()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    assert_array_equal(mapper.run(src_vals, method=method), expected)
+
+    src_vals[3] = -9999
+    assert_array_equal(
+        mapper.run(src_vals, method=method), [-999.0] + list(expected[1:])
+    )
+
+
+@pytest.mark.parametrize(
+    "method", [np.mean, np.sum, np.min, np.max, "count", np.median]
+)
+def test_point_to_cell_nan(method):
+    (src_x, src_y) = (
+        np.array([0.45, 1.25, 3.5, 0.0, 1.0]),
+        np.array([0.75, 2.25, 3.25, 0.9, 1.1]),
+    )
+
+    src = UnstructuredPoints(src_x, src_y)
+    dst = UniformRectilinear((2, 4), (2, 1), (0, 0))
+
+    mapper = PointToCell()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    expected = mapper.run(src_vals, method=method)
+
+    src_vals[3] = np.nan
+    assert_array_equal(
+        mapper.run(src_vals, method=method), [-999.0] + list(expected[1:])
+    )
+
+
+@pytest.mark.parametrize("method", [np.mean, np.sum, np.max, np.median])
+def test_point_to_cell_many(method):
+    (m, n) = (20, 40)
+    (src_x, src_y) = np.meshgrid(np.arange(m) * 0.5, np.arange(n) * 0.5)
+    src = UnstructuredPoints(src_y, src_x)
+    dst = UniformRectilinear((n // 2 + 1, m // 2 + 1), (1, 1), (-0.25, -0.25))
+
+    mapper = PointToCell()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(2 * src.get_point_count(), dtype=float).reshape((2, -1))
+    src_vals[1, 5] = -999
+    dst_vals = mapper.run(src_vals, method=method)
+
+    assert dst_vals.shape == (2, dst.get_cell_count())
+    assert_array_equal(dst_vals[0], mapper.run(src_vals[0], method=method))
+    assert_array_equal(dst_vals[1], mapper.run(src_vals[1], method=method))
@@ -36,6 +36,21 @@ def test_some_bad():
     assert_array_almost_equal(dst_vals, np.array([0.0, 1.0, -1.0, 3.0, 4.0, 5.0]))
 
 
+def test_nan_is_bad():
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+
+    mapper = NearestVal()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    src_vals[2] = np.nan
+    dst_vals = np.zeros(dst.get_point_count()) - 1
+    mapper.run(src_vals, dst_vals=dst_vals)
+
+    assert_array_almost_equal(dst_vals, np.array([0.0, 1.0, -1.0, 3.0, 4.0, 5.0]))
+
+
 def test_no_destination():
     src = Rectilinear([0, 1, 2], [0, 2])
     dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
@@ -0,0 +1,87 @@
+#! /usr/bin/env python
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.grids.map import RectilinearMap as Rectilinear
+from pymt.grids.map import UniformRectilinearMap as UniformRectilinear
+from pymt.grids.map import UnstructuredPointsMap as UnstructuredPoints
+from pymt.mappers import NearestVal, PointToCell, SparseGridMapper
+from pymt.mappers.sparse import as_sparse_operator
+
+
+def test_operator_shape():
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+
+    mapper = NearestVal()
+    mapper.initialize(dst, src)
+
+    assert mapper.operator.shape == (dst.get_point_count(), src.get_point_count())
+    assert mapper.dst_count == dst.get_point_count()
+    assert mapper.src_count == src.get_point_count()
+    assert not np.any(mapper.unmapped)
+
+
+def test_run_many():
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+
+    mapper = NearestVal()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(12.0).reshape((2, 6))
+    src_vals[1, 2] = -999
+    dst_vals = np.full((2, 6), -1.0)
+    mapper.run(src_vals, dst_vals=dst_vals)
+
+    assert_array_equal(dst_vals[0], mapper.run(src_vals[0]))
+    assert_array_equal(dst_vals[1], [6.0, 7.0, -1.0, 9.0, 10.0, 11.0])
+
+
+def test_size_mismatch():
+    mapper = SparseGridMapper.from_operator(as_sparse_operator([0, 1], [0, 1], (2, 2)))
+    with pytest.raises(ValueError):
+        mapper.run(np.arange(3.0))
+    with pytest.raises(ValueError):
+        mapper.run(np.arange(2.0), dst_vals=np.zeros(3))
+
+
+def test_unmapped_values_unchanged():
+    mapper = SparseGridMapper.from_operator(as_sparse_operator([0], [1], (2, 2)))
+    dst_vals = mapper.run(np.array([1.0, 2.0]), dst_vals=np.full(2, -1.0))
+    assert_array_equal(dst_vals, [2.0, -1.0])
+    assert_array_equal(mapper.unmapped, [False, True])
+
+
+def test_transpose():
+    mapper = SparseGridMapper.from_operator(
+        as_sparse_operator([0, 0, 1], [0, 1, 2], (2, 3))
+    )
+    reverse = mapper.transpose()
+
+    assert reverse.operator.shape == (3, 2)
+    assert_array_equal(reverse.run(np.array([1.0, 2.0])), [1.0, 1.0, 2.0])
+
+
+def test_compose():
+    src_x, src_y = (
+        np.array([0.45, 1.25, 3.5, 0.0, 1.0]),
+        np.array([0.75, 2.25, 3.25, 0.9, 1.1]),
+    )
+    src = UnstructuredPoints(src_x, src_y)
+    dst = UniformRectilinear((2, 4), (2, 1), (0, 0))
+
+    to_cells = PointToCell()
+    to_cells.initialize(dst, src)
+
+    double = SparseGridMapper.from_operator(
+        as_sparse_operator(np.arange(3), np.arange(3), (3, 3), weights=2.0)
+    )
+    mapper = double.compose(to_cells)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    assert_array_equal(mapper.run(src_vals), [3.0, 8.0, 2.0])
+
+    with pytest.raises(ValueError):
+        to_cells.compose(double)
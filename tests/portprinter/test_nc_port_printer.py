@@ -1,8 +1,12 @@
 import os
 
+import netCDF4 as nc
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
 from six.moves import xrange
 
-from pymt.portprinter.port_printer import NcPortPrinter
+from pymt.portprinter.port_printer import NcPortPrinter, PortPrinter
 from pymt.testing.ports import UniformRectilinearGridPort
 
 
@@ -46,3 +50,94 @@ def test_time_series(tmpdir):
         printer.close()
 
         assert os.path.isfile("sea_floor_surface_sediment__mean_of_grain_size.nc")
+
+
+def test_time_series_values(tmpdir):
+    port = UniformRectilinearGridPort()
+    with tmpdir.as_cwd():
+        printer = NcPortPrinter(port, "sea_surface__temperature")
+        printer.open()
+        for step in xrange(3):
+            port._values["sea_surface__temperature"][:] = step
+            printer.write()
+        printer.close()
+
+        with nc.Dataset("sea_surface__temperature.nc") as root:
+            assert_array_equal(root.variables["time"][:], [0.0, 1.0, 2.0])
+            assert_array_equal(
+                root.variables["sea_surface__temperature"][:],
+                np.broadcast_to(np.arange(3.0).reshape((3, 1, 1)), (3, 4, 5)),
+            )
+
+
+def test_mesh_size_changes(tmpdir):
+    port = UniformRectilinearGridPort()
+    with tmpdir.as_cwd():
+        printer = NcPortPrinter(port, "sea_surface__temperature")
+        printer.open()
+        printer.write()
+        printer.write()
+
+        port._shape = (2, 5)
+        port._values["sea_surface__temperature"] = np.zeros(port._shape)
+        printer.write()
+        printer.close()
+
+        assert os.path.isfile("sea_surface__temperature.nc")
+        assert os.path.isfile("sea_surface__temperature_0000.nc")
+
+
+def test_buffer_steps(tmpdir):
+    port = UniformRectilinearGridPort()
+    with tmpdir.as_cwd():
+        printer = PortPrinter.from_dict(
+            {
+                "port": port,
+                "name": "sea_surface__temperature",
+                "format": "nc",
+                "buffer_steps": 2,
+            }
+        )
+        printer.open()
+        for step in xrange(3):
+            port._values["sea_surface__temperature"][:] = step
+            printer.write()
+
+        port._shape = (2, 5)
+        port._values["sea_surface__temperature"] = np.full(port._shape, 3.0)
+        printer.write()
+        printer.close()
+
+        with nc.Dataset("sea_surface__temperature.nc") as root:
+            assert_array_equal(root.variables["time"][:], [0.0, 1.0, 2.0])
+            assert_array_equal(
+                root.variables["sea_surface__temperature"][:],
+                np.broadcast_to(np.arange(3.0).reshape((3, 1, 1)), (3, 4, 5)),
+            )
+        with nc.Dataset("sea_surface__temperature_0000.nc") as root:
+            assert_array_equal(root.variables["sea_surface__temperature"][:], 3.0)
+
+
+def test_compression_options(tmpdir):
+    port = UniformRectilinearGridPort()
+    with tmpdir.as_cwd():
+        printer = PortPrinter.from_dict(
+            {
+                "port": port,
+                "name": "sea_surface__temperature",
+                "format": "nc",
+                "zlib": True,
+                "chunksizes": [1, 4, 5],
+            }
+        )
+        printer.open()
+        printer.write()
+        printer.close()
+
+        with nc.Dataset("sea_surface__temperature.nc") as root:
+            variable = root.variables["sea_surface__temperature"]
+            assert variable.filters()["zlib"]
+            assert variable.chunking() == [1, 4, 5]
+
+        with pytest.raises(TypeError):
+            NcPortPrinter(port, "sea_surface__temperature", compression="gzip")
@@ -2,6 +2,7 @@
 import os
 
 import numpy as np
+from numpy.testing import assert_array_equal
 from pytest import approx
 
 from pymt.grids import RasterField
@@ -127,3 +128,105 @@ def test_2d_changing_shape(tmpdir):
             assert root.variables["Temperature"].units == "-"
 
             root.close()
+
+
+def test_mesh_is_written_once(tmpdir, monkeypatch):
+    from pymt.printers.nc.ugrid import NetcdfField
+
+    calls = []
+    set_mesh_topology = NetcdfField._set_mesh_topology
+
+    def counting_set_mesh_topology(self):
+        calls.append(self._path)
+        set_mesh_topology(self)
+
+    monkeypatch.setattr(NetcdfField, "_set_mesh_topology", counting_set_mesh_topology)
+
+    data = np.arange(6.0)
+    field = RasterField((2, 3), (1.0, 1.0), (0.0, 0.0), indexing="ij")
+    field.add_field("Elevation", data, centering="point")
+
+    with tmpdir.as_cwd():
+        db = Database()
+        db.open("elevation.nc", "Elevation")
+        for _ in range(3):
+            db.write(field)
+            data += 1.0
+        db.close()
+
+        assert len(calls) == 1
+
+        root = open_nc_file("elevation.nc")
+        assert_array_equal(root.variables["time"][:], [0.0, 1.0, 2.0])
+        assert_array_equal(
+            root.variables["Elevation"][:],
+            np.arange(6.0).reshape(2, 3) + np.arange(3.0).reshape(3, 1, 1),
+        )
+        assert root.variables["time"].units == "days since 00:00:00 UTC"
+        root.close()
+
+
+def test_streaming_buffer_steps(tmpdir, monkeypatch):
+    from pymt.printers.nc.database import StreamingDatabase
+    from pymt.printers.nc.ugrid import NetcdfField
+
+    blocks = []
+    append_block = NetcdfField.append_block
+
+    def counting_append_block(self, values, times=None):
+        blocks.append(list(times))
+        append_block(self, values, times=times)
+
+    monkeypatch.setattr(NetcdfField, "append_block", counting_append_block)
+
+    data = np.arange(6.0)
+    field = RasterField((2, 3), (1.0, 1.0), (0.0, 0.0), indexing="ij")
+    field.add_field("Elevation", data, centering="point")
+
+    with tmpdir.as_cwd():
+        db = StreamingDatabase(buffer_steps=3)
+        db.open("elevation.nc", "Elevation")
+        for time in range(6):
+            db.write(field, time=time * 10.0)
+            data += 1.0
+        db.close()
+
+        assert blocks == [[10.0, 20.0, 30.0], [40.0, 50.0]]
+
+        root = open_nc_file("elevation.nc")
+        assert_array_equal(
+            root.variables["time"][:], [0.0, 10.0, 20.0, 30.0, 40.0, 50.0]
+        )
+        assert_array_equal(
+            root.variables["Elevation"][:],
+            np.arange(6.0).reshape(2, 3) + np.arange(6.0).reshape(6, 1, 1),
+        )
+        root.close()
+
+
+def test_streaming_encoding(tmpdir):
+    from pymt.printers.nc.database import StreamingDatabase
+
+    data = np.arange(6.0)
+    field = RasterField((2, 3), (1.0, 1.0), (0.0, 0.0), indexing="ij")
+    field.add_field("Elevation", data, centering="point")
+
+    with tmpdir.as_cwd():
+        db = StreamingDatabase(
+            zlib=True, complevel=6, chunksizes=(4, 2, 8), least_significant_digit=1
+        )
+        db.open("elevation.nc", "Elevation")
+        for _ in range(3):
+            db.write(field)
+            data += 0.01
+        db.close()
+
+        root = open_nc_file("elevation.nc")
+        elevation = root.variables["Elevation"]
+        assert elevation.filters()["zlib"]
+        assert elevation.filters()["complevel"] == 6
+        assert elevation.chunking() == [4, 2, 3]
+        assert elevation.least_significant_digit == 1
+        assert root.variables["time"].chunking() == [4]
+        assert np.allclose(elevation[2], np.arange(6.0).reshape((2, 3)), atol=0.1)
+        root.close()
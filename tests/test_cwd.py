@@ -0,0 +1,116 @@
+import os
+import threading
+
+from pymt.utils.cwd import cd, getcwd, working_dir
+
+
+def test_cd_changes_back(tmpdir):
+    with tmpdir.as_cwd():
+        os.mkdir("a")
+        with cd("a") as path:
+            assert os.getcwd() == str(tmpdir.join("a"))
+            assert getcwd() == path
+        assert os.getcwd() == str(tmpdir)
+
+
+def test_cd_create(tmpdir):
+    with tmpdir.as_cwd():
+        with cd("a/b", create=True):
+            assert os.getcwd() == str(tmpdir.join("a", "b"))
+        assert os.getcwd() == str(tmpdir)
+
+
+def test_working_dir_does_not_chdir(tmpdir):
+    with tmpdir.as_cwd():
+        with working_dir("a"):
+            assert getcwd() == str(tmpdir.join("a"))
+            assert os.getcwd() == str(tmpdir)
+            with working_dir("b"):
+                assert getcwd() == str(tmpdir.join("a", "b"))
+        assert getcwd() == str(tmpdir)
+
+
+def test_cd_from_threads(tmpdir):
+    wrong = []
+
+    def run_in(path):
+        for _ in range(200):
+            with cd(path):
+                if os.getcwd() != path:
+                    wrong.append(path)
+
+    with tmpdir.as_cwd():
+        paths = [str(tmpdir.mkdir(name)) for name in ("a", "b", "c")]
+        threads = [threading.Thread(target=run_in, args=(path,)) for path in paths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert wrong == []
+        assert os.getcwd() == str(tmpdir)
+
+
+def test_cd_is_shared_by_threads_in_the_same_dir(tmpdir):
+    barrier = threading.Barrier(2)
+    wrong = []
+
+    def run_in(path):
+        with cd(path):
+            barrier.wait(timeout=5.0)
+            if os.getcwd() != path:
+                wrong.append(path)
+
+    with tmpdir.as_cwd():
+        path = str(tmpdir.mkdir("a"))
+        threads = [threading.Thread(target=run_in, args=(path,)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert wrong == []
+        assert not barrier.broken
+        assert os.getcwd() == str(tmpdir)
+
+
+def test_cd_nested(tmpdir):
+    with tmpdir.as_cwd():
+        tmpdir.mkdir("a").mkdir("b")
+        with cd("a"):
+            with cd(".") as path:
+                assert os.getcwd() == path
+            with cd("b") as path:
+                assert os.getcwd() == str(tmpdir.join("a", "b"))
+            assert os.getcwd() == str(tmpdir.join("a"))
+        assert os.getcwd() == str(tmpdir)
+
+
+def test_cd_nested_from_a_shared_dir(tmpdir):
+    barrier = threading.Barrier(2)
+    wrong = []
+
+    def run_in(shared, path):
+        with cd(shared):
+            barrier.wait(timeout=5.0)
+            with cd(path):
+                if os.getcwd() != path:
+                    wrong.append(path)
+            if os.getcwd() != shared:
+                wrong.append(shared)
+
+    with tmpdir.as_cwd():
+        shared = str(tmpdir.mkdir("shared"))
+        paths = [str(tmpdir.mkdir(name)) for name in ("a", "b")]
+        threads = [
+            threading.Thread(target=run_in, args=(shared, path), daemon=True)
+            for path in paths
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert wrong == []
+        assert os.getcwd() == str(tmpdir)
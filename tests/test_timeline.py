@@ -114,3 +114,15 @@ def test_repeated_events():
     assert first_event is timeline.pop()
     assert second_event is timeline.pop()
     assert first_event is timeline.pop()
+
+
+def test_many_events_are_first_in_first_out():
+    events = ["event {0}".format(n) for n in range(100)]
+    timeline = Timeline([(event, 1.0) for event in events])
+    timeline.add_recurring_event("fast-event", 0.5)
+
+    assert timeline.pop_until(2.0) == (
+        ["fast-event"] + events + ["fast-event", "fast-event"] + events + ["fast-event"]
+    )
+    assert timeline.time_of_next_event == 2.5
+    assert timeline.next_event == "fast-event"